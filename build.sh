@@ -85,8 +85,14 @@ function givehelp {
     echo "dbinittest    : clean the test db in Mongo"
     echo "dbroot        : restore the root permissions: only the one user in base.yaml"
     echo "dbroottest    :     idem, but on test database"
-    echo "dbwf          : (re)initialize the workflow table"
+    echo "dbindex       : create missing indexes, report missing and unused indexes"
+    echo "dbindex check :     idem, but only report, do not create"
+    echo "dbindextest   :     idem, but on test database"
+    echo "dbwf          : (re)initialize the workflow and overview tables"
     echo "dbwftest      :     idem, but on test database"
+    echo "dbwfaudit     : check the workflow and overview tables, report faulty records"
+    echo "dbwfaudit r   :     idem, and repair them"
+    echo "dbwfaudittest :     idem, but on test database"
     echo "guni          : start serving with gunicorn"
     echo "gunitest      :     idem, but now with the test database"
     echo "mongostart    : start mongo db daemon"
@@ -255,6 +261,7 @@ function bulk {
         sudo systemctl stop dariah-contrib.service
     fi
     python3 bulk.py "$DB_DEST" "$action" "$BULK"
+    dbworkflowrecompute "$DB_DEST" "$BULK/workflow.txt"
     if [[ "$ON_DANS" == "1" ]]; then
         sudo systemctl start dariah-contrib.service
     fi
@@ -405,12 +412,41 @@ function dbtestinit {
     fi
 }
 
+function dbindexinit {
+    cd $root/server
+    mongostart
+    python3 indexes.py "$MODE" "$@"
+}
+
 function dbworkflowinit {
     cd $root/server
     mongostart
     python3 workflow.py "$MODE" "$1"
 }
 
+function dbworkflowaudit {
+    # low priority, so that it does not compete with the webserver
+    cd $root/server
+    mongostart
+    task="audit"
+    if [[ "$2" == "r" ]]; then
+        task="repair"
+    fi
+    nice -n 19 python3 workflow.py "$MODE" "$1" "$task"
+}
+
+function dbworkflowrecompute {
+    # recompute the workflow of the contributions listed in file $2 in database $1
+    cd $root/server
+    if [[ "$1" == "$DB_TEST" ]]; then
+        python3 workflow.py "$MODE" "test" "$2"
+    elif [[ "$1" == "$DB_DEV" ]]; then
+        python3 workflow.py "development" "" "$2"
+    else
+        python3 workflow.py "production" "" "$2"
+    fi
+}
+
 function docsapiall {
     cd $root/server
     pdoc3 --force --html --output-dir "../$apidocbase" control
@@ -686,6 +722,22 @@ function dbinittest {
     dbtestinit "$@"
 }
 
+function dbindex {
+    if [[ "$1" == "check" ]]; then
+        dbindexinit "" "--check"
+    else
+        dbindexinit
+    fi
+}
+
+function dbindextest {
+    if [[ "$1" == "check" ]]; then
+        dbindexinit "test" "--check"
+    else
+        dbindexinit "test"
+    fi
+}
+
 function dbwf {
     dbworkflowinit
 }
@@ -694,6 +746,14 @@ function dbwftest {
     dbworkflowinit "test"
 }
 
+function dbwfaudit {
+    dbworkflowaudit "" "$@"
+}
+
+function dbwfaudittest {
+    dbworkflowaudit "test" "$@"
+}
+
 function docs {
     stats
     docsapiall
@@ -816,7 +876,7 @@ case "$1" in
         if [[ "$ON_DANS" == "0" ]]; then
             mayrun="0"
         fi;;
-    bulk|cleandup|consolidate|cull|databu|datarest|dbinittest|dbroot|dbroottest|dbwf|dbwftest|mongostart|mongostop|guni|gunitest|reshape|test|testc|values)
+    bulk|cleandup|consolidate|cull|databu|datarest|dbinittest|dbindex|dbindextest|dbroot|dbroottest|dbwf|dbwfaudit|dbwfaudittest|dbwftest|mongostart|mongostop|guni|gunitest|reshape|test|testc|values)
         mayrun="1";;
     *)
         mayrun="-1";;
@@ -35,6 +35,7 @@ DID_REP = "imported" if ACTION == "i" else "deleted"
 sep = "/" if BASE_DIR else ""
 TODO_DIR = f"{BASE_DIR}{sep}todo"
 DONE_DIR = f"{BASE_DIR}{sep}done"
+WORKFLOW_FILE = f"{BASE_DIR}{sep}workflow.txt"
 
 EXT = ".xlsx"
 
@@ -107,6 +108,13 @@ NUMBER = set(
 """.strip().split()
 )
 
+DETAIL_TABLES = set(
+    """
+    assessment
+    review
+""".strip().split()
+)
+
 VALUE_TABLES = set(
     """
     country
@@ -127,6 +135,7 @@ MC = MongoClient()
 DB = MC[DATABASE]
 
 VALUES = {}
+CONTRIB_IDS = []
 CREATOR_ID = None
 CREATOR_NAME = "HaSProject"
 
@@ -193,11 +202,20 @@ def refreshValueTable(table):
     VALUES[table] = items
 
 
+def writeContribIds():
+    with open(WORKFLOW_FILE, "w") as fh:
+        for contribId in CONTRIB_IDS:
+            fh.write(f"{contribId}\n")
+    info(f"{len(CONTRIB_IDS):>4} contributions need new workflow, see {WORKFLOW_FILE}")
+
+
 def recollectTables():
     justNow = dt.utcnow()
     for table in ALLOW_NEW:
         DB.collect.update_one(
-            {"table": table}, {"$set": {"dateCollected": justNow}}, upsert=True
+            {"table": table},
+            {"$set": {"dateCollected": justNow, "deltaFrom": justNow, "changes": []}},
+            upsert=True,
         )
 
 
@@ -493,7 +511,9 @@ def doSheet(fileName):
 
         justNow = dt.utcnow()
         DB.collect.update_one(
-            {"table": "user"}, {"$set": {"dateCollected": justNow}}, upsert=True
+            {"table": "user"},
+            {"$set": {"dateCollected": justNow, "deltaFrom": justNow, "changes": []}},
+            upsert=True,
         )
         refreshValueTable("user")
 
@@ -502,6 +522,7 @@ def doSheet(fileName):
     notexist = 0
     err = 0
     mod = 0
+    det = 0
     n = len(contribs)
 
     for contrib in contribs:
@@ -538,7 +559,8 @@ def doSheet(fileName):
                 info(f"\t0 {contrib['title']} {costRep}")
                 exist += 1
             else:
-                DB.contrib.insert_one(contrib)
+                status = DB.contrib.insert_one(contrib)
+                CONTRIB_IDS.append(status.inserted_id)
                 result += 1
                 info(f"\t+ {contrib['title']} {costRep}")
         elif ACTION == "x":
@@ -548,10 +570,18 @@ def doSheet(fileName):
                 print(contrib)
             for cand in candidates:
                 isPristine = cand.get("isPristine", False)
-                if isPristine:
+                hasDetails = any(
+                    DB[table].find_one({"contrib": cand["_id"]}, {"_id": True})
+                    for table in DETAIL_TABLES
+                )
+                if hasDetails:
+                    info(f"\t! {cand['title']}")
+                    det += 1
+                elif isPristine:
                     status = DB.contrib.delete_one({"_id": cand["_id"]})
                     raw = status.raw_result
                     if raw.get("ok", False):
+                        CONTRIB_IDS.append(cand["_id"])
                         result += raw.get("n", 0)
                         info(f"\t- {cand['title']}")
                     else:
@@ -570,6 +600,8 @@ def doSheet(fileName):
             info(f"{notexist:>4} could not be found")
         if mod:
             info(f"{mod:>4} skipped because the record was modified")
+        if det:
+            info(f"{det:>4} skipped because the record has assessments or reviews")
         if err:
             info(f"{err:>4} could not be deleted")
 
@@ -610,3 +642,4 @@ for inFile in files:
             )
 
 recollectTables()
+writeContribIds()
@@ -103,7 +103,9 @@ def applyClean(updates):
     success = 0
 
     for (cId, changes) in updates.items():
-        status = DB.contrib.update_one({"_id": cId}, {"$set": changes})
+        status = DB.contrib.update_one(
+            {"_id": cId}, {"$set": changes, "$inc": {"version": 1}}
+        )
         raw = status.raw_result
         n = raw.get("n", 0) if raw.get("ok", False) else 0
         if n:
@@ -230,7 +230,7 @@ class Api:
             context = self.context
             tableObj = Table(context, N.contrib)
 
-        for record in db.bulkContribWorkflow(None, False):
+        for record in db.bulkContribWorkflow({}):
             title = G(record, N.title)
             contribId = G(record, N._id)
 
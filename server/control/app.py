@@ -12,6 +12,7 @@ from flask import (
     redirect,
     abort,
     flash,
+    make_response,
 )
 
 from config import Config as C, Names as N
@@ -36,9 +37,11 @@ from control.workflow.apply import execute
 from control.perm import checkTable
 from control.auth import Auth
 from control.context import Context
+from control.typ.types import Types
 from control.sidebar import Sidebar
 from control.topbar import Topbar
 from control.overview import Overview
+from control.overviewcache import OverviewCache
 from control.api import Api
 from control.cust.factory_table import make as mkTable
 
@@ -97,6 +100,8 @@ NO_RECORD = MESSAGES[N.noRecord]
 NO_FIELD = MESSAGES[N.noField]
 NO_ACTION = MESSAGES[N.noAction]
 
+METRICS_HEADERS = {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
 
 def redirectResult(url, good):
     """Redirect.
@@ -278,17 +283,25 @@ def appFactory(regime, test, debug, **kwargs):
     DB = Db(regime, test=test)
     """*object* The `control.db.Db` singleton."""
 
+    DB.provisionIndexes(full=False)
+
     WF = Workflow(DB)
     """*object* The `control.workflow.compute.Workflow` singleton."""
 
-    WF.initWorkflow(drop=True)
+    WF.syncWorkflow()
 
     auth = Auth(DB, regime)
 
+    TYPES = Types()
+    """*object* The `control.typ.types.Types` singleton."""
+
+    OVERVIEW_CACHE = OverviewCache()
+    """*object* The `control.overviewcache.OverviewCache` singleton."""
+
     DB.mongoClose()
 
     def getContext():
-        return Context(DB, WF, auth)
+        return Context(DB, WF, auth, TYPES)
 
     def tablePerm(table, action=None):
         return checkTable(auth, table) and (action is None or auth.authenticated())
@@ -297,11 +310,41 @@ def appFactory(regime, test, debug, **kwargs):
         CT.showReferences()
         N.showNames()
 
+    @app.before_request
+    def startQueryLog():
+        DB.queryLog.start()
+
+    @app.after_request
+    def stopQueryLog(response):
+        queryLog = DB.queryLog
+        queryLog.stop()
+        if auth.isDevel:
+            response.headers.extend(queryLog.headers())
+            for ((label, table, command), n) in queryLog.repeats().items():
+                serverprint(
+                    f"""MONGO N+1: {request.path}: <<{label}>>.{table}.{command}"""
+                    f""" for {n} separate ids"""
+                )
+        return response
+
     @app.route("""/whoami""")
     def serveWhoami():
         checkBounds()
         return G(auth.user, N.eppn) if auth.authenticated() else N.public
 
+    @app.route("""/metrics""")
+    def serveMetrics():
+        checkBounds()
+        auth.authenticate()
+        if not auth.sysadmin():
+            abort(404)
+        return make_response(
+            DB.queryStats.prometheus()
+            + DB.recordCache.prometheus()
+            + OVERVIEW_CACHE.prometheus(),
+            METRICS_HEADERS,
+        )
+
     @app.route(f"""/{N.static}/<path:filepath>""")
     def serveStatic(filepath):
         checkBounds(filepath=filepath)
@@ -344,7 +387,7 @@ def appFactory(regime, test, debug, **kwargs):
         auth.authenticate()
         topbar = Topbar(context).wrap()
         sidebar = Sidebar(context, path).wrap()
-        overview = Overview(context).wrap()
+        overview = Overview(context, OVERVIEW_CACHE).wrap()
         return render_template(INDEX, topbar=topbar, sidebar=sidebar, material=overview)
 
     @app.route(f"""{OVERVIEW}.tsv""")
@@ -352,7 +395,7 @@ def appFactory(regime, test, debug, **kwargs):
         checkBounds()
         context = getContext()
         auth.authenticate()
-        return Overview(context).wrap(asTsv=True)
+        return Overview(context, OVERVIEW_CACHE).wrap(asTsv=True)
 
     # LOGIN / LOGOUT
 
@@ -7,7 +7,6 @@
 """
 
 from config import Config as C, Names as N
-from control.typ.types import Types
 from control.utils import pick as G, serverprint
 from control.workflow.apply import WorkflowItem
 
@@ -63,6 +62,7 @@ class Context:
     MongoDb | permanent | all app tables
     MongoDb | permanent | the workflow table, see `control.workflow.compute.Workflow`
     `control.db.Db` | worker process | cache for all data in all value tables
+    `control.recordcache.RecordCache` | worker process | validated cache for records in user tables
     `control.auth.Auth` | request | holds current user data
     `control.context.Context.cache` | request | cache for some records inuser tables
 
@@ -73,7 +73,9 @@ class Context:
         the same workflow information.
         Caching prevents an explosion of record fetches.
 
-        However, we should not cache this databetween requests,
+        Records that are kept between requests are validated against their
+        version stamps in MongoDb before they are used,
+        see `control.recordcache.RecordCache`,
         because the records that benefit most from caching are exactly the ones
         that are changed frequentlyby users.
 
@@ -94,7 +96,7 @@ class Context:
         See `control.db.Db.recollect`.
     """
 
-    def __init__(self, db, wf, auth):
+    def __init__(self, db, wf, auth, types):
         """## Initialization
 
         Creates a context singleton and initializes its cache.
@@ -110,6 +112,8 @@ class Context:
             See below.
         auth: object
             See below.
+        types: object
+            See below.
         """
 
         self.db = db
@@ -131,10 +135,11 @@ class Context:
         Provides methods to access the attributes of the current user.
         """
 
-        self.types = Types(self)
+        self.types = types.bind(self)
         """*object* The `control.typ.types.Types` singleton
 
         Provides methods to deal with values and their types.
+        It is created once per worker and bound to this context.
         """
 
         self.cache = {}
@@ -143,6 +148,15 @@ class Context:
         The cache lives as long as the request.
         """
 
+        self.wfitems = {}
+        """*dict* The workflow items handed out during the request.
+
+        Keyed by contrib id (as string), valued by
+        `control.workflow.apply.WorkflowItem` objects.
+        All records of a contribution share a single workflow item,
+        and with that the lookups it has memoized.
+        """
+
         db.recollect()
 
     def getItem(self, table, eid, requireFresh=False):
@@ -173,9 +187,60 @@ class Context:
             return db.getItem(table, eid)
 
         return self.getCached(
-            db.getItem, N.getItem, [table, eid], table, eid, requireFresh,
+            db.getItem if requireFresh else db.getItemCached,
+            N.getItem,
+            [table, eid],
+            table,
+            eid,
+            requireFresh,
         )
 
+    def prefetch(self, table, eids):
+        """Fetch several items from the database and put them in the cache.
+
+        Only the items that are not yet in the cache will be fetched,
+        and that happens in a single query.
+        Subsequent calls to `Context.getItem` for these items will hit the cache.
+
+        !!! hint
+            Call this before iterating over records whose permissions depend
+            on other records, such as the assessment and contrib of a review.
+
+        Parameters
+        ----------
+        table: string
+            The table from which the records are fetched.
+        eids: iterable of ObjectId
+            (Entity) IDs of the records.
+
+        Returns
+        -------
+        list of dict
+            The records in question, whether they came from the cache or not.
+        """
+
+        db = self.db
+        cache = self.cache
+
+        eids = {eid for eid in eids if eid}
+
+        if table in VALUE_TABLES:
+            return db.getItems(table, eids)
+
+        cachedTable = cache.setdefault(table, {})
+        keys = {(eid if type(eid) is str else str(eid)): eid for eid in eids}
+        missing = [eid for (key, eid) in keys.items() if key not in cachedTable]
+
+        if missing:
+            for record in db.getItemsCached(table, missing):
+                cachedTable[str(G(record, N._id))] = record
+            for eid in missing:
+                cachedTable.setdefault(eid if type(eid) is str else str(eid), {})
+            if DEBUG_CACHE:
+                serverprint(f"""CACHE PREFETCH {table} {len(missing)} items""")
+
+        return [cachedTable[key] for key in keys if cachedTable[key]]
+
     def refreshCache(self):
         """Refresh the cache.
 
@@ -186,6 +251,9 @@ class Context:
 
         But you can also manually trigger all workers to refresh their caches.
 
+        The records of user tables that this worker keeps between requests
+        are dropped as well, see `control.recordcache.RecordCache`.
+
         Returns
         -------
         bool
@@ -198,6 +266,7 @@ class Context:
         done = False
         if auth.sysadmin():
             db.recollect(True)
+            db.recordCache.clear()
             done = True
         return done
 
@@ -217,10 +286,12 @@ class Context:
         """
 
         auth = self.auth
+        db = self.db
         wf = self.wf
 
         nWf = -1
         if auth.sysadmin():
+            db.recordCache.clear()
             nWf = wf.initWorkflow(drop=False)
         return nWf
 
@@ -240,6 +311,10 @@ class Context:
         dict
             the record wrapped in a
             `control.workflow.apply.WorkflowItem` singleton
+
+        !!! note
+            The same contribution gets the same workflow item during a request,
+            unless a fresh one is required.
         """
 
         if not contribId:
@@ -247,6 +322,11 @@ class Context:
 
         db = self.db
         wf = self.wf
+        wfitems = self.wfitems
+
+        key = contribId if type(contribId) is str else str(contribId)
+        if not requireFresh and key in wfitems:
+            return wfitems[key]
 
         info = self.getCached(
             db.getWorkflowItem,
@@ -258,7 +338,53 @@ class Context:
         )
         if not info:
             info = wf.computeWorkflow(contribId=contribId)
-        return WorkflowItem(self, info)
+        wfitem = WorkflowItem(self, info)
+        wfitems[key] = wfitem
+        return wfitem
+
+    def prefetchWorkflow(self, contribIds):
+        """Fetch several workflow records and put them in the cache.
+
+        Only the items that are not yet in the cache will be fetched,
+        and that happens in a single query.
+        Items that are not in the workflow table are computed,
+        also in one go, see
+        `control.workflow.compute.Workflow.computeWorkflowMany`.
+        Subsequent calls to `Context.getWorkflowItem` for these items will hit
+        the cache.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId
+            The ids of the workflow items to be fetched.
+        """
+
+        db = self.db
+        wf = self.wf
+        cache = self.cache
+
+        cachedTable = cache.setdefault(N.workflow, {})
+        missing = [
+            contribId
+            for contribId in {contribId for contribId in contribIds if contribId}
+            if str(contribId) not in cachedTable
+        ]
+        if not missing:
+            return
+
+        for info in db.getWorkflowItems(missing):
+            cachedTable[str(G(info, N._id))] = info
+        uncomputed = [
+            contribId for contribId in missing if str(contribId) not in cachedTable
+        ]
+        if uncomputed:
+            for (contribId, info) in wf.computeWorkflowMany(uncomputed).items():
+                cachedTable[str(contribId)] = info
+        if DEBUG_CACHE:
+            serverprint(
+                f"""CACHE PREFETCH {N.workflow} {len(missing)} items"""
+                f""" ({len(uncomputed)} computed)"""
+            )
 
     def deleteItem(self, table, eid):
         """Delete a record and also remove it from the cache.
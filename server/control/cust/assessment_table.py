@@ -13,6 +13,19 @@ class AssessmentT(Table):
     set of criteriaEntry records and prefill some of their fields.
     """
 
+    listFields = (
+        N.title,
+        N.contrib,
+        N.creator,
+        N.editors,
+        N.reviewerE,
+        N.reviewerF,
+    )
+    """*tuple* The title, plus the fields needed for permissions and workflow.
+
+    See `control.table.Table.listFields`.
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -21,6 +21,17 @@ class ContribT(Table):
     set of criteriaEntry records and prefill some of their fields.
     """
 
+    listFields = (
+        N.title,
+        N.country,
+        N.creator,
+        N.editors,
+    )
+    """*tuple* The title, plus the fields needed for permissions and workflow.
+
+    See `control.table.Table.listFields`.
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -11,6 +11,18 @@ class ReviewT(Table):
     set of reviewEntry records and prefill some of their fields.
     """
 
+    listFields = (
+        N.title,
+        N.contrib,
+        N.assessment,
+        N.creator,
+        N.editors,
+    )
+    """*tuple* The title, plus the fields needed for permissions and workflow.
+
+    See `control.table.Table.listFields`.
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -7,7 +7,8 @@
 
 import sys
 from itertools import chain
-from pymongo import MongoClient
+from time import perf_counter
+from pymongo import MongoClient, ReplaceOne
 
 from config import Config as C, Names as N
 from control.utils import (
@@ -17,12 +18,16 @@ from control.utils import (
     filterModified,
     isIterable,
     E,
+    LOW,
     ON,
     ONE,
     MINONE,
     COMMA,
 )
 from control.typ.related import castObjectId
+from control.generation import Generation
+from control.querylog import QueryLog, QueryStats, TimedCursor
+from control.recordcache import RecordCache
 
 CB = C.base
 CM = C.mongo
@@ -35,6 +40,9 @@ DATABASE = CB.database
 DEBUG = CB.debug
 DEBUG_MONGO = G(DEBUG, N.mongo)
 DEBUG_SYNCH = G(DEBUG, N.synch)
+GENERATION = CB.generation
+SINGLE_HOST = G(GENERATION, N.singleHost)
+MAX_AGE = G(GENERATION, N.maxAge)
 CREATOR = CB.creator
 
 M_SET = CM.set
@@ -48,31 +56,97 @@ M_MATCH = CM.match
 M_PROJ = CM.project
 M_LOOKUP = CM.lookup
 M_ELEM = CM.elem
+M_PUSH = CM.push
+M_EACH = CM.each
+M_SLICE = CM.slice
+M_INDEX_STATS = CM.indexStats
+M_CURSOR = CM.cursor
+M_GROUP = CM.group
+M_SUM = CM.sum
+M_MAX = CM.max
+M_GT = CM.gt
+M_EXPR = CM.expr
+M_SPLIT = CM.split
+M_INC = CM.inc
+M_EQ = CM.eq
+M_LIMIT = CM.limit
 
 SHOW_ARGS = set(CM.showArgs)
 OTHER_COMMANDS = set(CM.otherCommands)
 M_COMMANDS = SHOW_ARGS | OTHER_COMMANDS
+CURSOR_COMMANDS = set(CM.cursorCommands)
 
 GROUP_RANK = CP.groupRank
 
 ACTUAL_TABLES = set(CT.actualTables)
 VALUE_TABLES = set(CT.valueTables)
+USER_TABLES = set(CT.userTables) | set(CT.userEntryTables)
 REFERENCE_SPECS = CT.reference
 CASCADE_SPECS = CT.cascade
+DETAILS = CT.details
 
 RECOLLECT_SPECS = CT.recollect
 RECOLLECT_TABLE = RECOLLECT_SPECS[N.table]
 RECOLLECT_NAME = RECOLLECT_SPECS[N.tableField]
 RECOLLECT_DATE = RECOLLECT_SPECS[N.dateField]
+RECOLLECT_FROM = RECOLLECT_SPECS[N.fromField]
+RECOLLECT_CHANGES = RECOLLECT_SPECS[N.changesField]
+RECOLLECT_FINGERPRINT = RECOLLECT_SPECS[N.fingerprintField]
+MAX_CHANGES = RECOLLECT_SPECS[N.maxChanges]
 
 WORKFLOW_FIELDS = CF.fields
 FIELD_PROJ = {field: True for field in WORKFLOW_FIELDS}
 
+WORKFLOW_MAIN = CT.userTables[0]
+WORKFLOW_INTER = CT.userTables[1]
+WORKFLOW_LOOKUPS = tuple(
+    (table, N._id, WORKFLOW_MAIN) for table in CT.userTables[1:]
+) + tuple(
+    (table, f"""{LOW}{WORKFLOW_INTER}.{N._id}""", WORKFLOW_INTER)
+    for table in CT.userEntryTables
+)
+"""How the details of a contribution are looked up in `Db.getFullEntries`.
+
+For each table: the field in the contrib (after the previous lookups)
+and the field in that table that must match.
+Assessments and reviews point to their contrib,
+criteria entries and review entries point to their assessment.
+"""
+
+ASSESSMENT_LOOKUPS = tuple(
+    (table, N._id, WORKFLOW_INTER)
+    for table in CT.userTables[2:] + CT.userEntryTables
+)
+"""How the details of an assessment are looked up in `Db.getAssessmentEntries`.
+
+Reviews, criteria entries and review entries all point to their assessment.
+"""
+
 OVERVIEW_FIELDS = CT.overviewFields
 OVERVIEW_FIELDS_WF = CT.overviewFieldsWorkflow
 
 OPTIONS = CW.options
 
+INDEXES = {}
+"""*dict* The indexes that the user tables need, keyed by table, valued by fields.
+
+They are derived from the reference, cascade and details specs in `tables.yaml`,
+supplemented with the fields listed there under `indexes`.
+"""
+
+for specs in chain(REFERENCE_SPECS.values(), CASCADE_SPECS.values()):
+    for (referringTable, referringFields) in specs.items():
+        if referringTable in USER_TABLES:
+            INDEXES.setdefault(referringTable, set()).update(referringFields)
+for (masterTable, detailTables) in DETAILS.items():
+    for detailTable in detailTables:
+        if detailTable in USER_TABLES:
+            INDEXES.setdefault(detailTable, set()).add(masterTable)
+for (table, fields) in CT.indexes.items():
+    INDEXES.setdefault(table, set()).update(fields)
+
+INDEX_ID = f"""{N._id}_"""
+
 MOD_FMT = """{} on {}"""
 
 
@@ -137,6 +211,62 @@ class Db:
         In the database there is a table which holds the last time for each value
         table that a worker updated a value in it.
         """
+
+        self.generation = Generation(database)
+        """*object* The generation counters shared by the workers on this host.
+
+        See `control.generation.Generation`.
+        """
+
+        self.generations = {}
+        """*dict* For each value table, the generation that this worker has seen.
+
+        If they are all equal to the shared generation counters, this worker
+        knows that its value cache is fresh without consulting MongoDb.
+        """
+
+        self.polled = None
+        """*datetime* The last time that this worker consulted the `collect` table."""
+
+        self.versions = {}
+        """*dict* For each value table, how often this worker has (re)loaded it.
+
+        Whatever is derived from the contents of a value table can be kept
+        as long as the version of that table stays the same,
+        see `control.typ.value.Value.widget`.
+        """
+
+        self.queryLog = QueryLog()
+        """*object* The tally of the MongoDb commands of the current request.
+
+        See `control.querylog.QueryLog`.
+        """
+
+        self.queryStats = QueryStats()
+        """*object* The latency histograms of the MongoDb commands of this worker.
+
+        See `control.querylog.QueryStats`.
+        """
+
+        self.recordCache = RecordCache()
+        """*object* The records of the user tables that this worker has read.
+
+        See `control.recordcache.RecordCache` and `Db.getItemsCached`.
+        """
+
+        self.fresh = {}
+        """*dict* For each value table, whether the last `recollect` found it fresh.
+
+        A value `True` means that the cached copy was up to date and has been kept,
+        `False` means that the table has been reloaded from the database.
+        """
+
+        self.delta = {}
+        """*dict* For each reloaded value table, whether the reload was a delta.
+
+        A value `True` means that only the changed records have been fetched and
+        patched into the cache, `False` means that the whole table has been fetched.
+        """
         self.collect()
 
         creator = [
@@ -193,6 +323,13 @@ class Db:
 
         All commands fired at the NongoDb go through this wrapper.
         It will spit out debug information if mongo debugging is True.
+        It will tally the command in the query log when it is issued,
+        and report its duration to `mongoReport`.
+
+        !!! note
+            Commands that return a cursor are timed until the cursor is exhausted
+            or closed.
+            We then hand out a `control.querylog.TimedCursor` that wraps the cursor.
 
         Parameters
         ----------
@@ -226,10 +363,106 @@ class Db:
                 f"""MONGO<<{label}>>.{table}.{command}{warning}({argRep} {kwargRep})"""
             )
         if method:
-            return method(*args, **kwargs)
+            self.queryLog.log(label, table, command, args)
+            start = perf_counter()
+            result = method(*args, **kwargs)
+            duration = perf_counter() - start
+            if command in CURSOR_COMMANDS:
+                return TimedCursor(
+                    result,
+                    duration,
+                    lambda total: self.mongoReport(label, table, command, args, total),
+                )
+            self.mongoReport(label, table, command, args, duration)
+            return result
         return None
 
-    def cacheValueTable(self, valueTable):
+    def mongoReport(self, label, table, command, args, duration):
+        """Account for the time of a MongoDb command that has been fired.
+
+        The time is added to the query log of the current request,
+        and it is put in the latency histograms of this worker.
+        See `control.querylog`.
+
+        If it is slow, it is logged with its criteria and a summary of its
+        query plan, see `explain`.
+
+        Parameters
+        ----------
+        label, table, command, args
+            See `mongoCmd`.
+        duration: float
+            The time the command took, in seconds.
+        """
+
+        self.queryLog.spend(label, table, command, duration)
+        if self.queryStats.observe(label, table, command, duration):
+            argRep = args[0] if args and command in SHOW_ARGS else E
+            serverprint(
+                f"""MONGO SLOW<<{label}>>.{table}.{command}"""
+                f""" {duration * 1000:.0f} ms ({argRep})"""
+                f""" {self.explain(table, command, args)}"""
+            )
+
+    def explain(self, table, command, args):
+        """Summarize the query plan of a command.
+
+        Only `find` and `aggregate` can be explained.
+
+        !!! caution
+            The command is executed again in order to explain it,
+            so only call this for commands that deserve the extra cost.
+
+        Parameters
+        ----------
+        table, command, args
+            See `mongoCmd`.
+
+        Returns
+        -------
+        string
+            The stages of the winning plan, with the indexes used,
+            and the numbers of keys and documents examined,
+            as far as MongoDb reports them.
+        """
+
+        mongo = self.mongo
+
+        try:
+            if command == N.find:
+                plan = mongo[table].find(*args).explain()
+            elif command == N.aggregate:
+                plan = mongo.command(N.aggregate, table, pipeline=args[0], explain=True)
+            else:
+                return E
+        except Exception as err:
+            return f"""no explain: {err}"""
+
+        stages = G(plan, N.stages)
+        if stages:
+            plan = G(stages[0], M_CURSOR, default={})
+        planner = G(plan, N.queryPlanner, default={})
+        stats = G(plan, N.executionStats, default={})
+
+        steps = []
+        stage = G(planner, N.winningPlan, default={})
+        while stage:
+            name = G(stage, N.stage)
+            index = G(stage, N.indexName)
+            steps.append(f"""{name}({index})""" if index else name)
+            stage = G(stage, N.inputStage)
+
+        examined = (
+            f""" keys={G(stats, N.totalKeysExamined)}"""
+            f""" docs={G(stats, N.totalDocsExamined)}"""
+            f""" returned={G(stats, N.nReturned)}"""
+            if stats
+            else E
+        )
+
+        return f"""plan={"<".join(steps) or "?"}{examined}"""
+
+    def cacheValueTable(self, valueTable, eids=None, deleted=None):
         """Caches the contents of a value table.
 
         The tables will be cached under two attributes:
@@ -240,13 +473,30 @@ class Db:
         the name of the table + `Inv`
         :   dictionary keyed by a key field and valued by the corresponding id.
 
+        For the permission group table there is a third attribute:
+
+        the name of the table + `Desc`
+        :   dictionary keyed by a key field and valued by the description.
+
+        If `eids` or `deleted` are given, the table is not fetched as a whole.
+        Only the records in `eids` are fetched,
+        and they are patched into the existing dictionaries.
+        The records in `deleted` are removed from them.
+
         Parameters
         ----------
         valueTable: string
             The value table to be cached.
+        eids: iterable of ObjectId, optional `None`
+            The records that have been inserted or modified.
+            Records among them that no longer exist will be removed as well.
+        deleted: iterable of ObjectId, optional `None`
+            The records that have been deleted.
         """
 
-        valueList = list(self.mongoCmd(N.collect, valueTable, N.find))
+        versions = self.versions
+        versions[valueTable] = G(versions, valueTable, 0) + 1
+
         repField = (
             N.iso
             if valueTable == N.country
@@ -255,22 +505,190 @@ class Db:
             else N.rep
         )
 
-        setattr(
-            self,
-            valueTable,
-            {G(record, N._id): record for record in valueList},
-        )
-        setattr(
-            self,
-            f"""{valueTable}Inv""",
-            {G(record, repField): G(record, N._id) for record in valueList},
-        )
-        if valueTable == N.permissionGroup:
+        if eids is None and deleted is None:
+            valueList = list(self.mongoCmd(N.collect, valueTable, N.find))
+            setattr(
+                self,
+                valueTable,
+                {G(record, N._id): record for record in valueList},
+            )
             setattr(
                 self,
-                f"""{valueTable}Desc""",
-                {G(record, repField): G(record, N.description) for record in valueList},
+                f"""{valueTable}Inv""",
+                {G(record, repField): G(record, N._id) for record in valueList},
             )
+            if valueTable == N.permissionGroup:
+                setattr(
+                    self,
+                    f"""{valueTable}Desc""",
+                    {
+                        G(record, repField): G(record, N.description)
+                        for record in valueList
+                    },
+                )
+            return
+
+        records = getattr(self, valueTable)
+        recordsInv = getattr(self, f"""{valueTable}Inv""")
+        recordsDesc = getattr(self, f"""{valueTable}Desc""", None)
+
+        deleted = set(deleted or [])
+        eids = set(eids or []) - deleted
+        valueList = (
+            list(
+                self.mongoCmd(
+                    N.collect, valueTable, N.find, {N._id: {M_IN: list(eids)}}
+                )
+            )
+            if eids
+            else []
+        )
+        found = {G(record, N._id) for record in valueList}
+
+        for eid in deleted | eids:
+            record = records.pop(eid, None)
+            if record is None:
+                continue
+            rep = G(record, repField)
+            if G(recordsInv, rep) == eid:
+                del recordsInv[rep]
+                if recordsDesc is not None:
+                    recordsDesc.pop(rep, None)
+
+        for record in valueList:
+            eid = G(record, N._id)
+            rep = G(record, repField)
+            records[eid] = record
+            recordsInv[rep] = eid
+            if recordsDesc is not None:
+                recordsDesc[rep] = G(record, N.description)
+
+        if DEBUG_SYNCH:
+            serverprint(
+                f"""PATCHED {valueTable}: {len(found)} updated,"""
+                f""" {len(deleted | eids) - len(found)} removed"""
+            )
+
+    def stampCollect(self, valueTable, justNow, changes=None):
+        """Record in the database that a value table has changed.
+
+        The record for `valueTable` in the `collect` table gets `justNow` as
+        its `dateCollected`.
+
+        If the individual changes are known, they are appended to the
+        list of changes in that record.
+        Other workers can then patch their caches instead of reloading them.
+        Only the last `maxChanges` changes are kept.
+
+        If the changes are not known, the list of changes is cleared, and
+        `deltaFrom`, the time since which the list is complete, is set to
+        `justNow`.
+        Workers that have collected the table before that will reload it
+        completely.
+
+        Parameters
+        ----------
+        valueTable: string
+            The value table that has changed.
+        justNow: datetime
+            The time of the change.
+        changes: iterable of dict, optional `None`
+            The changes, with fields `_id`, `date`, and `deleted`.
+            The latter is `True` for deleted records: the tombstones.
+
+        Returns
+        -------
+        dict | None
+            The record as it was before this change, so that the caller can see
+            which changes of other workers it has not yet seen.
+            `None` if there was no such record.
+        """
+
+        instructions = (
+            {
+                M_SET: {
+                    RECOLLECT_DATE: justNow,
+                    RECOLLECT_FROM: justNow,
+                    RECOLLECT_CHANGES: [],
+                }
+            }
+            if changes is None
+            else {
+                M_SET: {RECOLLECT_DATE: justNow},
+                M_PUSH: {
+                    RECOLLECT_CHANGES: {
+                        M_EACH: list(changes),
+                        M_SLICE: -MAX_CHANGES,
+                    }
+                },
+            }
+        )
+        return self.mongoCmd(
+            N.recollect,
+            N.collect,
+            N.find_one_and_update,
+            {RECOLLECT_NAME: valueTable},
+            instructions,
+            upsert=True,
+        )
+
+    @staticmethod
+    def deltaSince(record, since):
+        """Which records of a value table have changed since a given time.
+
+        Parameters
+        ----------
+        record: dict
+            The record of the value table in the `collect` table.
+        since: datetime
+            The time that the value table has been collected by this worker.
+
+        Returns
+        -------
+        tuple | None
+            The ids of the changed records and the ids of the deleted records.
+            `None` if the list of changes in the `collect` table does not
+            go back far enough.
+        """
+
+        deltaFrom = G(record, RECOLLECT_FROM)
+        changes = G(record, RECOLLECT_CHANGES) or []
+
+        if not since or not deltaFrom or deltaFrom > since:
+            return None
+        if len(changes) >= MAX_CHANGES and G(changes[0], N.date) > since:
+            return None
+
+        recent = [change for change in changes if G(change, N.date) > since]
+        deleted = {G(change, N._id) for change in recent if G(change, N.deleted)}
+        eids = {G(change, N._id) for change in recent} - deleted
+        return (eids, deleted)
+
+    @staticmethod
+    def missedSince(record, since):
+        """Which changes of other workers to a value table have not been seen.
+
+        Parameters
+        ----------
+        record: dict | None
+            The record of the value table in the `collect` table,
+            as it was before the change of this worker, see `stampCollect`.
+        since: datetime
+            The time that the value table has been collected by this worker.
+
+        Returns
+        -------
+        tuple | None
+            The ids of the changed records and the ids of the deleted records,
+            both empty if there are no such changes.
+            `None` if the list of changes in the `collect` table does not
+            go back far enough.
+        """
+
+        lastChangedThere = G(record, RECOLLECT_DATE)
+        if not lastChangedThere or (since and since >= lastChangedThere):
+            return (set(), set())
+        return Db.deltaSince(record, since)
 
     def collect(self):
         """Collect the contents of the value tables.
@@ -302,25 +720,23 @@ class Db:
         """
 
         collected = self.collected
+        generation = self.generation
 
         for valueTable in VALUE_TABLES:
             self.cacheValueTable(valueTable)
             justNow = now()
             collected[valueTable] = justNow
-            self.mongoCmd(
-                N.recollect,
-                N.collect,
-                N.update_one,
-                {RECOLLECT_NAME: valueTable},
-                {M_SET: {RECOLLECT_DATE: justNow}},
-                upsert=True,
-            )
+            self.stampCollect(valueTable, justNow)
+        bumped = generation.bump(VALUE_TABLES)
+        if bumped is not None:
+            self.generations = bumped
+        self.polled = now()
 
         self.collectActualItems()
         if DEBUG_SYNCH:
             serverprint(f"""COLLECTED {COMMA.join(sorted(VALUE_TABLES))}""")
 
-    def recollect(self, table=None):
+    def recollect(self, table=None, eids=None, deleted=None):
         """Collect the contents of the value tables if they have changed.
 
         For each value table it will be checked if they have been
@@ -343,9 +759,49 @@ class Db:
         and if needed, recollections will be done before the request processing.
 
         There is a table `collect`, with records having fields `table` and
-        `dateCollected`. After each (re)collect of a table, the `dateCollected` of
+        `dateCollected`. After each (re)collect of a table caused by a change
+        in this worker, the `dateCollected` of
         the appropriate record will be set to the current time.
 
+        All those records are read in a single query, and only the tables whose
+        `dateCollected` is later than our own collection time will be reloaded.
+        The decision per table is stored in the attribute `fresh`.
+        Reloading a table because another worker changed it does not set a new
+        time stamp, otherwise the workers would keep triggering each other.
+
+        ### Delta recollection
+
+        When a worker knows which records it has changed, it lists them
+        in the `collect` record of the table, see `stampCollect`.
+        Other workers then fetch only those records and patch them into their
+        cache, see `cacheValueTable`. Deleted records are listed as tombstones.
+        Whether a table has been patched or reloaded completely is stored in the
+        attribute `delta`.
+
+        When this worker changes a value table itself, other workers may have
+        changed it as well since this worker last collected it.
+        Stamping the `collect` record yields the record as it was before,
+        and the changes listed there that this worker has not yet seen are
+        patched in together with its own ones, see `missedSince`.
+        If they cannot be told, the table is reloaded completely.
+
+        ### Local recollection
+
+        Workers on the same host also share generation counters,
+        see `control.generation.Generation`.
+        After a change, a worker bumps the counters of the changed tables.
+        If all counters are equal to the ones this worker has seen, the
+        `collect` table is not consulted at all.
+        After its own change, a worker only takes over the bumped counter if
+        nobody else has bumped it in the meantime; otherwise the next request
+        consults the `collect` table.
+
+        !!! caution
+            This shortcut is only taken if all workers run on a single host,
+            which is configured in `base.yaml` under `generation`.
+            Even then, the `collect` table will be consulted at least every
+            `maxAge` seconds, so that changes made by other programs will be seen.
+
         !!! note "recollect()"
             A `recollect()` without arguments should be done at the start of each
             request.
@@ -367,45 +823,101 @@ class Db:
 
             If table is `True`, all timestamps in the `collect` table will be set
             to now, so that each worker will refresh its value cache.
+        eids: iterable of ObjectId, optional `None`
+            If a single table is passed, the records that this worker has
+            inserted or modified.
+        deleted: iterable of ObjectId, optional `None`
+            If a single table is passed, the records that this worker has
+            deleted.
         """
 
         collected = self.collected
+        fresh = self.fresh
+        delta = self.delta
+        generation = self.generation
+        generations = self.generations
 
         if table is None:
+            shared = generation.read()
+            justNow = now()
+            if (
+                SINGLE_HOST
+                and shared is not None
+                and shared == generations
+                and (justNow - self.polled).total_seconds() < MAX_AGE
+            ):
+                for valueTable in VALUE_TABLES:
+                    fresh[valueTable] = True
+                return
+
             affected = set()
-            for valueTable in VALUE_TABLES:
-                record = self.mongoCmd(
-                    N.recollect, N.collect, N.find_one, {RECOLLECT_NAME: valueTable}
+            collectRecords = {
+                G(record, RECOLLECT_NAME): record
+                for record in self.mongoCmd(
+                    N.recollect,
+                    N.collect,
+                    N.find,
+                    {RECOLLECT_NAME: {M_IN: list(VALUE_TABLES)}},
                 )
-                lastChangedGlobally = G(record, RECOLLECT_DATE)
+            }
+            for valueTable in VALUE_TABLES:
+                collectRecord = G(collectRecords, valueTable)
+                lastChangedThere = G(collectRecord, RECOLLECT_DATE)
                 lastChangedHere = G(collected, valueTable)
-                if lastChangedGlobally and (
-                    not lastChangedHere or lastChangedHere < lastChangedGlobally
-                ):
-                    self.cacheValueTable(valueTable)
-                    collected[valueTable] = now()
+                isFresh = not lastChangedThere or bool(
+                    lastChangedHere and lastChangedHere >= lastChangedThere
+                )
+                fresh[valueTable] = isFresh
+                if not isFresh:
+                    changes = self.deltaSince(collectRecord, lastChangedHere)
+                    if changes is None:
+                        self.cacheValueTable(valueTable)
+                    else:
+                        self.cacheValueTable(
+                            valueTable, eids=changes[0], deleted=changes[1]
+                        )
+                    delta[valueTable] = changes is not None
+                    collected[valueTable] = lastChangedThere
                     affected.add(valueTable)
-        elif table is True:
-            affected = set()
-            for valueTable in VALUE_TABLES:
-                self.cacheValueTable(valueTable)
-                collected[valueTable] = now()
-                affected.add(valueTable)
+            if shared is not None:
+                self.generations = shared
+            self.polled = justNow
         else:
-            self.cacheValueTable(table)
-            collected[table] = now()
-            affected = {table}
-        if affected:
+            affected = set(VALUE_TABLES) if table is True else {table}
+            known = table is not True and (eids is not None or deleted is not None)
+            eids = set(eids or [])
+            deleted = set(deleted or [])
             justNow = now()
-            for aTable in affected:
-                self.mongoCmd(
-                    N.recollect,
-                    N.collect,
-                    N.update_one,
-                    {RECOLLECT_NAME: aTable},
-                    {M_SET: {RECOLLECT_DATE: justNow}},
-                    upsert=True,
+            changes = (
+                [{N._id: eid, N.date: justNow, N.deleted: False} for eid in eids]
+                + [{N._id: eid, N.date: justNow, N.deleted: True} for eid in deleted]
+                if known
+                else None
+            )
+            for valueTable in affected:
+                previous = self.stampCollect(valueTable, justNow, changes=changes)
+                missed = (
+                    self.missedSince(previous, G(collected, valueTable))
+                    if known
+                    else None
                 )
+                if missed is None:
+                    self.cacheValueTable(valueTable)
+                else:
+                    allEids = eids | missed[0]
+                    self.cacheValueTable(
+                        valueTable,
+                        eids=allEids,
+                        deleted=(deleted | missed[1]) - allEids,
+                    )
+                fresh[valueTable] = False
+                delta[valueTable] = missed is not None
+                collected[valueTable] = justNow
+            bumped = generation.bump(affected)
+            if bumped is not None:
+                for (valueTable, counter) in bumped.items():
+                    if G(generations, valueTable) == counter - 1:
+                        generations[valueTable] = counter
 
         self.collectActualItems(tables=affected)
 
@@ -432,6 +944,10 @@ class Db:
         if tables is not None and not (tables & ACTUAL_TABLES):
             return
 
+        versions = self.versions
+        for valueTable in ACTUAL_TABLES:
+            versions[valueTable] = G(versions, valueTable, 0) + 1
+
         justNow = now()
 
         packageActual = {
@@ -473,7 +989,7 @@ class Db:
         if DEBUG_SYNCH:
             serverprint(f"""UPDATED {", ".join(ACTUAL_TABLES)}""")
 
-    def bulkContribWorkflow(self, countryId, bulk):
+    def bulkContribWorkflow(self, crit):
         """Collects workflow information in bulk.
 
         When overviews are being produced, workflow info is needed for a lot
@@ -484,24 +1000,22 @@ class Db:
         information from the workflow table, and to flatten the nested documents
         to simple key-value pair.
 
+        The overview page does not use this directly, but reads the overview
+        table, which is computed from this,
+        see `control.workflow.compute.Workflow.refreshOverview`.
+
         Parameters
         ----------
-        countryId: ObjectId
-            If `None`, all workflow items will be fetched.
-            Otherwise, this should be
-            the id of a countryId, and only the workflow
-            for items belonging to this country are fetched.
-        bulk: boolean
-            If `True`, fetches only records that have been bulk-imported.
-            Those records are marked by the presence of the field `import`.
+        crit: dict
+            A criterion on the contrib records.
+            If empty, the workflow of all contribs will be fetched.
+            Records that have been bulk-imported keep the field `import`.
         """
-        crit = {} if countryId is None else {"country": countryId}
-        if bulk:
-            crit["import"] = {M_EX: True}
 
         project = {
             field: f"${fieldTrans}" for (field, fieldTrans) in OVERVIEW_FIELDS.items()
         }
+        project["import"] = "$import"
         project.update(
             {
                 field: {M_ELEM: [f"${N.workflow}.{fieldTrans}", 0]}
@@ -527,6 +1041,103 @@ class Db:
         )
         return records
 
+    def getOverview(self, countryId, bulk):
+        """Fetch the records of the overview table.
+
+        See `control.workflow.compute.Workflow.refreshOverview`.
+
+        Parameters
+        ----------
+        countryId: ObjectId
+            If `None`, all overview records will be fetched.
+            Otherwise, only the overview records of the contributions
+            of the country with this id are fetched.
+        bulk: boolean
+            If `True`, fetches only records that have been bulk-imported.
+
+        Returns
+        -------
+        list of dict
+            In the order of the contrib ids.
+        """
+
+        crit = {} if countryId is None else {N.countryId: countryId}
+        if bulk:
+            crit[N.bulk] = True
+
+        return list(
+            self.mongoCmd(N.getOverview, N.overview, N.find, crit, sort=[(N._id, 1)])
+        )
+
+    def getOverviewItems(self, contribIds):
+        """Fetch several overview records at once.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId
+            The ids of the contributions whose overview records are fetched.
+
+        Returns
+        -------
+        list of dict
+        """
+
+        contribIds = [contribId for contribId in contribIds if contribId]
+        if not contribIds:
+            return []
+
+        crit = {N._id: {M_IN: contribIds}}
+        return list(self.mongoCmd(N.getOverviewItems, N.overview, N.find, crit))
+
+    def upsertOverviewMany(self, records):
+        """Bulk replace records in the overview table.
+
+        Records that are not yet in the overview table will be inserted.
+        All replacements are sent to MongoDb in a single unordered `bulk_write`.
+
+        Parameters
+        ----------
+        records: iterable of dict
+            The records to be stored.
+            They must have an `_id` field, the id of their contribution.
+        """
+
+        requests = [
+            ReplaceOne({N._id: G(record, N._id)}, record, upsert=True)
+            for record in records
+        ]
+        if requests:
+            self.mongoCmd(
+                N.upsertOverviewMany,
+                N.overview,
+                N.bulk_write,
+                requests,
+                ordered=False,
+            )
+            self.workflowChanged()
+
+    def deleteOverviewMany(self, contribIds):
+        """Delete several overview records.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId
+            The ids of the contributions whose overview records must be deleted.
+        """
+
+        crit = {N._id: self.inCrit(contribIds)}
+        self.mongoCmd(N.deleteOverviewMany, N.overview, N.delete_many, crit)
+        self.workflowChanged()
+
+    def clearOverview(self):
+        """Clear the overview table.
+
+        See `control.workflow.compute.Workflow.refreshOverview`.
+        """
+
+        self.mongoCmd(N.clearOverview, N.overview, N.delete_many, {})
+        self.workflowChanged()
+
     def makeCrit(self, mainTable, conditions):
         """Translate conditons into a MongoDb criterion.
 
@@ -587,6 +1198,83 @@ class Db:
                 criterion[crit] = eids
         return criterion
 
+    def makeSelect(self, mainTable, conditions):
+        """Translate conditions into stages of a MongoDb aggregation pipeline.
+
+        This is the server side counterpart of `Db.makeCrit` and `Db.satisfies`.
+        For each table that is mentioned in an active condition, the detail
+        records of that table are looked up by the field that points to the
+        main record.
+        We only need to know whether there is such a detail, so the lookup
+        yields at most one, and only its id.
+        A match stage then keeps only the main records that have such details
+        (or not), and a final projection drops the looked up details.
+
+        The semantics is the same as with `Db.satisfies`:
+        a record must have details in at least one of the tables under `'1'`
+        and it may not have details in any of the tables under `'-1'`.
+
+        Parameters
+        ----------
+        mainTable: string
+            The name of the table that is being filtered.
+        conditions: dict
+            keyed by a table name (such as assessment or review)
+            and valued by -1, 0 or 1 (as strings).
+
+        Result
+        ------
+        list
+            The stages to append to a pipeline that starts with the records
+            of the main table. Empty if no condition is active.
+        """
+
+        activeOptions = {}
+        for (cond, crit) in conditions.items():
+            if crit == ONE or crit == MINONE:
+                table = G(G(OPTIONS, cond), N.table)
+                if table is not None:
+                    activeOptions.setdefault(crit == ONE, set()).add(table)
+
+        if not activeOptions:
+            return []
+
+        tables = sorted(set(chain.from_iterable(activeOptions.values())))
+        lookups = [
+            {
+                M_LOOKUP: {
+                    "from": table,
+                    N.let: {N.eid: f"""${N._id}"""},
+                    N.pipeline: [
+                        {
+                            M_MATCH: {
+                                M_EXPR: {M_EQ: [f"""${mainTable}""", f"""$${N.eid}"""]}
+                            }
+                        },
+                        {M_PROJ: {N._id: True}},
+                        {M_LIMIT: 1},
+                    ],
+                    "as": f"""{LOW}{table}""",
+                }
+            }
+            for table in tables
+        ]
+
+        match = {}
+        if True in activeOptions:
+            match[M_OR] = [
+                {f"""{LOW}{table}.0""": {M_EX: True}}
+                for table in sorted(activeOptions[True])
+            ]
+        for table in sorted(G(activeOptions, False, default=set())):
+            match[f"""{LOW}{table}.0"""] = {M_EX: False}
+
+        return [
+            *lookups,
+            {M_MATCH: match},
+            {M_PROJ: {f"""{LOW}{table}""": False for table in tables}},
+        ]
+
     def getList(
         self,
         table,
@@ -598,6 +1286,7 @@ class Db:
         selectable=None,
         unfinished=False,
         select=False,
+        fields=None,
         **conditions,
     ):
         """Fetch a list of records from a table.
@@ -621,7 +1310,7 @@ class Db:
         !!! hint
             `select` and `**conditions` below are used as a consequence of
             the filtering on the interface by the options `assessed` and `reviewed`.
-            See also `Db.makeCrit` and `Db.satisfies`.
+            See also `Db.makeSelect`.
 
         Parameters
         ----------
@@ -668,11 +1357,15 @@ class Db:
             and typically, that user is a National Coordinator.
         select: boolean, optional `False`
             **Task: trigger addtional filtering by custom `conditions`.**
+        fields: iterable of string, optional `None`
+            If passed, only these fields (and `_id`) will be fetched from the records.
+            Not applicable to value tables, which are delivered from the cache.
         **conditions: dict
             **Task: produce a list of records filtered by custom conditions.**
             If `select`, carry out filtering on the retrieved records, where
             **conditions specify the filtering
-            (through `Db.makeCrit` and `Db.satisfies`).
+            (through `Db.makeSelect`, or for value tables
+            `Db.makeCrit` and `Db.satisfies`).
 
         Returns
         -------
@@ -707,11 +1400,22 @@ class Db:
                     and (our is None or G(record, N.country) == our)
                 )
             )
+            if select:
+                criterion = self.makeCrit(table, conditions)
+                records = (
+                    record for record in records if Db.satisfies(record, criterion)
+                )
         else:
-            records = self.mongoCmd(N.getList, table, N.find, crit)
-        if select:
-            criterion = self.makeCrit(table, conditions)
-            records = (record for record in records if Db.satisfies(record, criterion))
+            stages = self.makeSelect(table, conditions) if select else []
+            proj = None if fields is None else {field: True for field in fields}
+            if stages:
+                if proj is not None:
+                    stages.append({M_PROJ: proj})
+                records = self.mongoCmd(
+                    N.getList, table, N.aggregate, [{M_MATCH: crit}, *stages]
+                )
+            else:
+                records = self.mongoCmd(N.getList, table, N.find, crit, proj)
         return records if titleSort is None else sorted(records, key=titleSort)
 
     def getItem(self, table, eid):
@@ -737,9 +1441,153 @@ class Db:
             return G(getattr(self, table, {}), oid, default={})
 
         records = list(self.mongoCmd(N.getItem, table, N.find, {N._id: oid}))
+        if table in USER_TABLES:
+            self.recordCache.put(table, records)
         record = records[0] if len(records) else {}
         return record
 
+    def getItems(self, table, eids):
+        """Fetch several records from a table at once.
+
+        Parameters
+        ----------
+        table: string
+            The table from which the records are fetched.
+        eids: iterable of ObjectId
+            (Entity) IDs of the records.
+            Ids that do not correspond to records are ignored.
+
+        Returns
+        -------
+        list of dict
+        """
+
+        oids = {castObjectId(eid) for eid in eids if eid}
+        oids.discard(None)
+        if not oids:
+            return []
+
+        if table in VALUE_TABLES:
+            records = getattr(self, table, {})
+            return [records[oid] for oid in oids if oid in records]
+
+        records = list(
+            self.mongoCmd(N.getItems, table, N.find, {N._id: {M_IN: list(oids)}})
+        )
+        if table in USER_TABLES:
+            self.recordCache.put(table, records)
+        return records
+
+    def getItemsCached(self, table, eids):
+        """Fetch several records from a table, possibly from the record cache.
+
+        Records of the user tables are kept between requests,
+        see `control.recordcache.RecordCache`.
+        The cached records are validated in a single query that only fetches
+        their version stamps.
+        Only the records that are not cached or have changed are fetched in full,
+        again in a single query.
+
+        Parameters
+        ----------
+        table: string
+            The table from which the records are fetched.
+        eids: iterable of ObjectId
+            (Entity) IDs of the records.
+            Ids that do not correspond to records are ignored.
+
+        Returns
+        -------
+        list of dict
+        """
+
+        if table not in USER_TABLES:
+            return self.getItems(table, eids)
+
+        recordCache = self.recordCache
+
+        oids = {castObjectId(eid) for eid in eids if eid}
+        oids.discard(None)
+        if not oids:
+            return []
+
+        cached = recordCache.get(table, oids)
+        fresh = []
+        if cached:
+            stamps = self.getStamps(table, cached)
+            fresh = [
+                record
+                for (oid, record) in cached.items()
+                if oid in stamps and stamps[oid] == RecordCache.stamp(record)
+            ]
+            if len(fresh) < len(cached):
+                recordCache.drop(
+                    table, set(cached) - {G(record, N._id) for record in fresh}
+                )
+
+        recordCache.count(len(fresh), len(oids) - len(cached), len(cached) - len(fresh))
+
+        missing = oids - {G(record, N._id) for record in fresh}
+        return fresh + (self.getItems(table, missing) if missing else [])
+
+    def getItemCached(self, table, eid):
+        """Fetch a single record from a table, possibly from the record cache.
+
+        See `Db.getItemsCached`.
+
+        Parameters
+        ----------
+        table: string
+            The table from which the record is fetched.
+        eid: ObjectId
+            (Entity) ID of the particular record.
+
+        Returns
+        -------
+        dict
+            The record as a dict.
+        """
+
+        records = self.getItemsCached(table, [eid])
+        return records[0] if records else {}
+
+    def getStamps(self, table, eids):
+        """Fetch the version stamps of several records.
+
+        See `control.recordcache.RecordCache.stamp`.
+
+        Parameters
+        ----------
+        table: string
+            The table of the records.
+        eids: iterable of ObjectId
+            (Entity) IDs of the records.
+
+        Returns
+        -------
+        dict
+            Keyed by the ids of the records that exist, valued by their stamps.
+            The work is done by MongoDb, so that only the stamps are transferred.
+        """
+
+        return {
+            G(record, N._id): (G(record, N.version), G(record, N.stamp))
+            for record in self.mongoCmd(
+                N.getStamps,
+                table,
+                N.aggregate,
+                [
+                    {M_MATCH: {N._id: {M_IN: list(eids)}}},
+                    {
+                        M_PROJ: {
+                            N.version: True,
+                            N.stamp: {M_ELEM: [f"""${N.modified}""", 0]},
+                        }
+                    },
+                ],
+            )
+        }
+
     def getWorkflowItem(self, contribId):
         """Fetch a single workflow record.
 
@@ -761,6 +1609,26 @@ class Db:
         entries = list(self.mongoCmd(N.getWorkflowItem, N.workflow, N.find, crit))
         return entries[0] if entries else {}
 
+    def getWorkflowItems(self, contribIds):
+        """Fetch several workflow records at once.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId
+            The ids of the workflow items to be fetched.
+
+        Returns
+        -------
+        list of dict
+        """
+
+        contribIds = [contribId for contribId in contribIds if contribId]
+        if not contribIds:
+            return []
+
+        crit = {N._id: {M_IN: contribIds}}
+        return list(self.mongoCmd(N.getWorkflowItems, N.workflow, N.find, crit))
+
     def getDetails(self, table, masterField, eids, sortKey=None):
         """Fetch the detail records connected to one or more master records.
 
@@ -962,7 +1830,7 @@ class Db:
         }
         result = self.mongoCmd(N.insertItem, table, N.insert_one, newRecord)
         if table in VALUE_TABLES:
-            self.recollect(table)
+            self.recollect(table, eids=[result.inserted_id])
         return result.inserted_id
 
     def insertMany(self, table, uid, eppn, records):
@@ -1027,7 +1895,7 @@ class Db:
             }
         )
         result = self.mongoCmd(N.insertUser, N.user, N.insert_one, record)
-        self.recollect(N.user)
+        self.recollect(N.user, eids=[result.inserted_id])
         record[N._id] = result.inserted_id
 
     def deleteItem(self, table, eid):
@@ -1051,7 +1919,8 @@ class Db:
             return False
         status = self.mongoCmd(N.deleteItem, table, N.delete_one, {N._id: oid})
         if table in VALUE_TABLES:
-            self.recollect(table)
+            self.recollect(table, deleted=[oid])
+        self.recordCache.drop(table, [oid])
         return G(status.raw_result, N.ok, default=False)
 
     def deleteMany(self, table, crit):
@@ -1088,6 +1957,11 @@ class Db:
             The rule is that pristine records are the ones that originate from the
             legacy data and have not changed since then.
 
+        !!! hint
+            The field `version` of the record is incremented, so that other
+            workers can tell that their cached copy is stale,
+            see `control.recordcache.RecordCache.stamp`.
+
         Parameters
         ----------
         table: string
@@ -1133,16 +2007,18 @@ class Db:
         instructions = {
             M_SET: update,
             M_UNSET: delete,
+            M_INC: {N.version: 1},
         }
 
         status = self.mongoCmd(
             N.updateField, table, N.update_one, criterion, instructions
         )
+        self.recordCache.drop(table, [oid])
         if not G(status.raw_result, N.ok, default=False):
             return False
 
         if table in VALUE_TABLES:
-            self.recollect(table)
+            self.recollect(table, eids=[oid])
         return (
             update,
             set(delete.keys()),
@@ -1171,10 +2047,14 @@ class Db:
             }
         )
         criterion = {N._id: G(record, N._id)}
-        updates = {k: v for (k, v) in record.items() if k != N._id}
-        instructions = {M_SET: updates, M_UNSET: {N.isPristine: E}}
+        updates = {k: v for (k, v) in record.items() if k not in {N._id, N.version}}
+        instructions = {
+            M_SET: updates,
+            M_UNSET: {N.isPristine: E},
+            M_INC: {N.version: 1},
+        }
         self.mongoCmd(N.updateUser, N.user, N.update_one, criterion, instructions)
-        self.recollect(N.user)
+        self.recollect(N.user, eids=[G(record, N._id)])
 
     def dependencies(self, table, record):
         """Computes the number of dependent records of a record.
@@ -1225,6 +2105,90 @@ class Db:
 
         return depResult
 
+    def provisionIndexes(self, create=True, full=True):
+        """Make sure that the user tables have the indexes they need.
+
+        The required indexes are in `INDEXES`.
+        Each of them is a single field index, in ascending order,
+        with the default name that MongoDb gives it, e.g. `country_1`.
+        Creating an index that already exists does nothing, so this function
+        can be run at every start up, with `full=False`.
+
+        The MongoDb keeps statistics of the usage of indexes since
+        the database server started. Required indexes that have not been used
+        since are reported, as well as indexes that exist but are not required.
+        Only the missing indexes are printed, the rest of the report
+        is returned, see `indexes.py`.
+
+        Parameters
+        ----------
+        create: boolean, optional `True`
+            Whether to create the missing indexes or only report them.
+        full: boolean, optional `True`
+            Whether to report unused and extraneous indexes as well.
+            That needs the index statistics of every table, which is not
+            worth it at start up.
+
+        Returns
+        -------
+        dict
+            Keyed by `missing`, `unused`, `extraneous`, valued by dicts
+            that are keyed by table and valued by index names.
+        """
+
+        report = {N.missing: {}, N.unused: {}, N.extraneous: {}}
+
+        for (table, fields) in sorted(INDEXES.items()):
+            required = {f"""{field}_1""": field for field in fields}
+            existing = set(
+                self.mongoCmd(N.provisionIndexes, table, N.index_information) or {}
+            )
+
+            missing = sorted(set(required) - existing)
+            if missing:
+                report[N.missing][table] = missing
+                if create:
+                    for name in missing:
+                        self.mongoCmd(
+                            N.provisionIndexes, table, N.create_index, required[name]
+                        )
+
+            if not full:
+                continue
+
+            extraneous = sorted(existing - set(required) - {INDEX_ID})
+            if extraneous:
+                report[N.extraneous][table] = extraneous
+
+            unused = sorted(
+                G(stat, N.name)
+                for stat in self.mongoCmd(
+                    N.provisionIndexes, table, N.aggregate, [{M_INDEX_STATS: {}}]
+                )
+                if G(stat, N.name) in required
+                and not G(G(stat, N.accesses), N.ops)
+            )
+            if unused:
+                report[N.unused][table] = unused
+
+        for (table, names) in report[N.missing].items():
+            serverprint(
+                f"""INDEXES {N.missing} {table}: {COMMA.join(names)}"""
+                f"""{" (created)" if create else E}"""
+            )
+
+        return report
+
+    def workflowChanged(self):
+        """Signal to all workers that the workflow or overview table has changed.
+
+        Bumps the `workflow` counter of `control.generation.Generation`,
+        on which the overview cache depends,
+        see `control.overviewcache.OverviewCache`.
+        """
+
+        self.generation.bump({N.workflow})
+
     def dropWorkflow(self):
         """Drop the entire workflow table.
 
@@ -1234,6 +2198,7 @@ class Db:
         """
 
         self.mongoCmd(N.dropWorkflow, N.workflow, N.drop)
+        self.workflowChanged()
 
     def clearWorkflow(self):
         """Clear the entire workflow table.
@@ -1245,6 +2210,7 @@ class Db:
         """
 
         self.mongoCmd(N.clearWorkflow, N.workflow, N.delete_many, {})
+        self.workflowChanged()
 
     def entries(self, table, crit={}):
         """Get relevant records from a table as a dictionary of entries.
@@ -1276,16 +2242,185 @@ class Db:
 
         return entries
 
-    def insertWorkflowMany(self, records):
+    def getIds(self, table, crit=None, limit=None):
+        """Get the ids of the records in a table.
+
+        Parameters
+        ----------
+        table: string
+            The table from which the ids are taken.
+        crit: dict, optional `None`
+            A criterion on the ids, such as `{"$gt": someId}`.
+            If not given, all ids are taken.
+        limit: int, optional `None`
+            If given, only the lowest ids, up to this number, are taken.
+
+        Returns
+        -------
+        list of ObjectId
+            Sorted.
+        """
+
+        return [
+            G(record, N._id)
+            for record in self.mongoCmd(
+                N.getIds,
+                table,
+                N.find,
+                {} if crit is None else {N._id: crit},
+                {N._id: True},
+                sort=[(N._id, 1)],
+                limit=limit or 0,
+            )
+        ]
+
+    def getFullEntries(self, contribIds):
+        """Get contributions together with all details that matter for workflow.
+
+        This is done in a single aggregation, where the assessments, reviews,
+        criteria entries and review entries are looked up by their
+        foreign keys, see `WORKFLOW_LOOKUPS`.
+        Only the fields that matter for workflow are retrieved,
+        see `fields` in workflow.yaml.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId
+            The ids of the contributions.
+
+        Returns
+        -------
+        dict
+            Keyed by table, valued by the entries of that table, as in `Db.entries`.
+        """
+
+        return self.lookupEntries(
+            N.getFullEntries, WORKFLOW_MAIN, contribIds, WORKFLOW_LOOKUPS
+        )
+
+    def getAssessmentEntries(self, assessmentId):
+        """Get an assessment together with all details that matter for workflow.
+
+        As `Db.getFullEntries`, but for a single assessment, with its reviews,
+        criteria entries and review entries, see `ASSESSMENT_LOOKUPS`.
+
+        Parameters
+        ----------
+        assessmentId: ObjectId
+            The id of the assessment.
+
+        Returns
+        -------
+        dict
+            Keyed by table, valued by the entries of that table, as in `Db.entries`.
+        """
+
+        return self.lookupEntries(
+            N.getAssessmentEntries, WORKFLOW_INTER, [assessmentId], ASSESSMENT_LOOKUPS
+        )
+
+    def lookupEntries(self, label, mainTable, eids, lookups):
+        """Get records together with their details in a single aggregation.
+
+        See `Db.getFullEntries` and `Db.getAssessmentEntries`.
+
+        Parameters
+        ----------
+        label: string
+            See `Db.mongoCmd`.
+        mainTable: string
+            The table of the records.
+        eids: iterable of ObjectId
+            The ids of the records.
+        lookups: tuple
+            For each detail table: the field in the record
+            (after the previous lookups) and the field in the detail table
+            that must match.
+
+        Returns
+        -------
+        dict
+            Keyed by table, valued by the entries of that table, as in `Db.entries`.
+        """
+
+        proj = dict(FIELD_PROJ)
+        for (table, localField, foreignField) in lookups:
+            proj[f"""{LOW}{table}.{N._id}"""] = True
+            for field in WORKFLOW_FIELDS:
+                proj[f"""{LOW}{table}.{field}"""] = True
+
+        pipeline = [
+            {M_MATCH: {N._id: self.inCrit(eids)}},
+            *(
+                {
+                    M_LOOKUP: {
+                        "from": table,
+                        N.localField: localField,
+                        N.foreignField: foreignField,
+                        "as": f"""{LOW}{table}""",
+                    }
+                }
+                for (table, localField, foreignField) in lookups
+            ),
+            {M_PROJ: proj},
+        ]
+
+        entries = {mainTable: {}}
+        for (table, localField, foreignField) in lookups:
+            entries[table] = {}
+
+        for record in self.mongoCmd(label, mainTable, N.aggregate, pipeline):
+            for (table, localField, foreignField) in lookups:
+                tableEntries = entries[table]
+                for detail in record.pop(f"""{LOW}{table}""", []):
+                    tableEntries[G(detail, N._id)] = detail
+            entries[mainTable][G(record, N._id)] = record
+
+        return entries
+
+    def insertWorkflowMany(self, records, ordered=True):
         """Bulk insert records into the workflow table.
 
         Parameters
         ----------
         records: iterable of dict
             The records to be inserted.
+        ordered: boolean, optional `True`
+            Whether MongoDb should insert the records one after the other.
+            If not, it may insert them in parallel, which is faster.
         """
 
-        self.mongoCmd(N.insertWorkflowMany, N.workflow, N.insert_many, records)
+        self.mongoCmd(
+            N.insertWorkflowMany, N.workflow, N.insert_many, records, ordered=ordered
+        )
+        self.workflowChanged()
+
+    def upsertWorkflowMany(self, records):
+        """Bulk replace records in the workflow table.
+
+        Records that are not yet in the workflow table will be inserted.
+        All replacements are sent to MongoDb in a single unordered `bulk_write`.
+
+        Parameters
+        ----------
+        records: iterable of dict
+            The records to be stored.
+            They must have an `_id` field, the id of their contribution.
+        """
+
+        requests = [
+            ReplaceOne({N._id: G(record, N._id)}, record, upsert=True)
+            for record in records
+        ]
+        if requests:
+            self.mongoCmd(
+                N.upsertWorkflowMany,
+                N.workflow,
+                N.bulk_write,
+                requests,
+                ordered=False,
+            )
+            self.workflowChanged()
 
     def insertWorkflow(self, record):
         """Insert a single workflow record.
@@ -1297,6 +2432,7 @@ class Db:
         """
 
         self.mongoCmd(N.insertWorkflow, N.workflow, N.insert_one, record)
+        self.workflowChanged()
 
     def updateWorkflow(self, contribId, record):
         """Replace a workflow record by an other one.
@@ -1315,6 +2451,28 @@ class Db:
 
         crit = {N._id: contribId}
         self.mongoCmd(N.updateWorkflow, N.workflow, N.replace_one, crit, record)
+        self.workflowChanged()
+
+    def updateWorkflowParts(self, contribId, parts, crit=None):
+        """Update parts of a workflow record.
+
+        Parameters
+        ----------
+        contribId: ObjectId
+            The id of the workflow record that has to be updated.
+        parts: dict
+            Keyed by (dotted) paths into the workflow record,
+            valued by the new values for those paths.
+        crit: dict, optional `None`
+            Additional criteria that the workflow record must satisfy.
+            If it does not, nothing is updated.
+        """
+
+        crit = {N._id: contribId, **(crit or {})}
+        self.mongoCmd(
+            N.updateWorkflowParts, N.workflow, N.update_one, crit, {M_SET: parts}
+        )
+        self.workflowChanged()
 
     def deleteWorkflow(self, contribId):
         """Delete a workflow record.
@@ -1327,6 +2485,163 @@ class Db:
 
         crit = {N._id: contribId}
         self.mongoCmd(N.deleteWorkflow, N.workflow, N.delete_one, crit)
+        self.workflowChanged()
+
+    def deleteWorkflowMany(self, contribIds):
+        """Delete several workflow records.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId
+            The ids of the workflow items to be deleted.
+        """
+
+        crit = {N._id: self.inCrit(contribIds)}
+        self.mongoCmd(N.deleteWorkflowMany, N.workflow, N.delete_many, crit)
+        self.workflowChanged()
+
+    def getWorkflowFingerprint(self):
+        """Get the fingerprint of the data from which the workflow table is computed.
+
+        See `control.workflow.compute.Workflow.fingerprint`.
+
+        Returns
+        -------
+        dict | None
+            The fingerprint that has been stored when the workflow table was
+            last computed. `None` if there is no such fingerprint.
+        """
+
+        record = self.mongoCmd(
+            N.fingerprint, RECOLLECT_TABLE, N.find_one, {RECOLLECT_NAME: N.workflow}
+        )
+        return G(record, RECOLLECT_FINGERPRINT)
+
+    def setWorkflowFingerprint(self, fingerprint):
+        """Store the fingerprint of the data from which the workflow table is computed.
+
+        Parameters
+        ----------
+        fingerprint: dict
+            See `control.workflow.compute.Workflow.fingerprint`.
+        """
+
+        self.mongoCmd(
+            N.fingerprint,
+            RECOLLECT_TABLE,
+            N.update_one,
+            {RECOLLECT_NAME: N.workflow},
+            {M_SET: {RECOLLECT_FINGERPRINT: fingerprint}},
+            upsert=True,
+        )
+
+    def tableStats(self, table):
+        """Summarize the state of a user table.
+
+        The summary is cheap to compute, because the MongoDb computes it,
+        and it changes whenever records are inserted, deleted, or modified
+        through the app.
+
+        !!! caution
+            Modifications that do not add to the `modified` field of a record
+            and do not increment its `version` field are not noticed.
+            That is the case for changes that are made directly in MongoDb.
+
+        Parameters
+        ----------
+        table: string
+            The table to summarize.
+
+        Returns
+        -------
+        dict
+            The number of records (`count`), the highest id (`maxId`), the date
+            of the latest modification (`lastModified`) and the sum of the
+            versions of the records (`version`).
+            Ids increase over time, so a new record means a new highest id.
+            Dates only have a precision of seconds, but every modification
+            increments a version, see `Db.updateField`.
+        """
+
+        stats = list(
+            self.mongoCmd(
+                N.tableStats,
+                table,
+                N.aggregate,
+                [
+                    {
+                        M_PROJ: {
+                            N.lastModified: Db.lastModifiedExpr(),
+                            N.version: True,
+                        }
+                    },
+                    {
+                        M_GROUP: {
+                            N._id: None,
+                            N.count: {M_SUM: 1},
+                            N.maxId: {M_MAX: f"""${N._id}"""},
+                            N.lastModified: {M_MAX: f"""${N.lastModified}"""},
+                            N.version: {M_SUM: f"""${N.version}"""},
+                        }
+                    },
+                ],
+            )
+        )
+        return {
+            N.count: G(stats[0], N.count) if stats else 0,
+            N.maxId: G(stats[0], N.maxId) if stats else None,
+            N.lastModified: G(stats[0], N.lastModified) if stats else None,
+            N.version: G(stats[0], N.version) if stats else 0,
+        }
+
+    def changedEntries(self, table, stats):
+        """Get the entries of a table that have changed since a summary was made.
+
+        Parameters
+        ----------
+        table: string
+            The table from which the entries are taken.
+        stats: dict
+            An earlier summary of the table, see `Db.tableStats`.
+
+        Returns
+        -------
+        dict
+            The entries that have been inserted or modified since then,
+            see `Db.entries`.
+            Entries that have been modified in the same second as the
+            latest modification in the summary are included as well.
+        """
+
+        maxId = G(stats, N.maxId)
+        lastModified = G(stats, N.lastModified)
+
+        if maxId is None:
+            return self.entries(table)
+
+        crits = [{N._id: {M_GT: maxId}}]
+        if lastModified is not None:
+            crits.append({M_EXPR: {M_GTE: [Db.lastModifiedExpr(), lastModified]}})
+        return self.entries(table, {M_OR: crits})
+
+    @staticmethod
+    def lastModifiedExpr():
+        """Expression for the date of the latest modification of a record.
+
+        The latest modification is the first entry of the `modified` field,
+        see `control.utils.filterModified`.
+        It has the shape `actor on date`, the dates are in iso format,
+        so they sort in the right order.
+
+        Returns
+        -------
+        dict
+            A MongoDb aggregation expression.
+        """
+
+        return {
+            M_ELEM: [{M_SPLIT: [{M_ELEM: [f"""${N.modified}""", 0]}, ON]}, -1]
+        }
 
     @staticmethod
     def satisfies(record, criterion):
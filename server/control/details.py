@@ -7,7 +7,7 @@
 from config import Config as C, Names as N
 from control.utils import pick as G, E
 from control.html import HtmlElements as H
-from control.perm import checkTable
+from control.perm import checkTable, permRecordMany
 
 CT = C.tables
 
@@ -100,9 +100,16 @@ class Details:
 
         dtableObj = mkTable(context, dtable)
         drecords = db.getDetails(dtable, table, eid, sortKey=sortKey)
+        dtableObj.prefetchMasters(drecords)
+        dtableObj.prefetchWorkflow(drecords)
+        perms = permRecordMany(context, dtable, drecords)
         self.details[dtable] = (
             dtableObj,
-            tuple(drecord for drecord in drecords if dtableObj.readable(drecord)),
+            tuple(
+                drecord
+                for (drecord, perm) in zip(drecords, perms)
+                if dtableObj.readable(drecord, perm=perm)
+            ),
         )
 
     def wrap(self, readonly=False, showTable=None, showEid=None):
@@ -21,10 +21,13 @@ CF = C.workflow
 DEFAULT_TYPE = CT.defaultType
 CONSTRAINED = CT.constrained
 WITH_NOW = CT.withNow
+MAIN_TABLE = CT.userTables[0]
 WORKFLOW_TABLES = set(CT.userTables) | set(CT.userEntryTables)
 CASCADE_SPECS = CT.cascade
 
 WORKFLOW_FIELDS = CF.fields
+OVERVIEW_FIELDS = set(CT.overviewFields.values())
+OVERVIEW_VALUE_TABLES = OVERVIEW_FIELDS & set(CT.valueTables)
 
 REFRESH = CW.messages[N.refresh]
 LIMIT_JSON = CW.limitJson
@@ -235,7 +238,9 @@ class Field:
 
         Before saving, permissions and workflow conditions will be checked.
 
-        After saving, workflow information will be adjusted.
+        After saving, workflow information will be adjusted,
+        and so will the overview of contributions,
+        see `control.workflow.compute.Workflow.refreshOverview`.
 
         !!! caution
             If the `editors` field of an assessment or review is modified,
@@ -257,6 +262,7 @@ class Field:
 
         context = self.context
         db = context.db
+        wf = context.wf
         uid = self.uid
         eppn = self.eppn
         table = self.table
@@ -345,7 +351,11 @@ class Field:
                         good = False
 
         if table in WORKFLOW_TABLES and field in WORKFLOW_FIELDS:
-            recordObj.adjustWorkflow()
+            recordObj.adjustWorkflow(field=field)
+        elif table == MAIN_TABLE and field in OVERVIEW_FIELDS:
+            wf.refreshOverview(contribIds=[eid])
+        elif table in OVERVIEW_VALUE_TABLES:
+            wf.refreshOverview(crit={table: eid})
 
         return good
 
@@ -0,0 +1,170 @@
+"""Generation counters shared by all workers on a host.
+
+*   A small memory mapped file with a counter per value table,
+    and one for the workflow
+*   Cheap staleness checks for the value table caches and the overview cache
+"""
+
+import os
+import mmap
+import struct
+import fcntl
+
+from config import Config as C, Names as N
+from control.utils import pick as G, serverprint
+
+CB = C.base
+CT = C.tables
+
+GENERATION = CB.generation
+GENERATION_FILE = G(GENERATION, N.file)
+
+VALUE_TABLES = sorted(CT.valueTables)
+COUNTERS = VALUE_TABLES + [N.workflow]
+SLOT = struct.Struct("Q")
+SIZE = SLOT.size * len(COUNTERS)
+
+
+class Generation:
+    """Host-wide generation counters for the value tables.
+
+    Every worker keeps its own cache of the value tables,
+    see `control.db.Db.collect`.
+    When a worker changes a value table, it bumps the counter of that table.
+    Other workers compare the counters with the ones they have seen before,
+    which is a mere memory read.
+    Only if they differ, they need to ask the MongoDb what has changed.
+
+    There is also a counter for the workflow and overview tables,
+    which is bumped whenever they are written, see `control.db.Db.workflowChanged`.
+    The overview cache uses it, see `control.overviewcache.OverviewCache`.
+
+    The counters live in a memory mapped file, one unsigned 64-bit integer
+    per value table, followed by the one for the workflow.
+    There is a file per database, so that the test database and the development
+    database do not disturb each other.
+
+    !!! caution
+        The counters are only shared by processes on the same host.
+        The time stamps in the `collect` table in MongoDb remain the source of
+        truth. See `control.db.Db.recollect`.
+
+    !!! note
+        If the file cannot be opened, the counters are not available and
+        `read` will return `None`.
+        The app then falls back to consulting MongoDb on every request.
+    """
+
+    def __init__(self, database):
+        """## Initialization
+
+        Open (and create if needed) the counter file and map it into memory.
+
+        Parameters
+        ----------
+        database: string
+            The name of the MongoDb database that is served.
+        """
+
+        self.path = GENERATION_FILE.format(database)
+        """*string* The location of the counter file."""
+
+        self.mm = None
+        """*mmap* The memory map of the counter file."""
+
+        self.fd = None
+        """*int* The file descriptor of the counter file."""
+
+        path = self.path
+
+        try:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size != SIZE:
+                    os.ftruncate(fd, SIZE)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            self.mm = mmap.mmap(fd, SIZE, mmap.MAP_SHARED)
+            self.fd = fd
+        except OSError as err:
+            serverprint(f"""GENERATION: cannot use {path}: {err}""")
+
+    def read(self):
+        """Read the counters of all value tables.
+
+        Returns
+        -------
+        dict | None
+            Keyed by value table, valued by its counter.
+            `None` if the counters are not available.
+        """
+
+        mm = self.mm
+
+        if mm is None:
+            return None
+
+        return {
+            table: SLOT.unpack_from(mm, i * SLOT.size)[0]
+            for (i, table) in enumerate(VALUE_TABLES)
+        }
+
+    def counter(self, name):
+        """Read a single counter.
+
+        Parameters
+        ----------
+        name: string
+            A value table, or `workflow`.
+
+        Returns
+        -------
+        int | None
+            The counter.
+            `None` if the counters are not available.
+        """
+
+        mm = self.mm
+
+        if mm is None:
+            return None
+
+        return SLOT.unpack_from(mm, COUNTERS.index(name) * SLOT.size)[0]
+
+    def bump(self, tables):
+        """Increment the counters of some value tables, or of the workflow.
+
+        The file is locked during the increment, so that concurrent bumps
+        by several workers do not get lost.
+
+        Parameters
+        ----------
+        tables: iterable of string
+            The value tables that have changed, and/or `workflow`.
+
+        Returns
+        -------
+        dict | None
+            The new counters of the bumped tables.
+            `None` if the counters are not available.
+        """
+
+        mm = self.mm
+        fd = self.fd
+
+        if mm is None:
+            return None
+
+        result = {}
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            for (i, table) in enumerate(COUNTERS):
+                if table in tables:
+                    offset = i * SLOT.size
+                    value = SLOT.unpack_from(mm, offset)[0] + 1
+                    SLOT.pack_into(mm, offset, value)
+                    result[table] = value
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        return result
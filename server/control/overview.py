@@ -143,16 +143,108 @@ REVIEW_RANK = {stage: i for (i, stage) in enumerate(REVIEWED_STATUS)}
 
 ALL = """All countries"""
 
+SUPER_FIELDS = (REVIEWED1, REVIEWED2, R1RANK, R2RANK, N.r1Stage, N.r2Stage)
+"""Fields of overview records that only superusers get to see."""
+
+
+def overviewRecord(db, types, record):
+    """Compute the overview record of a contribution.
+
+    The overview record holds what the overview page shows of a contribution,
+    with values resolved to their titles, and with the ranks by which
+    the stages are sorted.
+    These records are stored in the overview table,
+    see `control.workflow.compute.Workflow.refreshOverview`.
+
+    Only the reviewers are left as ids, because how users are shown depends on
+    who is looking, see `control.auth.Auth.identity`.
+
+    Parameters
+    ----------
+    db: object
+        The `control.db.Db` singleton, for the value tables.
+    types: object
+        The `control.typ.types.Types` singleton, for the titles of values.
+    record: dict
+        The contribution and its workflow, as delivered by
+        `control.db.Db.bulkContribWorkflow`.
+
+    Returns
+    -------
+    dict
+    """
+
+    title = str(G(record, N.title))
+    contribId = G(record, N._id)
+
+    selected = G(record, N.selected)
+    aStage = G(record, N.aStage)
+    r2Stage = G(record, N.r2Stage)
+    if r2Stage in {N.reviewAccept, N.reviewReject}:
+        aStage = r2Stage
+    score = G(record, N.score)
+    assessed = ASSESSED_STATUS[aStage][0]
+    aRank = (G(ASSESSED_RANK, aStage, default=0), score or 0)
+    if aStage != N.reviewAccept:
+        score = None
+
+    countryId = G(record, N.country)
+    countryRep = types.country.titleStr(G(db.country, countryId))
+    yearRep = types.year.titleStr(G(db.year, G(record, N.year)))
+    typeRep = types.typeContribution.titleStr(
+        G(db.typeContribution, G(record, N.type))
+    )
+    cost = G(record, N.cost)
+
+    preR1Stage = G(record, N.r1Stage)
+    noReview = aStage is None or aStage in NO_REVIEW
+    inReview = aStage in IN_REVIEW
+    advReview = preR1Stage in ADVISORY_REVIEW
+    r1Stage = (
+        "noReview"
+        if noReview
+        else preR1Stage
+        if advReview
+        else "inReview"
+        if inReview
+        else "skipReview"
+    )
+    r2Stage = "noReview" if noReview else "inReview" if inReview else r2Stage
+
+    return {
+        N._id: contribId,
+        N.countryId: countryId,
+        N.bulk: "import" in record,
+        N._cn: countryRep,
+        N.country: countryRep,
+        N.year: yearRep,
+        N.type: typeRep,
+        N.title: title,
+        N.cost: cost,
+        N.assessed: assessed,
+        N.arank: aRank,
+        N.astage: aStage,
+        N.score: score,
+        N.selected: selected,
+        N.reviewerE: G(record, N.reviewerE),
+        N.reviewerF: G(record, N.reviewerF),
+        REVIEWED1: REVIEWED_STATUS[r1Stage][0],
+        REVIEWED2: REVIEWED_STATUS[r2Stage][0],
+        R1RANK: G(REVIEW_RANK, r1Stage, default=0),
+        R2RANK: G(REVIEW_RANK, r2Stage, default=0),
+        N.r1Stage: r1Stage,
+        N.r2Stage: r2Stage,
+    }
+
 
 class Overview:
-    def __init__(self, context):
+    def __init__(self, context, cache):
         self.context = context
+        self.cache = cache
 
         types = context.types
         self.bool3Obj = types.bool3
         self.countryType = types.country
-        self.yearType = types.year
-        self.typeType = types.typeContribution
         self.userType = types.user
 
     def getCountry(self, country):
@@ -186,74 +278,33 @@ class Overview:
         context = self.context
         db = context.db
         chosenCountryId = self.chosenCountryId
-        countryType = self.countryType
         userType = self.userType
-        yearType = self.yearType
-        typeType = self.typeType
         isSuperUser = self.isSuperUser
 
         users = db.user
 
         contribs = {}
-        for record in db.bulkContribWorkflow(chosenCountryId, bulk):
-            title = str(G(record, N.title))
+        for record in db.getOverview(chosenCountryId, bulk):
             contribId = G(record, N._id)
 
-            selected = G(record, N.selected)
-            aStage = G(record, N.aStage)
-            r2Stage = G(record, N.r2Stage)
-            if r2Stage in {N.reviewAccept, N.reviewReject}:
-                aStage = r2Stage
-            score = G(record, N.score)
-            assessed = ASSESSED_STATUS[aStage][0]
-            aRank = (G(ASSESSED_RANK, aStage, default=0), score or 0)
-            if aStage != N.reviewAccept:
-                score = None
-
-            countryRep = countryType.titleStr(G(db.country, G(record, N.country)))
-            yearRep = yearType.titleStr(G(db.year, G(record, N.year)))
-            typeRep = typeType.titleStr(G(db.typeContribution, G(record, N.type)))
-            cost = G(record, N.cost)
-
             contribRecord = {
-                N._id: contribId,
-                N._cn: countryRep,
-                N.country: countryRep,
-                N.year: yearRep,
-                N.type: typeRep,
-                N.title: title,
-                N.cost: cost,
-                N.assessed: assessed,
-                N.arank: aRank,
-                N.astage: aStage,
-                N.score: score,
-                N.selected: selected,
+                field: G(record, field)
+                for field in (
+                    N._id,
+                    N._cn,
+                    N.country,
+                    N.year,
+                    N.type,
+                    N.title,
+                    N.cost,
+                    N.assessed,
+                    N.astage,
+                    N.score,
+                    N.selected,
+                )
             }
+            contribRecord[N.arank] = tuple(G(record, N.arank))
             if isSuperUser:
-                preR1Stage = G(record, N.r1Stage)
-                noReview = aStage is None or aStage in NO_REVIEW
-                inReview = aStage in IN_REVIEW
-                advReview = preR1Stage in ADVISORY_REVIEW
-                r1Stage = (
-                    "noReview"
-                    if noReview
-                    else preR1Stage
-                    if advReview
-                    else "inReview"
-                    if inReview
-                    else "skipReview"
-                )
-                r2Stage = (
-                    "noReview"
-                    if noReview
-                    else "inReview"
-                    if inReview
-                    else G(record, N.r2Stage)
-                )
-                reviewed1 = REVIEWED_STATUS[r1Stage][0]
-                reviewed2 = REVIEWED_STATUS[r2Stage][0]
-                r1Rank = G(REVIEW_RANK, r1Stage, default=0)
-                r2Rank = G(REVIEW_RANK, r2Stage, default=0)
                 reviewer = {}
                 for kind in ("E", "F"):
                     reviewerId = G(record, getattr(N, f"reviewer{kind}"))
@@ -267,12 +318,7 @@ class Overview:
                     {
                         REVIEWER1: reviewer["E"],
                         REVIEWER2: reviewer["F"],
-                        REVIEWED1: reviewed1,
-                        REVIEWED2: reviewed2,
-                        R1RANK: r1Rank,
-                        R2RANK: r2Rank,
-                        N.r1Stage: r1Stage,
-                        N.r2Stage: r2Stage,
+                        **{field: G(record, field) for field in SUPER_FIELDS},
                     }
                 )
             contribs[contribId] = contribRecord
@@ -283,6 +329,43 @@ class Overview:
         return self.bool3Obj.toDisplay(tri, markup=False)
 
     def wrap(self, asTsv=False):
+        """Deliver the overview page, possibly from cache.
+
+        See `control.overviewcache.OverviewCache`.
+
+        Parameters
+        ----------
+        asTsv: boolean, optional `False`
+            Whether to deliver the page as a tab separated file.
+
+        Returns
+        -------
+        string(html) | response
+        """
+
+        context = self.context
+        db = context.db
+        auth = context.auth
+        cache = self.cache
+
+        key = (
+            auth.groupRep(),
+            G(auth.user, N.country),
+            tuple(
+                request.args.get(arg, E)
+                for arg in (N.country, N.bulk, N.sortcol, N.reverse, N.groups)
+            ),
+            asTsv,
+        )
+        stamp = cache.stamp(db)
+        page = cache.get(key, stamp)
+        if page is None:
+            page = self.compose(asTsv=asTsv)
+            cache.put(key, stamp, page)
+
+        return make_response(*page) if asTsv else page
+
+    def compose(self, asTsv=False):
         context = self.context
         db = context.db
         auth = context.auth
@@ -508,7 +591,7 @@ class Overview:
                 "Content-Encoding": "identity",
             }
             tsv = f"""\ufeff{headerLine}\n{NL.join(material)}""".encode("""utf_16_le""")
-            data = make_response(tsv, headers)
+            data = (tsv, headers)
         else:
             data = E.join(material)
 
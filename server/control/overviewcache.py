@@ -0,0 +1,195 @@
+"""Caching of overview pages across requests.
+
+*   A bounded LRU cache per worker
+*   Validation by the workflow generation counter
+*   Hit and miss counters
+"""
+
+import os
+from collections import OrderedDict
+
+from config import Config as C, Names as N
+from control.utils import pick as G, NL
+
+CB = C.base
+
+OVERVIEW_CACHE = CB.overviewCache
+SIZE = G(OVERVIEW_CACHE, N.size)
+METRICS = G(OVERVIEW_CACHE, N.metrics)
+
+SINGLE_HOST = G(CB.generation, N.singleHost)
+
+COUNTERS = (
+    (N.hits, "Overview pages that were served from the cache."),
+    (N.misses, "Overview pages that had to be composed."),
+)
+
+
+class OverviewCache:
+    """Keeps recently composed overview pages.
+
+    The overview page, see `control.overview.Overview`, is the most visited page
+    during selection rounds, and composing it means grouping and formatting
+    every contribution.
+    But its contents only change when workflow changes, or when a value table
+    changes.
+
+    A page is kept under a key that consists of all that it depends on
+    besides the data:
+
+    *   the permission group of the current user,
+        which determines whether (s)he is a superuser or a coordinator;
+    *   the country of the current user,
+        which is the chosen country if no country is asked for;
+    *   the request arguments: country, bulk, sort column, reverse and groups;
+    *   whether the page is asked for as tab separated file.
+
+    With the page we keep a stamp: the workflow counter of
+    `control.generation.Generation`, which is bumped by all workers whenever
+    they write workflow or overview records, see `control.db.Db.workflowChanged`,
+    together with the versions of the value tables of this worker,
+    see `control.db.Db.versions`.
+    A page is only served from the cache if its stamp is still current.
+
+    The pages are kept in least-recently-used order;
+    when the cache is full, the least recently used page is evicted,
+    see `size` under `overviewCache` in base.yaml.
+
+    !!! caution
+        If the workflow counter is not available, or if the workers do not run
+        on a single host, see `generation` in base.yaml,
+        we cannot see the changes made by other workers,
+        and pages are not cached at all.
+
+    !!! caution
+        Every worker has its own cache, and the cache is not thread safe,
+        like the rest of the app.
+    """
+
+    def __init__(self):
+        """## Initialization
+
+        The cache starts empty.
+        """
+
+        self.pages = OrderedDict()
+        """*OrderedDict* The cached pages, keyed by the circumstances of the page,
+        valued by their stamp and the page itself,
+        the most recently used ones at the end.
+        """
+
+        self.counts = {counter: 0 for (counter, description) in COUNTERS}
+        """*dict* The number of hits and misses so far."""
+
+    @staticmethod
+    def stamp(db):
+        """The current stamp of the data that overview pages depend on.
+
+        Parameters
+        ----------
+        db: object
+            The `control.db.Db` singleton.
+
+        Returns
+        -------
+        tuple | `None`
+            `None` if pages cannot be cached.
+        """
+
+        if not SIZE or not SINGLE_HOST:
+            return None
+
+        counter = db.generation.counter(N.workflow)
+        if counter is None:
+            return None
+
+        return (counter, tuple(sorted(db.versions.items())))
+
+    def get(self, key, stamp):
+        """Look up a page in the cache.
+
+        Parameters
+        ----------
+        key: tuple
+            The circumstances of the page.
+        stamp: tuple | `None`
+            The current stamp, see `OverviewCache.stamp`.
+
+        Returns
+        -------
+        mixed | `None`
+            The page, if it is in the cache and its stamp is current.
+        """
+
+        pages = self.pages
+        counts = self.counts
+
+        if stamp is not None and key in pages:
+            (pageStamp, page) = pages[key]
+            if pageStamp == stamp:
+                pages.move_to_end(key)
+                counts[N.hits] += 1
+                return page
+            del pages[key]
+
+        counts[N.misses] += 1
+        return None
+
+    def put(self, key, stamp, page):
+        """Put a page in the cache.
+
+        If the cache gets too full, the least recently used pages are evicted.
+
+        Parameters
+        ----------
+        key: tuple
+            The circumstances of the page.
+        stamp: tuple | `None`
+            The stamp of the data from which the page has been composed,
+            taken before composing it.
+            If `None`, the page is not cached.
+        page: mixed
+        """
+
+        pages = self.pages
+
+        if stamp is None:
+            return
+
+        pages[key] = (stamp, page)
+        pages.move_to_end(key)
+
+        while len(pages) > SIZE:
+            pages.popitem(last=False)
+
+    def prometheus(self):
+        """Export the counters in the Prometheus text format.
+
+        Returns
+        -------
+        string
+        """
+
+        worker = os.getpid()
+        counts = self.counts
+
+        lines = []
+        for (counter, description) in COUNTERS:
+            name = f"{METRICS}_{counter}_total"
+            lines.extend(
+                (
+                    f"# HELP {name} {description}",
+                    f"# TYPE {name} counter",
+                    f"""{name}{{{N.worker}="{worker}"}} {counts[counter]}""",
+                )
+            )
+        size = f"{METRICS}_size"
+        lines.extend(
+            (
+                f"# HELP {size} Pages in the cache.",
+                f"# TYPE {size} gauge",
+                f"""{size}{{{N.worker}="{worker}"}} {len(self.pages)}""",
+            )
+        )
+
+        return NL.join(lines) + NL
@@ -227,11 +227,6 @@ def permRecord(context, table, record):
 
     These attributes are returned as a `dict`.
     """
-    auth = context.auth
-    user = auth.user
-    uid = G(user, N._id)
-    group = auth.groupRep()
-    uCountry = G(user, N.country)
 
     cRecord = {}
     aRecord = {}
@@ -248,6 +243,111 @@ def permRecord(context, table, record):
         contribId = G(aRecord, N.contrib)
         cRecord = context.getItem(N.contrib, contribId)
 
+    return permFromMasters(context.auth, table, record, aRecord, cRecord)
+
+
+def permRecordMany(context, table, records):
+    """Determine record permissions for several records of the same table.
+
+    The results are the same as with `permRecord`, but the assessment and contrib
+    records on which the permissions depend are fetched in one query per table
+    (and only if they are not already in the request cache).
+    See `control.context.Context.prefetch`.
+
+    Parameters
+    ----------
+    context: object
+        The `control.context.Context` singleton.
+    table: string
+        The table of the records.
+    records: iterable of dict
+        The records whose permissions are needed.
+
+    Returns
+    -------
+    list of dict
+        The permissions of each record, in the same order as the records,
+        see `permRecord`.
+    """
+
+    records = list(records)
+
+    if table == N.assessment:
+        aRecords = {G(record, N._id): record for record in records}
+    elif table in {N.review, N.criteriaEntry, N.reviewEntry}:
+        aRecords = {
+            G(aRecord, N._id): aRecord
+            for aRecord in context.prefetch(
+                N.assessment, {G(record, N.assessment) for record in records}
+            )
+        }
+    else:
+        aRecords = {}
+
+    cRecords = (
+        {G(record, N._id): record for record in records}
+        if table == N.contrib
+        else {
+            G(cRecord, N._id): cRecord
+            for cRecord in context.prefetch(
+                N.contrib, {G(aRecord, N.contrib) for aRecord in aRecords.values()}
+            )
+        }
+        if aRecords
+        else {}
+    )
+
+    auth = context.auth
+    result = []
+
+    for record in records:
+        if table == N.contrib:
+            aRecord = {}
+            cRecord = record
+        elif table == N.assessment:
+            aRecord = record
+            cRecord = G(cRecords, G(record, N.contrib), default={})
+        elif table in {N.review, N.criteriaEntry, N.reviewEntry}:
+            aRecord = G(aRecords, G(record, N.assessment), default={})
+            cRecord = G(cRecords, G(aRecord, N.contrib), default={})
+        else:
+            aRecord = {}
+            cRecord = {}
+        result.append(permFromMasters(auth, table, record, aRecord, cRecord))
+
+    return result
+
+
+def permFromMasters(auth, table, record, aRecord, cRecord):
+    """Determine record permissions, given the master records.
+
+    See `permRecord`, which looks up the masters one by one, and `permRecordMany`,
+    which looks them up in bulk.
+
+    Parameters
+    ----------
+    auth: object
+        The `control.auth.Auth` singleton.
+    table: string
+        The table of the record.
+    record: dict
+        The record whose permissions are needed.
+    aRecord: dict
+        The assessment record to which the record is linked, if any.
+    cRecord: dict
+        The contrib record to which the record is linked, if any.
+
+    Returns
+    -------
+    dict
+        See `permRecord`.
+    """
+
+    user = auth.user
+    uid = G(user, N._id)
+    group = auth.groupRep()
+    uCountry = G(user, N.country)
+
     refCountry = G(cRecord, N.country)
     reviewerE = G(aRecord, N.reviewerE)
     reviewerF = G(aRecord, N.reviewerF)
@@ -0,0 +1,365 @@
+"""Instrumentation of the MongoDb commands.
+
+*   Counting and timing per label, table and command, per request
+*   Detection of the N+1 pattern
+*   Latency histograms per worker, exported in Prometheus format
+*   Timing of the fetches from cursors
+"""
+
+import os
+from bisect import bisect_left
+from time import perf_counter
+
+from bson.objectid import ObjectId
+
+from config import Config as C, Names as N
+from control.utils import pick as G, E, COMMA, NL
+
+CB = C.base
+CM = C.mongo
+
+M_MATCH = CM.match
+M_IN = CM.IN
+
+QUERY_LOG = CB.queryLog
+HEADERS = G(QUERY_LOG, N.headers)
+HEADER_COUNT = G(HEADERS, N.count)
+HEADER_TIME = G(HEADERS, N.time)
+HEADER_REPEATS = G(HEADERS, N.repeats)
+REPEATS = G(QUERY_LOG, N.repeats)
+BUCKETS = tuple(bound / 1000 for bound in G(QUERY_LOG, N.buckets))
+SLOW = G(QUERY_LOG, N.slow) / 1000
+METRICS = G(QUERY_LOG, N.metrics)
+
+
+def singleId(value):
+    """The id in a criterion, if it selects a single id.
+
+    Parameters
+    ----------
+    value: mixed
+        The value of a field in a criteria dict.
+
+    Returns
+    -------
+    ObjectId | None
+        The id if the value is an id or an `$in` list with a single id.
+    """
+
+    if type(value) is ObjectId:
+        return value
+    if type(value) is dict and len(value) == 1:
+        members = G(value, M_IN)
+        if type(members) in {list, tuple} and len(members) == 1:
+            (member,) = members
+            if type(member) is ObjectId:
+                return member
+    return None
+
+
+class QueryLog:
+    """Keeps a tally of the MongoDb commands of a single request.
+
+    All commands go through `control.db.Db.mongoCmd`, which reports them here.
+    The app starts the log before each request and stops it after it,
+    see `control.app.appFactory`.
+
+    When the same label fires a command at the same table for several
+    different ids, one id per command, we have the N+1 signature:
+    the ids could have been fetched in a single query.
+
+    !!! caution
+        The log is not thread safe, like the rest of the app, which relies on
+        workers that handle one request at a time.
+    """
+
+    def __init__(self):
+        """## Initialization
+
+        The log starts inactive: commands are only tallied between
+        `start` and `stop`.
+        """
+
+        self.active = False
+        """*boolean* Whether commands are being tallied."""
+
+        self.ops = {}
+        """*dict* Keyed by (label, table, command), valued by [count, seconds].
+
+        The seconds of a command that returns a cursor are only added
+        when the cursor is done, see `TimedCursor`.
+        """
+
+        self.ids = {}
+        """*dict* Keyed by (label, table, command), valued by the set of ids
+        in the criteria of those commands.
+        """
+
+    def start(self):
+        """Start a fresh tally. """
+
+        self.active = True
+        self.ops = {}
+        self.ids = {}
+
+    def stop(self):
+        """Stop tallying, but keep the tally for inspection. """
+
+        self.active = False
+
+    def log(self, label, table, command, args):
+        """Tally a single command, when it is issued.
+
+        Parameters
+        ----------
+        label, table, command: string
+            See `control.db.Db.mongoCmd`.
+        args: tuple
+            The arguments passed to the command.
+            If the first one is a criteria dict with a single id in it,
+            that id is remembered for the N+1 detection.
+            So is a single id in an `$in` list, and in the `$match` stage
+            that starts an aggregation pipeline.
+        """
+
+        if not self.active:
+            return
+
+        key = (label, table, command)
+        op = self.ops.setdefault(key, [0, 0])
+        op[0] += 1
+
+        crit = args[0] if args else None
+        if type(crit) is list:
+            crit = G(crit[0], M_MATCH) if crit and type(crit[0]) is dict else None
+        if type(crit) is dict:
+            ids = tuple(
+                eid for eid in (singleId(v) for v in crit.values()) if eid is not None
+            )
+            if ids:
+                self.ids.setdefault(key, set()).add(ids)
+
+    def spend(self, label, table, command, duration):
+        """Add the time of a command to the tally.
+
+        Parameters
+        ----------
+        label, table, command: string
+            See `control.db.Db.mongoCmd`.
+        duration: float
+            The time the command took, in seconds.
+        """
+
+        if not self.active:
+            return
+
+        op = self.ops.setdefault((label, table, command), [0, 0])
+        op[1] += duration
+
+    def count(self):
+        """The number of commands in the tally. """
+
+        return sum(op[0] for op in self.ops.values())
+
+    def time(self):
+        """The total time spent in the commands of the tally, in seconds. """
+
+        return sum(op[1] for op in self.ops.values())
+
+    def repeats(self):
+        """The operations that show the N+1 signature.
+
+        Returns
+        -------
+        dict
+            Keyed by (label, table, command), valued by the number of distinct
+            ids that have been queried one by one.
+            Only operations with at least `repeats` distinct ids (see base.yaml)
+            are reported.
+        """
+
+        return {
+            key: len(ids) for (key, ids) in self.ids.items() if len(ids) >= REPEATS
+        }
+
+    def headers(self):
+        """A summary of the tally in the form of response headers.
+
+        Returns
+        -------
+        dict
+            Header names as configured in base.yaml, with the number of commands,
+            the total time in milliseconds and the N+1 suspects.
+        """
+
+        return {
+            HEADER_COUNT: str(self.count()),
+            HEADER_TIME: f"{self.time() * 1000:.1f}",
+            HEADER_REPEATS: COMMA.join(
+                f"{label}.{table}.{command}={n}"
+                for ((label, table, command), n) in sorted(self.repeats().items())
+            )
+            or E,
+        }
+
+
+class QueryStats:
+    """Keeps latency histograms of the MongoDb commands of a worker.
+
+    Unlike `QueryLog`, these statistics accumulate over all requests
+    that the worker handles.
+    They are exported in the Prometheus text format,
+    see `control.app.appFactory`.
+
+    !!! caution
+        Every worker has its own histograms.
+        A scrape of the metrics reaches a single worker, which is identified
+        by its process id in the `worker` label.
+    """
+
+    def __init__(self):
+        """## Initialization
+
+        The histograms start empty.
+        """
+
+        self.histograms = {}
+        """*dict* Keyed by (label, table, command), valued by a list with
+        the number of commands per bucket (not cumulative),
+        the total time in seconds and the number of slow commands.
+        """
+
+    def observe(self, label, table, command, duration):
+        """Put a single command in its histogram.
+
+        Parameters
+        ----------
+        label, table, command: string
+            See `control.db.Db.mongoCmd`.
+        duration: float
+            The time the command took, in seconds.
+
+        Returns
+        -------
+        boolean
+            Whether the command was slow, see `slow` in base.yaml.
+        """
+
+        key = (label, table, command)
+        histogram = self.histograms.get(key, None)
+        if histogram is None:
+            histogram = [[0] * (len(BUCKETS) + 1), 0, 0]
+            self.histograms[key] = histogram
+
+        histogram[0][bisect_left(BUCKETS, duration)] += 1
+        histogram[1] += duration
+
+        isSlow = bool(SLOW) and duration >= SLOW
+        if isSlow:
+            histogram[2] += 1
+        return isSlow
+
+    def prometheus(self):
+        """Export the histograms in the Prometheus text format.
+
+        Returns
+        -------
+        string
+        """
+
+        worker = os.getpid()
+        bounds = [str(bound) for bound in BUCKETS] + ["+Inf"]
+
+        seconds = f"{METRICS}_seconds"
+        slow = f"{METRICS}_slow_total"
+        histogramLines = [
+            f"# HELP {seconds} Duration of MongoDb commands.",
+            f"# TYPE {seconds} histogram",
+        ]
+        slowLines = [
+            f"# HELP {slow} MongoDb commands that took longer than {SLOW} seconds.",
+            f"# TYPE {slow} counter",
+        ]
+
+        for ((label, table, command), histogram) in sorted(self.histograms.items()):
+            (counts, total, nSlow) = histogram
+            labels = COMMA.join(
+                f'{name}="{value}"'
+                for (name, value) in (
+                    (N.worker, worker),
+                    (N.label, label),
+                    (N.table, table),
+                    (N.command, command),
+                )
+            )
+            cumulative = 0
+            for (bound, n) in zip(bounds, counts):
+                cumulative += n
+                histogramLines.append(
+                    f"""{seconds}_bucket{{{labels},le="{bound}"}} {cumulative}"""
+                )
+            histogramLines.append(f"""{seconds}_sum{{{labels}}} {total}""")
+            histogramLines.append(f"""{seconds}_count{{{labels}}} {cumulative}""")
+            slowLines.append(f"""{slow}{{{labels}}} {nSlow}""")
+
+        return NL.join(histogramLines + slowLines) + NL
+
+
+class TimedCursor:
+    """Wraps a MongoDb cursor and times the fetches from it.
+
+    Only the time spent in fetching the next document counts,
+    not the time that the consumer spends on each document.
+    When the cursor is exhausted or closed, the time is reported, once.
+    """
+
+    def __init__(self, cursor, duration, report):
+        """## Initialization
+
+        Parameters
+        ----------
+        cursor: object
+            The cursor that is returned by the MongoDb command.
+        duration: float
+            The time spent in issuing the command.
+            For an aggregation, that includes fetching the first batch.
+        report: function
+            Called with the total duration when the cursor is done,
+            see `control.db.Db.mongoReport`.
+        """
+
+        self.cursor = cursor
+        self.duration = duration
+        self.report = report
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = perf_counter()
+        try:
+            record = next(self.cursor)
+        except StopIteration:
+            self.duration += perf_counter() - start
+            self.close()
+            raise
+        self.duration += perf_counter() - start
+        return record
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Close the cursor and report the time spent in it. """
+
+        report = self.report
+        if report is not None:
+            self.report = None
+            self.cursor.close()
+            report(self.duration)
@@ -60,6 +60,7 @@ class Record:
         withDetails=False,
         readonly=False,
         bodyMethod=None,
+        perm=None,
     ):
         """## Initialization
 
@@ -72,7 +73,7 @@ class Record:
         ----------
         tableObj: object
             See below.
-        eid, record, withDetails, readonly, bodyMethod
+        eid, record, withDetails, readonly, bodyMethod, perm
             See `control.table.Table.record`
         """
 
@@ -115,7 +116,7 @@ class Record:
         """*ObjectId* The id of the record.
         """
 
-        self.setPerm()
+        self.setPerm(perm=perm)
 
         self.setWorkflow()
         self.mayDelete = self.getDelPerm()
@@ -192,17 +193,23 @@ class Record:
 
         return db.dependencies(table, record)
 
-    def setPerm(self):
+    def setPerm(self, perm=None):
         """Compute permission info for this record.
 
         See `control.perm.permRecord`.
+
+        Parameters
+        ----------
+        perm: dict, optional `None`
+            Permission info that has already been computed,
+            e.g. by `control.perm.permRecordMany`.
         """
 
         context = self.context
         table = self.table
         record = self.record
 
-        self.perm = permRecord(context, table, record)
+        self.perm = permRecord(context, table, record) if perm is None else perm
 
     def setWorkflow(self):
         """Compute a workflow item for this record.
@@ -252,7 +259,7 @@ class Record:
 
         self.valid = valid
 
-    def adjustWorkflow(self, update=True, delete=False):
+    def adjustWorkflow(self, update=True, delete=False, field=None):
         """Recompute workflow information.
 
         When this record or some other record has changed, it could have had
@@ -275,6 +282,10 @@ class Record:
         delete: boolean, optional `False`
             If `True`, delete the workflow item and set the attribute `wfitem`
             to `None`
+        field: string, optional `None`
+            If given, only this field has changed, and only the parts of the
+            workflow item that depend on it are recomputed,
+            see `control.workflow.compute.Workflow.recomputeField`.
 
         Returns
         -------
@@ -291,7 +302,10 @@ class Record:
             wf.delete(contribId)
             self.wfitem = None
         else:
-            wf.recompute(contribId)
+            if field is None:
+                wf.recompute(contribId)
+            else:
+                wf.recomputeField(contribId, self.table, self.record, field)
             if update:
                 self.wfitem = context.getWorkflowItem(contribId, requireFresh=True)
 
@@ -0,0 +1,211 @@
+"""Caching of user content records across requests.
+
+*   A bounded LRU cache per worker
+*   Validation of cached records by their version stamps
+*   Hit, miss, stale and eviction counters
+"""
+
+import os
+from collections import OrderedDict
+
+from config import Config as C, Names as N
+from control.utils import pick as G, NL
+
+CB = C.base
+
+RECORD_CACHE = CB.recordCache
+SIZE = G(RECORD_CACHE, N.size)
+METRICS = G(RECORD_CACHE, N.metrics)
+
+COUNTERS = (
+    (N.hits, "Cached records that were still valid."),
+    (N.misses, "Records that were not in the cache."),
+    (N.stale, "Cached records that had changed."),
+    (N.evictions, "Records that were evicted because the cache was full."),
+)
+
+
+class RecordCache:
+    """Keeps recently used records of the user tables.
+
+    `control.context.Context.cache` only lives as long as a request.
+    But most records are read far more often than they change,
+    so it pays to keep them between requests.
+
+    The records are kept in least-recently-used order;
+    when the cache is full, the least recently used record is evicted,
+    see `size` under `recordCache` in base.yaml.
+
+    A cached record is never used without validation:
+    `control.db.Db.getItemsCached` fetches the version stamps of the records
+    in one query, and only the records whose stamps differ are fetched in full.
+
+    !!! caution
+        The version stamp of a record consists of its `version` field,
+        which every change through the app increments,
+        and the newest entry of its `modified` field.
+        Changes that are made directly in MongoDb touch neither.
+        After such changes, the cache should be cleared,
+        which happens when a sysadmin refreshes the caches or resets the workflow.
+
+    !!! caution
+        Every worker has its own cache, and the cache is not thread safe,
+        like the rest of the app.
+    """
+
+    def __init__(self):
+        """## Initialization
+
+        The cache starts empty.
+        """
+
+        self.records = OrderedDict()
+        """*OrderedDict* The cached records, keyed by (table, id),
+        the most recently used ones at the end.
+        """
+
+        self.counts = {counter: 0 for (counter, description) in COUNTERS}
+        """*dict* The number of hits, misses, stale records and evictions so far."""
+
+    @staticmethod
+    def stamp(record):
+        """The version stamp of a record.
+
+        The `modified` field holds the newest entry first,
+        see `control.utils.filterModified`.
+        That entry only has a precision of seconds, hence the `version` field,
+        see `control.db.Db.updateField`.
+
+        Parameters
+        ----------
+        record: dict
+
+        Returns
+        -------
+        tuple
+            The `version` field of the record and the first entry of its
+            `modified` field, `None` for what is missing.
+        """
+
+        modified = G(record, N.modified)
+        return (G(record, N.version), modified[0] if modified else None)
+
+    def get(self, table, eids):
+        """Look up records in the cache, without validating them.
+
+        Parameters
+        ----------
+        table: string
+            The table of the records.
+        eids: iterable of ObjectId
+            The ids of the records.
+
+        Returns
+        -------
+        dict
+            The cached records among them, keyed by id.
+        """
+
+        records = self.records
+
+        found = {}
+        for eid in eids:
+            key = (table, eid)
+            if key in records:
+                records.move_to_end(key)
+                found[eid] = records[key]
+        return found
+
+    def put(self, table, records):
+        """Put records in the cache.
+
+        If the cache gets too full, the least recently used records are evicted.
+
+        Parameters
+        ----------
+        table: string
+            The table of the records.
+        records: iterable of dict
+        """
+
+        cached = self.records
+
+        if not SIZE:
+            return
+
+        for record in records:
+            key = (table, G(record, N._id))
+            cached[key] = record
+            cached.move_to_end(key)
+
+        while len(cached) > SIZE:
+            cached.popitem(last=False)
+            self.counts[N.evictions] += 1
+
+    def drop(self, table, eids):
+        """Remove records from the cache.
+
+        Parameters
+        ----------
+        table: string
+            The table of the records.
+        eids: iterable of ObjectId
+            The ids of the records.
+        """
+
+        records = self.records
+
+        for eid in eids:
+            records.pop((table, eid), None)
+
+    def clear(self):
+        """Remove all records from the cache. """
+
+        self.records.clear()
+
+    def count(self, hits, misses, stale):
+        """Add to the counters.
+
+        Parameters
+        ----------
+        hits, misses, stale: int
+            See `counts`.
+        """
+
+        counts = self.counts
+
+        counts[N.hits] += hits
+        counts[N.misses] += misses
+        counts[N.stale] += stale
+
+    def prometheus(self):
+        """Export the counters in the Prometheus text format.
+
+        Returns
+        -------
+        string
+        """
+
+        worker = os.getpid()
+        counts = self.counts
+
+        lines = []
+        for (counter, description) in COUNTERS:
+            name = f"{METRICS}_{counter}_total"
+            lines.extend(
+                (
+                    f"# HELP {name} {description}",
+                    f"# TYPE {name} counter",
+                    f"""{name}{{{N.worker}="{worker}"}} {counts[counter]}""",
+                )
+            )
+        size = f"{METRICS}_size"
+        lines.extend(
+            (
+                f"# HELP {size} Records in the cache.",
+                f"# TYPE {size} gauge",
+                f"""{size}{{{N.worker}="{worker}"}} {len(self.records)}""",
+            )
+        )
+
+        return NL.join(lines) + NL
@@ -10,7 +10,7 @@ from flask import request
 from config import Config as C, Names as N
 from control.html import HtmlElements as H
 from control.utils import pick as G, E, ELLIPS, NBSP, ONE
-from control.perm import checkTable
+from control.perm import checkTable, permRecordMany
 from control.cust.factory_record import factory as recordFactory
 
 CP = C.perm
@@ -36,6 +36,17 @@ ASSESSMENT_STAGES = set(CW.assessmentStages)
 class Table:
     """Deals with tables."""
 
+    listFields = None
+    """*tuple* The fields that are needed to present a record in a list.
+
+    When records are listed as HTML, only their titles are shown,
+    and we need a few more fields to sort them and to check their permissions
+    and workflow conditions.
+    If a derived class declares these fields, `Table.wrap` fetches only those.
+
+    If `None`, the records are fetched in full.
+    """
+
     def __init__(self, context, table):
         """## Initialization
 
@@ -177,7 +188,13 @@ class Table:
         """
 
     def record(
-        self, eid=None, record=None, withDetails=False, readonly=False, bodyMethod=None,
+        self,
+        eid=None,
+        record=None,
+        withDetails=False,
+        readonly=False,
+        bodyMethod=None,
+        perm=None,
     ):
         """Factory function to wrap a record object around the data of a record.
 
@@ -200,6 +217,9 @@ class Table:
             `control.record.Record.body`.
             Some particular tables have their own implementation of `body()`
             and they may supply alternative body methods as well.
+        perm: dict, optional `None`
+            The permissions of the record, if they have already been computed.
+            See `control.perm.permRecordMany`.
 
         Returns
         -------
@@ -214,9 +234,10 @@ class Table:
             withDetails=withDetails,
             readonly=readonly,
             bodyMethod=bodyMethod,
+            perm=perm,
         )
 
-    def readable(self, record):
+    def readable(self, record, perm=None):
         """Is the record readable?
 
         !!! note
@@ -228,13 +249,16 @@ class Table:
         ----------
         record: dict
             The full record
+        perm: dict, optional `None`
+            The permissions of the record, if they have already been computed.
+            See `control.perm.permRecordMany`.
 
         Returns
         -------
         boolean
         """
 
-        return self.RecordClass(self, record=record).mayRead is not False
+        return self.RecordClass(self, record=record, perm=perm).mayRead is not False
 
     def insert(self, force=False):
         """Insert a new, (blank) record into the table.
@@ -303,6 +327,68 @@ class Table:
         else:
             wf.recompute(contribId)
 
+    def prefetchMasters(self, records):
+        """Put the master records of a list of records in the request cache.
+
+        The permissions of assessments depend on their contrib, and
+        the permissions of reviews and entries depend on their assessment
+        and its contrib. See `control.perm.permRecord`.
+        Instead of fetching them one by one when the records are checked,
+        we fetch them in two queries beforehand.
+        See `control.context.Context.prefetch`.
+
+        Parameters
+        ----------
+        records: iterable of dict
+            The records that are going to be checked.
+        """
+
+        context = self.context
+        table = self.table
+
+        if table == N.assessment:
+            context.prefetch(N.contrib, {G(record, N.contrib) for record in records})
+        elif table in {N.review, N.criteriaEntry, N.reviewEntry}:
+            aRecords = context.prefetch(
+                N.assessment, {G(record, N.assessment) for record in records}
+            )
+            context.prefetch(N.contrib, {G(aRecord, N.contrib) for aRecord in aRecords})
+
+    def prefetchWorkflow(self, records):
+        """Put the workflow items of a list of records in the request cache.
+
+        Every record belongs to a contrib, and the workflow item of that contrib
+        is needed to check the stage and readability of the record.
+        Instead of fetching them one by one, we fetch them in one query.
+        See `control.context.Context.prefetchWorkflow`.
+
+        !!! caution
+            For records in the entry tables, call `Table.prefetchMasters` first,
+            because their contrib is found through their assessment.
+
+        Parameters
+        ----------
+        records: iterable of dict
+            The records that are going to be checked.
+        """
+
+        context = self.context
+        table = self.table
+
+        if self.isMainTable:
+            contribIds = {G(record, N._id) for record in records}
+        elif table in {N.assessment, N.review}:
+            contribIds = {G(record, N.contrib) for record in records}
+        elif table in {N.criteriaEntry, N.reviewEntry}:
+            aRecords = context.prefetch(
+                N.assessment, {G(record, N.assessment) for record in records}
+            )
+            contribIds = {G(aRecord, N.contrib) for aRecord in aRecords}
+        else:
+            return
+
+        context.prefetchWorkflow(contribIds)
+
     def stage(self, record, table, kind=None):
         """Retrieve the workflow attribute `stage` from a record, if existing.
 
@@ -424,7 +510,21 @@ class Table:
         if request.args:
             params.update(request.args)
 
-        records = db.getList(table, titleSortkey, select=self.isMainTable, **params)
+        listFields = None if logical else self.listFields
+        records = db.getList(
+            table,
+            titleSortkey,
+            select=self.isMainTable,
+            fields=listFields,
+            **params,
+        )
+        self.prefetchMasters(records)
+        if (
+            logical
+            or table in SENSITIVE_TABLES
+            or action in {N.assess, N.review, N.reviewdone}
+        ):
+            self.prefetchWorkflow(records)
         if not logical:
             insertButton = self.insertButton() if self.withInsert(action) else E
             sep = NBSP if insertButton else E
@@ -447,11 +547,18 @@ class Table:
         recordsHtml = []
         nRecords = 0
         sensitive = table in SENSITIVE_TABLES
-        for record in records:
-            if not sensitive or self.readable(record) is not False:
+        perms = (
+            permRecordMany(context, table, records)
+            if sensitive or logical
+            else [None] * len(records)
+        )
+        for (record, perm) in zip(records, perms):
+            if not sensitive or self.readable(record, perm=perm) is not False:
                 nRecords += 1
                 if logical:
-                    recordsJson.append(self.record(record=record).wrapLogical())
+                    recordsJson.append(
+                        self.record(record=record, perm=perm).wrapLogical()
+                    )
                 else:
                     recordsHtml.append(
                         H.details(
@@ -35,19 +35,18 @@ class TypeBase:
     pattern: string(re)
         For text widgets, this is a regular expression that constrains what is legal
         input in the text input field.
-    needsContext: boolean
-        Whether methods of this type need to be supplied with the Context singleton.
 
     !!! note
         In order to compute the representation of a user, the Auth singleton inside the
         Context singleton is needed to detemine what parts of the user identifiaction
         the current user is allowed to see.
+        Types with values in other tables get the Context of the current request
+        through `control.typ.types.Types.bind`.
     """
 
     widgetType = None
     pattern = None
     rawType = None
-    needsContext = False
 
     @staticmethod
     def validationMsg(tp):
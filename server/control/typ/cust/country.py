@@ -13,9 +13,6 @@ Qc = H.icon(CW.unknown[N.country], asChar=True)
 class Country(Value):
     """Type class for countries."""
 
-    def __init__(self, context):
-        super().__init__(context)
-
     def titleStr(self, record, markup=True, **kwargs):
         """Puts the 2-letter iso code plus the flag characters in the title."""
 
@@ -12,9 +12,6 @@ Qq = H.icon(CW.unknown[N.generic], asChar=True)
 class Criteria(Value):
     """Type class for criteria."""
 
-    def __init__(self, context):
-        super().__init__(context)
-
     def titleStr(self, record, markup=True, **kwargs):
         """The title is the short criterion text."""
 
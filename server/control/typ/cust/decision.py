@@ -15,9 +15,6 @@ Qc = H.icon(CW.unknown[N.country], asChar=True)
 class Decision(Value):
     """Type class for decisions."""
 
-    def __init__(self, context):
-        super().__init__(context)
-
     def titleStr(self, record, markup=True, **kwargs):
         """The title string is a suitable icon plus the participle field."""
         decision = G(record, N.participle)
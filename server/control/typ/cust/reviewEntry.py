@@ -12,9 +12,6 @@ Qq = H.icon(CW.unknown[N.generic], asChar=True)
 class ReviewEntry(Master):
     """Type class for review entries."""
 
-    def __init__(self, context):
-        super().__init__(context)
-
     def titleStr(self, record, markup=True, **kwargs):
         """The title is a sequence number plus the short criterion text."""
 
@@ -11,9 +11,6 @@ Qq = H.icon(CW.unknown[N.generic], asChar=True)
 class Score(Value):
     """Type class for scores."""
 
-    def __init__(self, context):
-        super().__init__(context)
-
     def titleStr(self, record, markup=True, **kwargs):
         """Put the score and the level in the title."""
 
@@ -12,9 +12,6 @@ Qq = H.icon(CW.unknown[N.generic], asChar=True)
 class TypeContribution(Value):
     """Type class for contribution types."""
 
-    def __init__(self, context):
-        super().__init__(context)
-
     def titleStr(self, record, markup=True, **kwargs):
         """Put the main type and the sub type in the title."""
 
@@ -15,11 +15,6 @@ class User(Value):
         Do not reveal too many details to unauthenticated users.
     """
 
-    needsContext = True
-
-    def __init__(self, context):
-        super().__init__(context)
-
     def titleStr(self, record, markup=True, withRole=True, **kwargs):
         context = self.context
         auth = context.auth
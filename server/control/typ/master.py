@@ -8,6 +8,3 @@ class Master(Related):
     """Type class for types with values in master tables."""
 
     widgetType = N.master
-
-    def __init__(self, context):
-        self.context = context
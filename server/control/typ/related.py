@@ -41,20 +41,15 @@ def castObjectId(value):
 class Related(TypeBase):
     """Base class for types with values in other tables."""
 
-    needsContext = True
+    @property
+    def context(self):
+        """*object* The `control.context.Context` singleton of the current request.
 
-    def __init__(self, context):
-        """## Initialization
-
-        Parameters
-        ----------
-        context: object
-            See below.
+        Type objects live as long as the worker,
+        so they get the context from `control.typ.types.Types.bind`.
         """
 
-        self.context = context
-        """*object* A `control.context.Context` singleton.
-        """
+        return self.types.context
 
     def normalize(self, strVal):
         return strVal
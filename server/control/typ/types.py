@@ -80,31 +80,30 @@ class Types:
     throughout the application.
     """
 
-    def __init__(self, context):
+    def __init__(self):
         """## Initialization
 
         Creates type singletons for all data types.
 
+        This happens once per worker, before any request comes in.
+        The type singletons, and whatever they have computed,
+        are reused by all requests that the worker handles.
+
         Some types define operations that need access to
         `control.db.Db`, or `control.auth.Auth`.
-        The objects for these types will be passed the type singletons that need it,
-        so that they can in turn pass that to their methods.
+        They get those through the `control.context.Context` of the current request,
+        which is handed to the type singletons by `Types.bind`.
 
         The type singletons will be stored under an attribute named
         after the type, but starting with a lowercase letter.
+        """
 
-        Parameters
-        ----------
-        context: object
-            See below.
+        self.context = None
+        """*object* The `control.context.Context` singleton of the current request.
 
         It holds the `control.db.Db`, or `control.auth.Auth` singletons.
         """
 
-        self.context = context
-        """*object* A `control.context.Context` singleton.
-        """
-
         done = set()
 
         for (tp, TypeClass) in ALL_TYPES.items():
@@ -119,10 +118,31 @@ class Types:
             TypeClass = type(TypeName, (Base,), {})
             self.make(tp, TypeClass)
 
+    def bind(self, context):
+        """Hand the context of a new request to the type singletons.
+
+        !!! caution
+            The type singletons are shared by all requests of a worker,
+            which is fine as long as a worker handles one request at a time.
+
+        Parameters
+        ----------
+        context: object
+            A `control.context.Context` singleton.
+
+        Returns
+        -------
+        object
+            The Types singleton itself.
+        """
+
+        self.context = context
+        return self
+
     def make(self, tp, TypeClass):
         """Create a type singleton and register it.
 
-        An singleton of the given TypeClass is created with the right attributes.
+        An singleton of the given TypeClass is created.
         That singleton will be registered as an attribute in the Types class.
 
         Parameters
@@ -132,13 +152,7 @@ class Types:
         TypeClass: class
         """
 
-        context = self.context
-
-        atts = []
-        if TypeClass.needsContext:
-            atts.append(context)
-
-        typeObj = TypeClass(*atts)
+        typeObj = TypeClass()
         self.register(typeObj, tp)
 
     def register(self, typeObj, tp):
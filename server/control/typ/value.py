@@ -14,6 +14,12 @@ FILTER_THRESHOLD = CW.filterThreshold
 QQ = H.icon(CW.unknown[N.generic])
 Qq = H.icon(CW.unknown[N.generic], asChar=True)
 
+TITLE_DEPENDS = {N.user: (N.country, N.permissionGroup)}
+"""The value tables that show up in the titles of the values of other tables.
+
+The titles of users also depend on the permission group of the current user.
+"""
+
 
 class ConversionError(Exception):
     pass
@@ -24,19 +30,18 @@ class Value(Related):
 
     widgetType = N.related
 
-    def __init__(self, context):
+    def __init__(self):
         """## Initialization
 
-        Store a handle to the Context singleton.
-
-        Parameters
-        ----------
-        context: object
-            See below.
+        Value type singletons live as long as the worker,
+        so they can keep their edit widgets across requests.
         """
 
-        self.context = context
-        """*object* A `control.context.Context` singleton.
+        self.widgets = {}
+        """*dict* The edit widgets made so far, see `Value.widget`.
+
+        Keyed by the circumstances of the widget, valued by the versions of the
+        value tables it was made from, plus the parts of the widget.
         """
 
     def fromStr(self, editVal, constrain=None, uid=None, eppn=None, extensible=False):
@@ -107,17 +112,95 @@ class Value(Related):
         return val if val is None else str(val)
 
     def widget(self, val, multiple, extensible, constrain):
+        """Present an edit widget to choose values from a value table.
+
+        Making a widget means generating and sorting the titles of all eligible
+        values, which may be hundreds.
+        So the widget is kept, per constraint, permission group and kind of widget,
+        until one of the value tables it is made from is reloaded,
+        see `control.db.Db.versions`.
+
+        Only the values that are currently chosen look different in each widget;
+        their titles are generated again on top of the kept widget.
+
+        Parameters
+        ----------
+        val: ObjectId | list of ObjectId
+            The chosen value(s).
+        multiple: boolean
+            Whether more than one value may be chosen.
+        extensible: boolean | string
+            Whether new values may be added to the value table.
+        constrain: 2-tuple, optional `None`
+            See `control.db.Db.getValueRecords`.
+
+        Returns
+        -------
+        string(html)
+        """
+
         context = self.context
         db = context.db
+        auth = context.auth
         table = self.name
 
         if table == N.permissionGroup:
-            auth = context.auth
             user = auth.user
             group = G(user, N.group)
             groupRep = G(G(db.permissionGroup, group), N.rep)
         else:
             groupRep = None
+        viewer = auth.groupRep() if table in TITLE_DEPENDS else None
+
+        key = (constrain, groupRep, viewer, multiple, bool(extensible))
+        versions = tuple(
+            G(db.versions, aTable, default=0)
+            for aTable in (table, *G(TITLE_DEPENDS, table, default=()))
+        )
+        widgets = self.widgets
+        if key not in widgets or widgets[key][0] != versions:
+            widgets[key] = (
+                versions,
+                *self.widgetItems(multiple, extensible, constrain, groupRep),
+            )
+        (versions, filterControl, items) = widgets[key]
+
+        atts = dict(
+            markup=True,
+            clickable=True,
+            multiple=multiple,
+            active=val,
+            hideInActual=True,
+            hideBlockedUsers=True,
+        )
+        chosen = set(val or []) if multiple else {val}
+        return H.div(
+            filterControl
+            + ([] if multiple else [self.title(record={}, **atts)[1]])
+            + [
+                self.title(record=record, **atts)[1] if eid in chosen else formatted
+                for (eid, record, formatted) in items
+            ],
+            cls="wvalue",
+        )
+
+    def widgetItems(self, multiple, extensible, constrain, groupRep):
+        """Make the parts of an edit widget that do not depend on the chosen values.
+
+        See `Value.widget`.
+
+        Returns
+        -------
+        filterControl: list of string(html)
+            The filter controls of the widget, if it has many values.
+        items: list of tuple
+            For each value, in the order of the widget: its id, its record,
+            and its title as it looks when the value is not chosen.
+        """
+
+        context = self.context
+        db = context.db
+        table = self.name
 
         valueRecords = db.getValueRecords(table, constrain=constrain, upper=groupRep)
 
@@ -141,29 +224,24 @@ class Value(Related):
             markup=True,
             clickable=True,
             multiple=multiple,
-            active=val,
             hideInActual=True,
             hideBlockedUsers=True,
         )
-        results = (self.title(record=record, **atts) for record in valueRecords)
-        return H.div(
-            filterControl
-            + [
-                formatted
-                for (text, formatted) in (
-                    ([] if multiple else [self.title(record={}, **atts)])
-                    + (
-                        sorted(
-                            results,
-                            key=lambda x: x[0].lower(),
-                        )
-                        if type(valueRecords) is tuple
-                        else list(results)
-                    )
-                )
-            ],
-            cls="wvalue",
-        )
+
+        items = []
+        for record in valueRecords:
+            eid = G(record, N._id)
+            (text, formatted) = self.title(record=record, **atts)
+            if not text:
+                # hidden unless chosen, but then it should be in its proper place
+                text = self.title(
+                    record=record, active=[eid] if multiple else eid, **atts
+                )[0]
+            items.append((text, eid, record, formatted))
+        if type(valueRecords) is tuple:
+            items.sort(key=lambda x: x[0].lower())
+
+        return (filterControl, [item[1:] for item in items])
 
     def title(
         self,
@@ -82,6 +82,7 @@ so the only thing needed is to ask for that attribute with
 """
 
 from datetime import timedelta
+from itertools import product
 from flask import flash
 
 from config import Config as C, Names as N
@@ -108,9 +109,400 @@ TASKS = CF.tasks
 TASK_FIELDS = CF.taskFields
 STATUS_REP = CF.statusRep
 DECISION_DELAY = CF.decisionDelay
+PERMISSIONS_MAX = CF.permissionsMax
 
 datetime = Datetime()
 
+STAGES = (None, *STAGE_ATTS)
+"""All workflow stages, including the absence of a stage."""
+
+ASSIGN_FIELDS = {N.reviewerE, N.reviewerF}
+"""Assessment fields by which office users assign reviewers."""
+
+REMAINING = object()
+"""Stands for a limited amount of time left in `permissionRule`."""
+
+
+def readableRule(table, stage, r2Stage, isOur, isEdit, isReviewer, isCreator):
+    """Whether a record is readable because of workflow.
+
+    This is the rule behind `WorkflowItem.checkReadable`, where it is explained.
+    It is not evaluated on every record: at startup it is compiled into
+    the table `READABLE`.
+
+    Parameters
+    ----------
+    table: string
+        The table of the record.
+    stage: string
+        The workflow stage of the record.
+    r2Stage: string
+        The workflow stage of the final review.
+    isOur, isEdit, isReviewer: boolean
+        Permission flags of the current user, see `control.perm.permRecord`.
+    isCreator: boolean
+        Whether the current user is among the creators of the assessment.
+
+    Returns
+    -------
+    boolean | `None`
+    """
+
+    if table in {N.assessment, N.criteriaEntry}:
+        return (
+            True
+            if r2Stage == N.reviewAccept
+            else isOur
+            if stage
+            in {
+                N.submitted,
+                N.incompleteRevised,
+                N.completeRevised,
+                N.submittedRevised,
+            }
+            else isEdit
+        )
+
+    if table in {N.review, N.reviewEntry}:
+        return (
+            True
+            if r2Stage == N.reviewAccept
+            else isCreator or isOur
+            if stage
+            in {
+                N.reviewAdviseRevise,
+                N.reviewAdviseAccept,
+                N.reviewAdviseReject,
+                N.reviewRevise,
+                N.reviewReject,
+            }
+            or r2Stage in {N.reviewRevise, N.reviewReject}
+            else isReviewer or isEdit
+        )
+    return None
+
+
+def fixedRule(frozen, done, locked, isRecord, mayAssign):
+    """Whether a record or field is fixed because of workflow.
+
+    This is the rule behind `WorkflowItem.checkFixed`, where it is explained.
+    At startup it is compiled into the table `FIXED`.
+
+    Parameters
+    ----------
+    frozen, done, locked: boolean
+        Workflow attributes of the record.
+    isRecord: boolean
+        Whether we ask for the record as a whole, rather than for a field.
+    mayAssign: boolean
+        Whether the field assigns reviewers and the current user is an office user.
+
+    Returns
+    -------
+    boolean
+    """
+
+    if isRecord:
+        return frozen or done or locked
+
+    if frozen or done:
+        return True
+
+    if not locked:
+        return False
+
+    return not mayAssign
+
+
+def permissionRule(
+    task,
+    kind,
+    myKind,
+    locked,
+    done,
+    frozen,
+    mayAdd,
+    stage,
+    isOwn,
+    isCoord,
+    isSuper,
+    sameValue,
+    remaining,
+    aStage,
+    finalStage,
+    expertStage,
+    expertLater,
+):
+    """Whether a workflow task is permitted.
+
+    This is the rule behind `WorkflowItem.permission`, where it is explained.
+    Its outcomes are collected in the table `PERMISSIONS`.
+
+    Parameters
+    ----------
+    task: string
+        The task in question.
+    kind: string {`expert`, `final`} | `None`
+        The kind of review the task acts on, if any.
+    myKind: string {`expert`, `final`} | `None`
+        The kind of reviewer that the current user is, if any.
+    locked, done, frozen: boolean
+        Workflow attributes of the record that the task acts on.
+    mayAdd: boolean
+        Whether the current user may add a detail record.
+    stage: string
+        The workflow stage of the record that the task acts on.
+    isOwn: boolean
+        Whether the current user is among the creators of that record.
+    isCoord, isSuper: boolean
+        Whether the current user is national coordinator of the relevant country,
+        or a super user.
+    sameValue: boolean
+        Whether the field that the task sets already has the value it would set.
+    remaining: boolean | `REMAINING`
+        Whether there is time left to revoke a decision:
+        `True` for unlimited time, `REMAINING` for a limited amount of time.
+    aStage: string
+        For reviews: the workflow stage of the assessment.
+    finalStage, expertStage: string
+        For reviews: the workflow stages of the final and expert review.
+    expertLater: boolean
+        For reviews: whether the expert has decided after the assessment
+        has been (re)submitted.
+
+    Returns
+    -------
+    boolean | `REMAINING` | string
+    """
+
+    taskInfo = TASKS[task]
+    table = G(taskInfo, N.table)
+
+    forbidden = frozen or done
+
+    if forbidden:
+        if task == N.unselectContrib and table == N.contrib:
+            if remaining is True:
+                return "as intervention"
+            if remaining:
+                return remaining
+        if not remaining:
+            return False
+
+    if table == N.contrib:
+        if not isOwn and not isCoord and not isSuper:
+            return False
+
+        if task == N.startAssessment:
+            return not forbidden and isOwn and mayAdd
+
+        if sameValue:
+            return False
+
+        if not isCoord:
+            return False
+
+        answer = not frozen or remaining
+
+        if task == N.selectContrib:
+            return stage != N.selectYes and answer
+
+        if task == N.deselectContrib:
+            return stage != N.selectNo and answer
+
+        if task == N.unselectContrib:
+            return stage != N.selectNone and answer
+
+        return False
+
+    if table == N.assessment:
+        if forbidden:
+            return False
+
+        if task == N.startReview:
+            return not forbidden and mayAdd
+
+        if sameValue:
+            return False
+
+        if not isOwn:
+            return False
+
+        answer = not locked or remaining
+        if not answer:
+            return False
+
+        if task == N.submitAssessment:
+            return stage == N.complete and answer
+
+        if task == N.resubmitAssessment:
+            return stage == N.completeWithdrawn and answer
+
+        if task == N.submitRevised:
+            return stage == N.completeRevised and answer
+
+        if task == N.withdrawAssessment:
+            return (
+                stage in {N.submitted, N.submittedRevised}
+                and stage not in {N.incompleteWithdrawn, N.completeWithdrawn}
+                and answer
+            )
+
+        return False
+
+    if table == N.review:
+        if frozen:
+            return False
+
+        if done and not remaining:
+            return False
+
+        taskKind = G(taskInfo, N.kind)
+        if not kind or kind != taskKind or kind != myKind:
+            return False
+
+        answer = remaining or not done or remaining
+        if not answer:
+            return False
+
+        xExpertStage = N.expertReviewRevoke if expertStage is None else expertStage
+        xFinalStage = N.finalReviewRevoke if finalStage is None else finalStage
+        revision = finalStage == N.reviewRevise
+        zFinalStage = finalStage and not revision
+        submitted = aStage == N.submitted
+        submittedRevised = aStage == N.submittedRevised
+        mayDecideExpert = submitted and not finalStage or submittedRevised and revision
+
+        if sameValue:
+            if not revision:
+                return False
+
+        if (
+            task
+            in {
+                N.expertReviewRevise,
+                N.expertReviewAccept,
+                N.expertReviewReject,
+                N.expertReviewRevoke,
+            }
+            - {xExpertStage}
+        ):
+            return kind == N.expert and not zFinalStage and mayDecideExpert and answer
+
+        if (
+            task
+            in {
+                N.finalReviewRevise,
+                N.finalReviewAccept,
+                N.finalReviewReject,
+                N.finalReviewRevoke,
+            }
+            - {xFinalStage}
+        ):
+            return (
+                kind == N.final
+                and not not expertStage
+                and expertLater
+                and (
+                    ((not finalStage and submitted) or (revision and submittedRevised))
+                    or remaining
+                )
+                and answer
+            )
+
+        return False
+
+    return False
+
+
+def compileReadable():
+    """Compile `readableRule` into a table.
+
+    Returns
+    -------
+    dict
+        Keyed by (table, stage, r2Stage) for all sensitive tables and all
+        stages, valued by a bit mask with the outcomes of the rule for all
+        combinations of the flags `isOur`, `isEdit`, `isReviewer`, `isCreator`,
+        in that order of significance.
+    """
+
+    readable = {}
+    for table in SENSITIVE_TABLES:
+        for (stage, r2Stage) in product(STAGES, repeat=2):
+            mask = 0
+            for (i, flags) in enumerate(product((False, True), repeat=4)):
+                if readableRule(table, stage, r2Stage, *flags):
+                    mask |= 1 << i
+            readable[(table, stage, r2Stage)] = mask
+    return readable
+
+
+def compileFixed():
+    """Compile `fixedRule` into a table.
+
+    Returns
+    -------
+    dict
+        Keyed by all combinations of the (boolean) arguments of `fixedRule`,
+        valued by its outcome.
+    """
+
+    return {
+        flags: bool(fixedRule(*flags)) for flags in product((False, True), repeat=5)
+    }
+
+
+def compileDelays():
+    """Compile the delays of the workflow tasks into a table.
+
+    The delay of a task may depend on the role of the user,
+    see `WorkflowItem.permission`.
+
+    Returns
+    -------
+    dict
+        Keyed by (task, role), where role is one of `coord`, `sysadmin`,
+        `office`, `all`, valued by a timedelta or a boolean.
+    """
+
+    delays = {}
+    for (task, taskInfo) in TASKS.items():
+        delay = G(taskInfo, N.delay, False)
+        for role in (N.coord, N.sysadmin, N.office, N.all):
+            value = (
+                G(delay, role, G(delay, N.all, False))
+                if type(delay) is dict
+                else delay
+            )
+            delays[(task, role)] = (
+                timedelta(hours=value)
+                if type(value) is int
+                else value
+                if type(value) is bool
+                else False
+            )
+    return delays
+
+
+READABLE = compileReadable()
+"""*dict* The compiled `readableRule`."""
+
+FIXED = compileFixed()
+"""*dict* The compiled `fixedRule`."""
+
+DELAYS = compileDelays()
+"""*dict* The compiled delays of the workflow tasks."""
+
+PERMISSIONS = {}
+"""*dict* The outcomes of `permissionRule`, keyed by its arguments.
+
+The space of arguments is too large to compile in advance,
+but only a small part of it occurs in practice.
+So this table is filled when an outcome is needed for the first time.
+It is emptied when it exceeds `permissionsMax` in workflow.yaml.
+"""
+
 
 def execute(context, task, eid):
     """Executes a workflow task.
@@ -226,12 +618,45 @@ class WorkflowItem:
         """*dict* The  workflow attributes.
         """
 
+        self.sources = {}
+        """*dict* The sources of attributes within `data`, see `WorkflowItem.getWf`.
+
+        Keyed by (table, kind).
+        """
+
+        self.infos = {}
+        """*dict* The attribute values asked for, see `WorkflowItem.info`.
+
+        Keyed by (table, kind, attributes).
+        """
+
+        self.statuses = {}
+        """*dict* The status presentations, see `WorkflowItem.status`.
+
+        Keyed by (table, kind).
+        """
+
         self.myKind = self.myReviewerKind()
         """*dict* The kind of reviewer that the current user is.
 
         A user is `expert` reviewer or `final` reviewer, or `None`.
         """
 
+        self.readableRows = {}
+        """*dict* The rows of `READABLE` that apply to this item.
+
+        Keyed by (table, kind), valued by the bit mask of the row,
+        together with the arguments of `readableRule` that do not depend
+        on the record.
+        """
+
+        self.fixedRows = {}
+        """*dict* The outcomes of `FIXED` that apply to this item.
+
+        Keyed by (table, kind), valued by the fixity of the record,
+        of an ordinary field and of a field in `ASSIGN_FIELDS`.
+        """
+
     def getKind(self, table, record):
         """Determine whether a review(Entry) is `expert` or `final`.
 
@@ -336,12 +761,23 @@ class WorkflowItem:
 
         Returns
         -------
-        generator
-            Yields attribute values, corresponding to `*atts`.
+        tuple
+            The attribute values, corresponding to `*atts`.
+
+        !!! note "Memoized"
+            A workflow item does not change, so every combination of
+            table, kind and attributes is looked up only once.
         """
 
+        key = (table, kind, atts)
+        infos = self.infos
+        if key in infos:
+            return infos[key]
+
         thisData = self.getWf(table, kind=kind)
-        return (G(thisData, att) for att in atts)
+        values = tuple(G(thisData, att) for att in atts)
+        infos[key] = values
+        return values
 
     def checkReadable(self, recordObj):
         """Whether a record is readable because of workflow.
@@ -397,6 +833,10 @@ class WorkflowItem:
             Whether a contribution is readable does not depend on the
             workflow, only on the normal rules.
 
+        !!! note "Compiled"
+            The rules are in `readableRule`, but they are looked up
+            in the table `READABLE` that has been compiled from them.
+
         Parameters
         ----------
         recordObj: object
@@ -422,46 +862,56 @@ class WorkflowItem:
 
         kind = recordObj.kind
         perm = recordObj.perm
-        uid = self.uid
 
-        (stage,) = self.info(table, N.stage, kind=kind)
+        row = self.readableRows.get((table, kind), None)
+        if row is None:
+            row = self.readableRow(table, kind)
+            self.readableRows[(table, kind)] = row
 
-        if table in {N.assessment, N.criteriaEntry}:
-            (r2Stage,) = self.info(N.review, N.stage, kind=N.final)
-            return (
-                True
-                if r2Stage == N.reviewAccept
-                else perm[N.isOur]
-                if stage
-                in {
-                    N.submitted,
-                    N.incompleteRevised,
-                    N.completeRevised,
-                    N.submittedRevised,
-                }
-                else perm[N.isEdit]
+        (mask, stage, r2Stage, isCreator) = row
+        isOur = perm[N.isOur]
+        isEdit = perm[N.isEdit]
+        isReviewer = perm[N.isReviewer]
+
+        if mask is None:
+            return readableRule(
+                table, stage, r2Stage, isOur, isEdit, isReviewer, isCreator
             )
 
+        index = isOur << 3 | isEdit << 2 | isReviewer << 1 | isCreator
+        return bool(mask >> index & 1)
+
+    def readableRow(self, table, kind):
+        """Look up the row of `READABLE` for a table and kind.
+
+        Parameters
+        ----------
+        table: string
+            A sensitive table.
+        kind: string {`expert`, `final`} | `None`
+            The kind of review, if any.
+
+        Returns
+        -------
+        tuple
+            The bit mask (`None` if the stages are not in `READABLE`),
+            the stage of the record, the stage of the final review,
+            and whether the current user is among the creators of the assessment.
+        """
+
+        uid = self.uid
+
+        (stage,) = self.info(table, N.stage, kind=kind)
+        (r2Stage,) = self.info(N.review, N.stage, kind=N.final)
+
         if table in {N.review, N.reviewEntry}:
             (creators,) = self.info(N.assessment, N.creators)
-            (r2Stage,) = self.info(N.review, N.stage, kind=N.final)
-            result = (
-                True
-                if r2Stage == N.reviewAccept
-                else uid in creators or perm[N.isOur]
-                if stage
-                in {
-                    N.reviewAdviseRevise,
-                    N.reviewAdviseAccept,
-                    N.reviewAdviseReject,
-                    N.reviewRevise,
-                    N.reviewReject,
-                }
-                or r2Stage in {N.reviewRevise, N.reviewReject}
-                else perm[N.isReviewer] or perm[N.isEdit]
-            )
-            return result
-        return None
+            isCreator = uid in (creators or ())
+        else:
+            isCreator = False
+
+        mask = G(READABLE, (table, stage, r2Stage))
+        return (mask, stage, r2Stage, isCreator)
 
     def checkFixed(self, recordObj, field=None):
         """Whether a record or field is fixed because of workflow.
@@ -481,6 +931,10 @@ class WorkflowItem:
             than the office users: only the office users can assign reviewers,
             i.e. only they can update `reviewerE` and `reviewerF` inn assessment fields.
 
+        !!! note "Compiled"
+            The rules are in `fixedRule`, but they are looked up
+            in the table `FIXED` that has been compiled from them.
+
         Parameters
         ----------
         recordObj: object
@@ -496,26 +950,44 @@ class WorkflowItem:
         boolean
         """
 
-        auth = self.auth
         table = recordObj.table
         kind = recordObj.kind
 
-        (frozen, done, locked) = self.info(table, N.frozen, N.done, N.locked, kind=kind)
+        row = self.fixedRows.get((table, kind), None)
+        if row is None:
+            row = self.fixedRow(table, kind)
+            self.fixedRows[(table, kind)] = row
 
-        if field is None:
-            return frozen or done or locked
+        return row[0] if field is None else row[2] if field in ASSIGN_FIELDS else row[1]
 
-        if frozen or done:
-            return True
+    def fixedRow(self, table, kind):
+        """Look up the outcomes of `FIXED` for a table and kind.
 
-        if not locked:
-            return False
+        Parameters
+        ----------
+        table: string
+            The table of the record.
+        kind: string {`expert`, `final`} | `None`
+            The kind of review, if any.
 
-        isOffice = auth.officeuser()
-        if isOffice and table == N.assessment:
-            return field not in {N.reviewerE, N.reviewerF}
+        Returns
+        -------
+        tuple
+            Whether the record is fixed, whether an ordinary field is fixed,
+            and whether a field in `ASSIGN_FIELDS` is fixed.
+        """
 
-        return True
+        auth = self.auth
+
+        (frozen, done, locked) = self.info(table, N.frozen, N.done, N.locked, kind=kind)
+        flags = (bool(frozen), bool(done), bool(locked))
+        mayAssign = table == N.assessment and bool(auth.officeuser())
+
+        return (
+            FIXED[(*flags, True, False)],
+            FIXED[(*flags, False, False)],
+            FIXED[(*flags, False, mayAssign)],
+        )
 
     def permission(self, task, kind=None):
         """Checks whether a workflow task is permitted.
@@ -567,23 +1039,60 @@ class WorkflowItem:
         kind: string {`expert`, `final`}, optional `None`
             Only if we want review attributes
 
+        !!! note "Compiled"
+            The rules are in `permissionRule`, and their outcomes are looked up
+            in the table `PERMISSIONS`. The delays are looked up in the table
+            `DELAYS` that has been compiled from workflow.yaml.
+
         Returns
         -------
         boolean | timedelta | string
         """
 
+        found = self.permissionKey(task, kind=kind)
+        if found is None:
+            return False
+
+        (key, remaining) = found
+        permitted = G(PERMISSIONS, key)
+        if permitted is None:
+            permitted = permissionRule(*key)
+            if len(PERMISSIONS) >= PERMISSIONS_MAX:
+                PERMISSIONS.clear()
+            PERMISSIONS[key] = permitted
+
+        return remaining if permitted is REMAINING else permitted
+
+    def permissionKey(self, task, kind=None):
+        """Gathers the arguments for `permissionRule`.
+
+        Parameters
+        ----------
+        task: string
+            An string consisting of the name of a task.
+        kind: string {`expert`, `final`}, optional `None`
+            Only if we want review attributes
+
+        Returns
+        -------
+        tuple | `None`
+            The arguments of `permissionRule`, followed by the actual
+            time remaining (or `False`).
+            `None` if the task is not permitted anyway.
+        """
+
         db = self.db
         auth = self.auth
         uid = self.uid
 
         if task not in TASKS:
-            return False
+            return None
 
         taskInfo = TASKS[task]
         table = G(taskInfo, N.table)
 
         if uid is None or table not in USER_TABLES:
-            return False
+            return None
 
         taskField = (
             N.selected
@@ -626,195 +1135,72 @@ class WorkflowItem:
             if taskField == N.decision:
                 value = G(db.decisionInv, value)
 
-        (contribId,) = self.info(N.contrib, N._id)
-
-        isOwn = creators and uid in creators
-        isCoord = countryId and auth.coordinator(countryId=countryId)
-        isSuper = auth.superuser()
+        isOwn = bool(creators) and uid in creators
+        isCoord = bool(countryId and auth.coordinator(countryId=countryId))
+        isSuper = bool(auth.superuser())
         isOffice = auth.officeuser()
         isSysadmin = auth.sysadmin()
 
-        decisionDelay = G(taskInfo, N.delay, False)
-        if decisionDelay:
-            if type(decisionDelay) is int:
-                decisionDelay = timedelta(hours=decisionDelay)
-            elif type(decisionDelay) is dict:
-                defaultDecisionDelay = G(decisionDelay, N.all, False)
-                decisionDelay = (
-                    G(decisionDelay, N.coord, defaultDecisionDelay)
-                    if isCoord
-                    else G(decisionDelay, N.sysadmin, defaultDecisionDelay)
-                    if isSysadmin
-                    else G(decisionDelay, N.office, defaultDecisionDelay)
-                    if isOffice
-                    else defaultDecisionDelay
-                )
-                if type(decisionDelay) is int:
-                    decisionDelay = timedelta(hours=decisionDelay)
-            elif type(decisionDelay) is not bool:
-                decisionDelay = False
+        role = (
+            N.coord
+            if isCoord
+            else N.sysadmin
+            if isSysadmin
+            else N.office
+            if isOffice
+            else N.all
+        )
+        decisionDelay = DELAYS[(task, role)]
 
-        justNow = now()
         remaining = False
         if decisionDelay and stageDate:
             if type(decisionDelay) is bool:
                 remaining = True
             else:
-                remaining = stageDate + decisionDelay - justNow
+                remaining = stageDate + decisionDelay - now()
                 if remaining <= timedelta(hours=0):
                     remaining = False
 
-        forbidden = frozen or done
-
-        if forbidden:
-            if (
-                task == N.unselectContrib
-                and table == N.contrib
-            ):
-                if remaining is True:
-                    return "as intervention"
-                if remaining:
-                    return remaining
-            if not remaining:
-                return False
-
-        if table == N.contrib:
-            if not isOwn and not isCoord and not isSuper:
-                return False
-
-            if task == N.startAssessment:
-                return not forbidden and isOwn and mayAdd
-
-            if value == taskValue:
-                return False
-
-            if not isCoord:
-                return False
-
-            answer = not frozen or remaining
-
-            if task == N.selectContrib:
-                return stage != N.selectYes and answer
-
-            if task == N.deselectContrib:
-                return stage != N.selectNo and answer
-
-            if task == N.unselectContrib:
-                return stage != N.selectNone and answer
-
-            return False
-
         if table == N.assessment:
-            forbidden = frozen or done
-            if forbidden:
-                return False
-
-            if task == N.startReview:
-                return not forbidden and G(mayAdd, myKind)
-
-            if value == taskValue:
-                return False
-
-            if uid not in creators:
-                return False
-
-            answer = not locked or remaining
-            if not answer:
-                return False
+            mayAdd = G(mayAdd, myKind)
 
-            if task == N.submitAssessment:
-                return stage == N.complete and answer
-
-            if task == N.resubmitAssessment:
-                return stage == N.completeWithdrawn and answer
-
-            if task == N.submitRevised:
-                return stage == N.completeRevised and answer
-
-            if task == N.withdrawAssessment:
-                return (
-                    stage in {N.submitted, N.submittedRevised}
-                    and stage not in {N.incompleteWithdrawn, N.completeWithdrawn}
-                    and answer
-                )
-
-            return False
+        aStage = None
+        finalStage = None
+        expertStage = None
+        expertLater = False
 
         if table == N.review:
-            if frozen:
-                return False
-
-            if done and not remaining:
-                return False
-
-            taskKind = G(taskInfo, N.kind)
-            if not kind or kind != taskKind or kind != myKind:
-                return False
-
-            answer = remaining or not done or remaining
-            if not answer:
-                return False
-
             (aStage, aStageDate) = self.info(N.assessment, N.stage, N.stageDate)
             (finalStage,) = self.info(table, N.stage, kind=N.final)
             (expertStage, expertStageDate) = self.info(
                 table, N.stage, N.stageDate, kind=N.expert
             )
-            xExpertStage = N.expertReviewRevoke if expertStage is None else expertStage
-            xFinalStage = N.finalReviewRevoke if finalStage is None else finalStage
-            revision = finalStage == N.reviewRevise
-            zFinalStage = finalStage and not revision
-            submitted = aStage == N.submitted
-            submittedRevised = aStage == N.submittedRevised
-            mayDecideExpert = (
-                submitted and not finalStage or submittedRevised and revision
+            expertLater = bool(expertStage) and (
+                not aStageDate
+                or expertStageDate is not None
+                and expertStageDate > aStageDate
             )
 
-            if value == taskValue:
-                if not revision:
-                    return False
-
-            if (
-                task
-                in {
-                    N.expertReviewRevise,
-                    N.expertReviewAccept,
-                    N.expertReviewReject,
-                    N.expertReviewRevoke,
-                }
-                - {xExpertStage}
-            ):
-                return (
-                    kind == N.expert and not zFinalStage and mayDecideExpert and answer
-                )
-
-            if (
-                task
-                in {
-                    N.finalReviewRevise,
-                    N.finalReviewAccept,
-                    N.finalReviewReject,
-                    N.finalReviewRevoke,
-                }
-                - {xFinalStage}
-            ):
-                return (
-                    kind == N.final
-                    and not not expertStage
-                    and (not aStageDate or expertStageDate > aStageDate)
-                    and (
-                        (
-                            (not finalStage and submitted)
-                            or (revision and submittedRevised)
-                        )
-                        or remaining
-                    )
-                    and answer
-                )
-
-            return False
-
-        return False
+        key = (
+            task,
+            kind,
+            myKind,
+            bool(locked),
+            bool(done),
+            bool(frozen),
+            bool(mayAdd),
+            stage,
+            isOwn,
+            isCoord,
+            isSuper,
+            value == taskValue,
+            remaining if type(remaining) is bool else REMAINING,
+            aStage,
+            finalStage,
+            expertStage,
+            expertLater,
+        )
+        return (key, remaining)
 
     def stage(self, table, kind=None):
         """Find the workflow stage that a record is in.
@@ -836,7 +1222,7 @@ class WorkflowItem:
             See above for the complete list.
         """
 
-        return list(self.info(table, N.stage, kind=kind))[0]
+        return self.info(table, N.stage, kind=kind)[0]
 
     def creators(self, table, kind=None):
         """Find the creators from a workflow related record.
@@ -854,7 +1240,7 @@ class WorkflowItem:
         (list of ObjectId)
         """
 
-        return list(self.info(table, N.creators, kind=kind))[0]
+        return self.info(table, N.creators, kind=kind)[0]
 
     def status(self, table, kind=None):
         """Present all workflow info and controls relevant to the record.
@@ -870,13 +1256,20 @@ class WorkflowItem:
         Returns
         -------
         string(html)
+
+        !!! note "Memoized"
+            The status of a table and kind is computed only once per item.
         """
 
-        eid = list(self.info(table, N._id, kind=kind))[0]
+        statuses = self.statuses
+        if (table, kind) in statuses:
+            return statuses[(table, kind)]
+
+        eid = self.info(table, N._id, kind=kind)[0]
         itemKey = f"""{table}/{eid}"""
         rButton = H.iconr(itemKey, "#workflow", msg=N.status)
 
-        return H.div(
+        status = H.div(
             [
                 rButton,
                 self.statusOverview(table, kind=kind),
@@ -884,6 +1277,8 @@ class WorkflowItem:
             ],
             cls="workflow",
         )
+        statuses[(table, kind)] = status
+        return status
 
     @staticmethod
     def isTask(table, field):
@@ -1068,7 +1463,7 @@ class WorkflowItem:
         if not uid or table not in USER_TABLES:
             return E
 
-        eid = list(self.info(table, N._id, kind=kind))[0]
+        eid = self.info(table, N._id, kind=kind)[0]
         taskParts = []
 
         allowedTasks = sorted(
@@ -1122,19 +1517,25 @@ class WorkflowItem:
         dict
         """
 
+        sources = self.sources
+        if (table, kind) in sources:
+            return sources[(table, kind)]
+
         data = self.data
         if table == N.contrib:
-            return data
-
-        data = G(data, N.assessment)
-        if table in {N.assessment, N.criteriaEntry}:
-            return data
-
-        if table in {N.review, N.reviewEntry}:
-            data = G(G(data, N.reviews), kind)
-            return data
+            source = data
+        else:
+            data = G(data, N.assessment)
+            source = (
+                data
+                if table in {N.assessment, N.criteriaEntry}
+                else G(G(data, N.reviews), kind)
+                if table in {N.review, N.reviewEntry}
+                else None
+            )
 
-        return None
+        sources[(table, kind)] = source
+        return source
 
     def myReviewerKind(self, reviewer=None):
         """Determine whether the current user is `expert` or `final`.
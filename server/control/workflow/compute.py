@@ -4,10 +4,18 @@
 *   Adjust workflow after user actions
 """
 
-import sys
+import os
+import multiprocessing
+from hashlib import md5
+from itertools import chain
+from time import sleep
 
-from config import Config as C, Names as N
+from bson import decode, encode
+
+from config import Config as C, Names as N, CONFIG_DIR, CONFIG_EXT
 from control.utils import getLast, pick as G, serverprint, creators
+from control.typ.types import Types
+from control import overview
 
 
 CB = C.base
@@ -25,7 +33,31 @@ WORKFLOW_TABLES_LIST = CT.userTables + CT.userEntryTables
 
 WORKFLOW_TABLES = set(WORKFLOW_TABLES_LIST)
 
-DEBUG = "5a1690a32179c013250d932a"
+M_GT = CM.gt
+M_GTE = CM.gte
+M_LTE = CM.lte
+
+BATCH_SIZE = CF.batchSize
+DEPENDENCIES = CF.dependencies
+VERIFY = CF.verify
+
+AUDIT = CF.audit
+AUDIT_BATCH_SIZE = G(AUDIT, N.batchSize)
+AUDIT_PAUSE = G(AUDIT, N.pause)
+
+PARALLEL = CF.parallel
+PROCESSES = G(PARALLEL, N.processes) or os.cpu_count() or 1
+MIN_CHUNK = G(PARALLEL, N.minChunk)
+
+SCHEMA_FILES = (
+    f"""{CONFIG_DIR}/{N.workflow}{CONFIG_EXT}""",
+    __file__,
+    overview.__file__,
+)
+"""The files that determine how workflow and the overview are computed.
+
+If they change, the workflow table has to be computed from scratch.
+"""
 
 
 class Workflow:
@@ -43,8 +75,8 @@ class Workflow:
     reviews. See `control.workflow.apply.WorkflowItem`.
     There it is defined how workflow information is *applied*.
 
-    At startup time, the workflow information is computed from scratch and stored
-    in the database.
+    At startup time, the workflow information is brought in sync with the data,
+    see `Workflow.syncWorkflow`.
 
     This class is about computing and managing the workflow information.
 
@@ -126,6 +158,14 @@ class Workflow:
         """*dict* Mapping of score ids to numeric scores.
         """
 
+        self.types = Types()
+        """*object* A `control.typ.types.Types` object.
+
+        Used for the titles of values in the overview table,
+        which do not depend on the current user.
+        See `Workflow.refreshOverview`.
+        """
+
         maxScoreByCrit = {}
         for record in scoreData:
             criteriaId = G(record, N.criteria)
@@ -146,7 +186,7 @@ class Workflow:
             We need the maximum to present a given score as a percentage.
         """
 
-    def initWorkflow(self, drop=False):
+    def initWorkflow(self, drop=False, parallel=False):
         """(Re)fills the workflow table.
 
         !!! caution
@@ -156,7 +196,8 @@ class Workflow:
             when workers start and restart, we do not want a big table
             operation to happen that is visible across workers.
 
-            When the server starts, we carry out this function once.
+            When the server starts, we only carry out this function if
+            `Workflow.syncWorkflow` cannot do it more cheaply.
 
         !!! hint "Gunicorn"
             On `gunicorn`, we start the server with `--preload`,
@@ -170,20 +211,38 @@ class Workflow:
             System administrators can trigger the workflow initialization
             by means of a button in the sidebar, only visible and executable by them.
 
+        !!! hint "Audit"
+            If you suspect that the workflow table has drifted out of sync,
+            it is cheaper to audit and repair it, see `Workflow.audit`.
+
         Parameters
         ----------
         drop: boolean
             If True, the complete table will first be dropped and then
             recreated.
             Otherwise, the table will merely be cleared.
+        parallel: boolean, optional `False`
+            If True, the contributions are divided over several processes,
+            see `Workflow.initParallel`.
 
         Returns
         -------
         The number of workflow records stored.
+
+        !!! note "Overview"
+            The overview table is filled afresh as well,
+            see `Workflow.refreshOverview`.
+
+        !!! note "Fingerprint"
+            Before reading the data, we take its fingerprint,
+            and after storing the workflow records, we store that fingerprint.
+            See `Workflow.syncWorkflow`.
         """
 
         db = self.db
 
+        fingerprint = self.fingerprint()
+
         if drop:
             if DEBUG_WORKFLOW:
                 serverprint("WORKFLOW: Drop exisiting table")
@@ -193,55 +252,272 @@ class Workflow:
                 serverprint("WORKFLOW: Clear exisiting table")
             db.clearWorkflow()
 
-        entries = {}
-        if DEBUG_WORKFLOW:
-            serverprint("WORKFLOW: Read user (entry) tables")
-        for table in WORKFLOW_TABLES:
-            entries[table] = db.entries(table)
+        slices = self.slices() if parallel else None
+        nWf = self.initParallel(slices) if slices else self.computeSlice()
+        self.refreshOverview()
 
+        db.setWorkflowFingerprint(fingerprint)
         if DEBUG_WORKFLOW:
-            serverprint("WORKFLOW: Link masters and details")
-        self.aggregate(entries)
+            serverprint(f"WORKFLOW: Initialization done: {nWf} workflow records")
+        return nWf
+
+    def slices(self):
+        """Divide the contributions into slices for parallel processing.
+
+        The number of slices is the number of processes, see `parallel` in
+        workflow.yaml, but every slice gets at least a minimum number of
+        contributions.
+
+        Returns
+        -------
+        list of tuple | None
+            For each slice the lowest and the highest contrib id in it.
+            `None` if a single process will do.
+        """
+
+        db = self.db
+
+        contribIds = db.getIds(MAIN_TABLE)
+        nContribs = len(contribIds)
+        nSlices = min(PROCESSES, nContribs // MIN_CHUNK)
+        if nSlices <= 1:
+            return None
+
+        size = -(-nContribs // nSlices)
+        return [
+            (contribIds[i], contribIds[min(i + size, nContribs) - 1])
+            for i in range(0, nContribs, size)
+        ]
+
+    def initParallel(self, slices):
+        """Compute and store the workflow of slices of contributions in parallel.
+
+        Every slice is handled by a forked worker process, see `initSlice`.
+        The workers inherit this object, including the value tables of the
+        `control.db.Db` object, but they make their own MongoDb connection.
+        Each worker fetches the records of its own slice,
+        and stores the workflow records of its own slice.
+
+        !!! caution
+            The MongoDb connection of the parent is closed before forking,
+            as we do before `gunicorn` forks its workers.
+            It will be reopened when it is needed.
+
+        Parameters
+        ----------
+        slices: list of tuple
+            See `Workflow.slices`.
+
+        Returns
+        -------
+        The number of workflow records stored.
+        """
+
+        db = self.db
 
         if DEBUG_WORKFLOW:
-            serverprint("WORKFLOW: Compute workflow info")
-        wfRecords = []
-        for mainRecord in G(entries, MAIN_TABLE, default={}).values():
-            info = self.computeWorkflow(record=mainRecord)
-            if info:
-                wfRecords.append(info)
-
-        nWf = len(wfRecords)
-        if DEBUG_WORKFLOW:
-            serverprint(f"WORKFLOW: Store {nWf} workflow records")
-        # check whether the wfRecords are distinct objects, otherwise we'll
-        # get a bulk-write error
-        wfIds = {}
-        for record in wfRecords:
-            wfIds.setdefault(id(record), []).append(record)
-        if DEBUG_WORKFLOW:
-            serverprint("WORKFLOW: CHECKING DUPLICATES: ...")
-        good = True
-        for (wfId, records) in wfIds.items():
-            if len(records) > 1:
-                if DEBUG_WORKFLOW:
-                    serverprint(
-                        f"WORKFLOW: DUPLICATE OBJECTS TO BE INSERTED ({len(records)} x:"
-                    )
-                    serverprint(records[0])
-                good = False
-        if good:
+            serverprint(f"WORKFLOW: Compute in {len(slices)} processes")
+
+        db.mongoClose()
+        context = multiprocessing.get_context("fork")
+        with context.Pool(
+            len(slices), initializer=initWorker, initargs=(self,)
+        ) as pool:
+            nWfs = pool.map(initSlice, slices)
+
+        return sum(nWfs)
+
+    def computeSlice(self, low=None, high=None):
+        """Compute and store the workflow of a slice of contributions.
+
+        We walk through the contributions in the order of their ids,
+        in batches of a fixed size, see `batchSize` in workflow.yaml.
+        For each batch we fetch the contributions and their assessments,
+        reviews and entries, by their (indexed) foreign keys,
+        and we store the resulting workflow records in one unordered bulk insert.
+
+        So the memory needed does not grow with the number of contributions.
+
+        Parameters
+        ----------
+        low, high: ObjectId, optional `None`
+            The lowest and highest id of the contributions in the slice.
+            If not given, the slice is unbounded at that side.
+
+        Returns
+        -------
+        The number of workflow records stored.
+        """
+
+        db = self.db
+
+        nWf = 0
+        crit = {} if low is None else {M_GTE: low}
+
+        while True:
+            if high is not None:
+                crit[M_LTE] = high
+            contribIds = db.getIds(MAIN_TABLE, crit=crit, limit=BATCH_SIZE)
+            if not contribIds:
+                break
+
+            fullItems = self.getFullItems(contribIds)
+            wfRecords = [
+                info
+                for info in (
+                    self.computeWorkflow(record=G(fullItems, contribId, default={}))
+                    for contribId in contribIds
+                )
+                if info
+            ]
+            if wfRecords:
+                db.insertWorkflowMany(wfRecords, ordered=False)
+            nWf += len(wfRecords)
             if DEBUG_WORKFLOW:
-                serverprint("WORKFLOW: NO DUPLICATES")
-        else:
-            sys.exit(4)
+                serverprint(f"WORKFLOW: Stored {nWf} workflow records")
+
+            crit = {M_GT: contribIds[-1]}
+
+        return nWf
+
+    def syncWorkflow(self):
+        """Brings the workflow table in sync with the data, as cheaply as possible.
+
+        This is what happens when the server starts.
+        We compare the fingerprint of the current data with the fingerprint
+        that has been stored with the workflow table.
+
+        *   If they are equal, the workflow table is up to date and we are done.
+        *   If only the data has changed by insertions and modifications,
+            we recompute the workflow of the affected contributions only.
+        *   In all other cases, we compute the workflow table from scratch,
+            see `Workflow.initWorkflow`.
+
+        !!! caution
+            Changes that are made directly in MongoDb, bypassing the app,
+            might go unnoticed, see `control.db.Db.tableStats`.
+            In that case, force a rebuild by means of the build script
+            (`build.sh dbwf`) or the sysadmin button in the sidebar.
+
+        Returns
+        -------
+        The number of workflow records stored.
+        """
+
+        db = self.db
+
+        fingerprint = self.fingerprint()
+        previous = db.getWorkflowFingerprint()
+
+        if previous is None or G(previous, N.schema) != G(fingerprint, N.schema):
+            if DEBUG_WORKFLOW:
+                serverprint("WORKFLOW: No valid fingerprint: rebuild")
+            return self.initWorkflow(drop=True, parallel=True)
+
+        if previous == fingerprint:
+            if DEBUG_WORKFLOW:
+                serverprint("WORKFLOW: Fingerprint matches: nothing to do")
+            return 0
+
+        contribIds = self.changedContribs(G(previous, N.data), G(fingerprint, N.data))
+        if contribIds is None:
+            if DEBUG_WORKFLOW:
+                serverprint("WORKFLOW: Records have been deleted: rebuild")
+            return self.initWorkflow(drop=True, parallel=True)
 
-        if wfRecords:
-            db.insertWorkflowMany(wfRecords)
         if DEBUG_WORKFLOW:
-            serverprint("WORKFLOW: Initialization done")
+            serverprint(f"WORKFLOW: Recompute {len(contribIds)} workflow records")
+        nWf = self.recomputeMany(contribIds)
+        db.setWorkflowFingerprint(fingerprint)
         return nWf
 
+    def fingerprint(self):
+        """Compute a fingerprint of everything the workflow table depends on.
+
+        Returns
+        -------
+        dict
+            `schema`
+            :   a hash of the workflow config, the code that computes workflow,
+                the decision and score values, and the criteria that count
+                for each contribution type, which depend on the criteria,
+                the contribution types and the packages, and on the date;
+            `data`
+            :   for each table with user content, a summary as given by
+                `control.db.Db.tableStats`.
+        """
+
+        db = self.db
+
+        schema = md5()
+        for path in SCHEMA_FILES:
+            with open(path, "rb") as fh:
+                schema.update(fh.read())
+        for mapping in (self.decisions, self.decisionParticiple, self.scoreMapping):
+            schema.update(repr(sorted(mapping.items())).encode())
+        typeCriteria = sorted(
+            (tp, sorted(criteria)) for (tp, criteria) in db.typeCriteria.items()
+        )
+        schema.update(repr(typeCriteria).encode())
+
+        return {
+            N.schema: schema.hexdigest(),
+            N.data: {table: db.tableStats(table) for table in WORKFLOW_TABLES_LIST},
+        }
+
+    def changedContribs(self, previous, current):
+        """Determine the contributions whose workflow may have changed.
+
+        Parameters
+        ----------
+        previous: dict
+            The data part of the stored fingerprint.
+        current: dict
+            The data part of the current fingerprint.
+
+        Returns
+        -------
+        set of ObjectId | None
+            The ids of the contributions that have changed themselves or whose
+            assessments, reviews or entries have changed.
+            `None` if records have been deleted: then we cannot tell which
+            contributions are affected.
+        """
+
+        db = self.db
+
+        contribIds = set()
+        assessmentIds = set()
+
+        for table in WORKFLOW_TABLES_LIST:
+            before = G(previous, table, default={})
+            after = G(current, table, default={})
+            if before == after:
+                continue
+
+            maxId = G(before, N.maxId)
+            entries = db.changedEntries(table, before)
+            nNew = sum(1 for eid in entries if maxId is None or eid > maxId)
+            if G(after, N.count) != G(before, N.count, default=0) + nNew:
+                return None
+
+            for (eid, record) in entries.items():
+                if table == MAIN_TABLE:
+                    contribIds.add(eid)
+                elif table in CT.userTables:
+                    contribIds.add(G(record, N.contrib))
+                else:
+                    assessmentIds.add(G(record, INTER_TABLE))
+
+        assessmentIds.discard(None)
+        if assessmentIds:
+            crit = {N._id: db.inCrit(assessmentIds)}
+            for record in db.entries(INTER_TABLE, crit).values():
+                contribIds.add(G(record, N.contrib))
+
+        contribIds.discard(None)
+        return contribIds
+
     def insert(self, contribId):
         """Computes and stores workflow for a single contribution.
 
@@ -258,6 +534,7 @@ class Workflow:
         if DEBUG_WORKFLOW:
             serverprint(f"WORKFLOW: New workflow info {contribId}")
         db.insertWorkflow(info)
+        self.refreshOverview(contribIds=[contribId])
 
     def recompute(self, contribId):
         """Recomputes and replaces workflow for a single contribution.
@@ -272,6 +549,266 @@ class Workflow:
 
         info = self.computeWorkflow(contribId=contribId)
         db.updateWorkflow(contribId, info)
+        self.refreshOverview(contribIds=[contribId])
+
+    def recomputeMany(self, contribIds):
+        """Recomputes and replaces workflow for several contributions.
+
+        Meant for bulk operations, such as imports and clean-ups,
+        see `workflow.py` in the server directory.
+
+        The contributions are handled in batches, see `batchSize` in workflow.yaml.
+        For each batch, the records needed are fetched in one go,
+        see `Workflow.computeWorkflowMany`,
+        and the workflow records are stored in one bulk write of upserts,
+        see `control.db.Db.upsertWorkflowMany`.
+
+        Contributions that do not exist (anymore) lose their workflow record.
+        Their overview records are recomputed as well.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId
+            The contribs for which to compute workflow.
+
+        Returns
+        -------
+        The number of workflow records stored.
+        """
+
+        db = self.db
+
+        contribIds = sorted(set(contribIds))
+        nWf = 0
+
+        for i in range(0, len(contribIds), BATCH_SIZE):
+            batch = contribIds[i : i + BATCH_SIZE]
+            infos = self.computeWorkflowMany(batch)
+            wfRecords = [info for info in infos.values() if info]
+            gone = [contribId for (contribId, info) in infos.items() if not info]
+            db.upsertWorkflowMany(wfRecords)
+            if gone:
+                db.deleteWorkflowMany(gone)
+            self.refreshOverview(contribIds=batch)
+            nWf += len(wfRecords)
+            if DEBUG_WORKFLOW:
+                serverprint(f"WORKFLOW: Recomputed {nWf} workflow records")
+
+        return nWf
+
+    def audit(self, repair=False):
+        """Checks the stored workflow and overview tables against a fresh computation.
+
+        We walk through the ids of the contributions, the workflow records
+        and the overview records together, in batches, see `audit` in workflow.yaml.
+        For each batch we compute the workflow afresh and compare it with
+        the stored workflow records.
+        Then we do the same for the overview records,
+        see `Workflow.refreshOverview`.
+        After each batch we pause, so that the audit can run alongside the
+        webserver without competing with request traffic.
+
+        A workflow record can be
+
+        *   `missing`: its contribution has no workflow record;
+        *   `orphaned`: its contribution does not exist;
+        *   `stale`: it differs from the freshly computed one.
+
+        Every such record is reported, and if `repair` is true,
+        it is repaired by `Workflow.recomputeMany`.
+        That computes the faulty records again, from the data as it is right
+        before writing them.
+        In the meantime, the webserver may have changed the data and stored
+        new workflow records, which the computation of the batch has not seen.
+
+        An overview record is reported as `overview` if it is missing,
+        orphaned, or differs from the freshly computed one.
+        That happens, for instance, when a title in a value table is changed
+        directly in MongoDb.
+        If `repair` is true, it is repaired by `Workflow.refreshOverview`.
+
+        !!! hint
+            This is the day-to-day remedy against a workflow table that has
+            drifted out of sync, instead of computing it from scratch with
+            `Workflow.initWorkflow`.
+            It is available in the build script: `build.sh dbwfaudit`.
+
+        Parameters
+        ----------
+        repair: boolean, optional `False`
+            Whether to repair the faulty workflow and overview records.
+
+        Returns
+        -------
+        dict
+            Keyed by `missing`, `orphaned`, `stale`,
+            valued by the lists of ids of the faulty workflow records,
+            and by `overview`, valued by the list of ids of the faulty overview
+            records.
+        """
+
+        db = self.db
+        types = self.types
+
+        faults = {N.missing: [], N.orphaned: [], N.stale: [], N.overview: []}
+        nChecked = 0
+        crit = None
+
+        while True:
+            batches = [
+                db.getIds(table, crit=crit, limit=AUDIT_BATCH_SIZE)
+                for table in (MAIN_TABLE, N.workflow, N.overview)
+            ]
+            contribIds = sorted(set(chain.from_iterable(batches)))
+            if not contribIds:
+                break
+
+            # only go as far as all tables have been read
+            last = min(
+                (batch[-1] for batch in batches if len(batch) == AUDIT_BATCH_SIZE),
+                default=contribIds[-1],
+            )
+            contribIds = [contribId for contribId in contribIds if contribId <= last]
+
+            computed = self.computeWorkflowMany(contribIds)
+            stored = {
+                G(record, N._id): record for record in db.getWorkflowItems(contribIds)
+            }
+
+            faulty = []
+            for contribId in contribIds:
+                info = G(computed, contribId)
+                record = G(stored, contribId)
+                if not info:
+                    kind = N.orphaned
+                elif not record:
+                    kind = N.missing
+                elif decode(encode(info)) != record:
+                    kind = N.stale
+                else:
+                    continue
+                faulty.append(contribId)
+                faults[kind].append(contribId)
+                serverprint(f"WORKFLOW AUDIT: {kind} workflow record {contribId}")
+
+            if repair and faulty:
+                self.recomputeMany(faulty)
+
+            computed = {
+                G(record, N._id): overview.overviewRecord(db, types, record)
+                for record in db.bulkContribWorkflow({N._id: db.inCrit(contribIds)})
+            }
+            stored = {
+                G(record, N._id): record for record in db.getOverviewItems(contribIds)
+            }
+
+            faulty = []
+            for contribId in contribIds:
+                info = G(computed, contribId)
+                record = G(stored, contribId)
+                if (decode(encode(info)) if info else None) != record:
+                    faulty.append(contribId)
+                    serverprint(f"WORKFLOW AUDIT: faulty overview record {contribId}")
+            faults[N.overview].extend(faulty)
+
+            if repair and faulty:
+                self.refreshOverview(contribIds=faulty)
+
+            nChecked += len(contribIds)
+            if DEBUG_WORKFLOW:
+                serverprint(f"WORKFLOW AUDIT: Checked {nChecked} contributions")
+
+            crit = {M_GT: last}
+            if AUDIT_PAUSE:
+                sleep(AUDIT_PAUSE)
+
+        return faults
+
+    def recomputeField(self, contribId, table, record, field):
+        """Recomputes workflow after a change in a single field.
+
+        Only the parts of the workflow record that depend on the field are
+        recomputed and written, see `dependencies` in workflow.yaml.
+
+        If `verify` in workflow.yaml is true, the whole workflow record is
+        recomputed as well, and stored, and any difference with the targeted
+        recomputation is reported.
+
+        Parameters
+        ----------
+        contribId: ObjectId
+            The contrib whose workflow is affected.
+        table: string
+            The table of the changed record.
+        record: dict
+            The changed record, after the change.
+        field: string
+            The field that has changed.
+        """
+
+        db = self.db
+
+        part = G(G(DEPENDENCIES, table), field)
+
+        if part is None:
+            self.recompute(contribId)
+            return
+
+        if part == N.assessment:
+            info = db.getWorkflowItem(contribId)
+            assessmentId = G(G(info, N.assessment), N._id)
+            if assessmentId is None:
+                self.recompute(contribId)
+                return
+            changedId = G(record, N._id if table == INTER_TABLE else INTER_TABLE)
+            if changedId != assessmentId:
+                # only the valid assessment counts, and the change is elsewhere
+                return
+            entries = db.getAssessmentEntries(assessmentId)
+            self.aggregate(entries)
+            assessment = G(G(entries, INTER_TABLE), assessmentId)
+            if not assessment:
+                self.recompute(contribId)
+                return
+            db.updateWorkflowParts(
+                contribId,
+                self.computeWorkflowValidAssessment(assessment, G(info, N.frozen)),
+            )
+        else:
+            value = (
+                creators(record, N.creator, N.editors)
+                if part == N.creators
+                else G(record, part)
+            )
+            eid = G(record, N._id)
+            if table == MAIN_TABLE:
+                db.updateWorkflowParts(contribId, {part: value})
+            elif table == INTER_TABLE:
+                db.updateWorkflowParts(
+                    contribId,
+                    {f"""{N.assessment}.{part}""": value},
+                    {f"""{N.assessment}.{N._id}""": eid},
+                )
+            else:
+                for kind in (N.expert, N.final):
+                    path = f"""{N.assessment}.{N.reviews}.{kind}"""
+                    db.updateWorkflowParts(
+                        contribId,
+                        {f"""{path}.{part}""": value},
+                        {f"""{path}.{N._id}""": eid},
+                    )
+
+        self.refreshOverview(contribIds=[contribId])
+
+        if VERIFY:
+            targeted = db.getWorkflowItem(contribId)
+            self.recompute(contribId)
+            full = db.getWorkflowItem(contribId)
+            if targeted != full:
+                serverprint(
+                    f"""WORKFLOW: targeted recompute of {table}.{field}"""
+                    f""" differs from full recompute for {contribId}"""
+                )
 
     def delete(self, contribId):
         """Deletes workflow for a single contribution.
@@ -287,6 +824,75 @@ class Workflow:
         if DEBUG_WORKFLOW:
             serverprint(f"WORKFLOW: Delete workflow info {contribId}")
         db.deleteWorkflow(contribId)
+        db.deleteOverviewMany([contribId])
+
+    def refreshOverview(self, contribIds=None, crit=None):
+        """Recomputes and replaces the overview records of contributions.
+
+        The overview page shows all contributions with their workflow,
+        with values resolved to their titles.
+        Instead of doing that work on every visit of the page,
+        we store the result in the overview table,
+        one record per contribution, see `control.overview.overviewRecord`.
+        Then the page needs a single indexed read,
+        see `control.db.Db.getOverview`.
+
+        The overview records are recomputed whenever workflow is
+        computed, and whenever fields change that are shown in the overview,
+        see `control.field.Field.save`.
+
+        !!! caution
+            Changes in value tables that are made directly in MongoDb will
+            not be reflected in the overview until the workflow is
+            initialized afresh, see `Workflow.initWorkflow`,
+            or audited and repaired, see `Workflow.audit`.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId, optional `None`
+            The contribs whose overview records must be recomputed.
+            Contributions that do not exist (anymore) lose their overview record.
+        crit: dict, optional `None`
+            If no contribIds are given, a criterion on the contribs whose
+            overview records must be recomputed, such as all contribs of a country.
+            If neither is given, the overview table is filled afresh.
+
+        Returns
+        -------
+        The number of overview records stored.
+        """
+
+        db = self.db
+        types = self.types
+
+        if contribIds is not None:
+            contribIds = set(contribIds)
+            crit = {N._id: db.inCrit(contribIds)}
+        elif crit is None:
+            db.clearOverview()
+
+        nOv = 0
+        found = set()
+        records = []
+
+        for record in db.bulkContribWorkflow(crit or {}):
+            records.append(overview.overviewRecord(db, types, record))
+            found.add(G(record, N._id))
+            if len(records) == BATCH_SIZE:
+                db.upsertOverviewMany(records)
+                nOv += len(records)
+                records = []
+        db.upsertOverviewMany(records)
+        nOv += len(records)
+
+        if contribIds:
+            gone = contribIds - found
+            if gone:
+                db.deleteOverviewMany(gone)
+
+        if DEBUG_WORKFLOW:
+            serverprint(f"WORKFLOW: Stored {nOv} overview records")
+        return nOv
 
     def computeWorkflow(self, record=None, contribId=None):
         """Computes workflow for a single contribution.
@@ -329,6 +935,40 @@ class Workflow:
         )
         frozen = stage != N.selectNone
 
+        return {
+            N._id: contribId,
+            N.creators: creators(record, N.creator, N.editors),
+            N.country: G(record, N.country),
+            N.type: contribType,
+            N.title: G(record, N.title),
+            N.selected: G(record, N.selected),
+            N.stage: stage,
+            N.stageDate: dateDecided,
+            N.frozen: frozen,
+            **self.computeWorkflowContribAssessment(record, frozen),
+        }
+
+    def computeWorkflowContribAssessment(self, record, frozen):
+        """Computes the part of the workflow of a contribution that stems from its
+        assessment.
+
+        Parameters
+        ----------
+        record: dict
+            The full contrib record, with its assessments and reviews,
+            see `Workflow.getFullItem`.
+        frozen: boolean
+            Whether the contribution is frozen, see `Workflow.computeWorkflow`.
+
+        Returns
+        -------
+        dict
+            The workflow of the valid assessment,
+            and the contrib attributes that derive from it.
+        """
+
+        contribType = G(record, N.typeContribution)
+
         assessmentValid = getLast(
             [
                 aRecord
@@ -337,8 +977,26 @@ class Workflow:
                 and G(aRecord, N.assessmentType) == contribType
             ]
         )
-        if str(contribId) == DEBUG:
-            pass
+        return self.computeWorkflowValidAssessment(assessmentValid, frozen)
+
+    def computeWorkflowValidAssessment(self, assessmentValid, frozen):
+        """Computes the part of the workflow of a contribution that stems from
+        its valid assessment.
+
+        Parameters
+        ----------
+        assessmentValid: dict | None
+            The valid assessment record, with its reviews and entries,
+            see `Workflow.computeWorkflowContribAssessment`.
+        frozen: boolean
+            Whether the contribution is frozen, see `Workflow.computeWorkflow`.
+
+        Returns
+        -------
+        dict
+            As in `Workflow.computeWorkflowContribAssessment`.
+        """
+
         assessmentWf = (
             self.computeWorkflowAssessment(assessmentValid, frozen)
             if assessmentValid
@@ -350,16 +1008,7 @@ class Workflow:
         mayAdd = not done and not locked and not frozen and not assessmentValid
 
         return {
-            N._id: contribId,
-            N.creators: creators(record, N.creator, N.editors),
-            N.country: G(record, N.country),
-            N.type: contribType,
-            N.title: G(record, N.title),
-            N.selected: G(record, N.selected),
             N.assessment: assessmentWf,
-            N.stage: stage,
-            N.stageDate: dateDecided,
-            N.frozen: frozen,
             N.locked: locked,
             N.done: done,
             N.mayAdd: mayAdd,
@@ -627,6 +1276,31 @@ class Workflow:
             allN=allN,
         )
 
+    def computeWorkflowMany(self, contribIds):
+        """Computes workflow for several contributions at once.
+
+        The records needed for the computation are fetched in one go,
+        with a query per workflow table, see `Workflow.getFullItems`.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId
+            The ids of the contribs for which to compute workflow.
+
+        Returns
+        -------
+        dict
+            Keyed by contrib id, valued by the workflow attributes.
+            Contribs that do not exist get an empty dict.
+        """
+
+        contribIds = list(contribIds)
+        fullItems = self.getFullItems(contribIds)
+        return {
+            contribId: self.computeWorkflow(record=G(fullItems, contribId, default={}))
+            for contribId in contribIds
+        }
+
     def getFullItem(self, contribId):
         """Collect a contribution with all relevant assessments and reviews.
 
@@ -641,21 +1315,28 @@ class Workflow:
             The contrib record and its dependent records.
         """
 
+        return G(self.getFullItems([contribId]), contribId)
+
+    def getFullItems(self, contribIds):
+        """Collect contributions with all relevant assessments and reviews.
+
+        Parameters
+        ----------
+        contribIds: iterable of ObjectId
+            The contribs whose information we want to gather.
+
+        Returns
+        -------
+        dict
+            Keyed by contrib id, valued by the contrib record and its dependent records.
+        """
+
         db = self.db
 
-        entries = {}
-        for table in WORKFLOW_TABLES_LIST:
-            crit = (
-                {N._id: contribId}
-                if table == MAIN_TABLE
-                else {N.contrib: contribId}
-                if table in CT.userTables
-                else {INTER_TABLE: db.inCrit(G(entries, INTER_TABLE, default={}))}
-            )
-            entries[table] = db.entries(table, crit)
+        entries = db.getFullEntries(contribIds)
         self.aggregate(entries)
 
-        return G(G(entries, MAIN_TABLE), contribId)
+        return G(entries, MAIN_TABLE, default={})
 
     @staticmethod
     def aggregate(entries):
@@ -697,3 +1378,41 @@ class Workflow:
                             entries.setdefault(masterTable, {}).setdefault(
                                 masterId, {}
                             ).setdefault(detailTable, []).append(record)
+
+
+WORKER_WF = None
+"""*object* The `Workflow` object in a worker process of `Workflow.initParallel`."""
+
+
+def initWorker(wf):
+    """Initializes a worker process of `Workflow.initParallel`.
+
+    Parameters
+    ----------
+    wf: object
+        The `Workflow` object of the parent, inherited by forking.
+        Its MongoDb connection has been closed by the parent.
+    """
+
+    global WORKER_WF
+
+    WORKER_WF = wf
+
+
+def initSlice(bounds):
+    """Computes and stores the workflow of a slice in a worker process.
+
+    Parameters
+    ----------
+    bounds: tuple
+        The lowest and highest id of the slice, see `Workflow.slices`.
+
+    Returns
+    -------
+    The number of workflow records stored.
+    """
+
+    (low, high) = bounds
+    nWf = WORKER_WF.computeSlice(low, high)
+    WORKER_WF.db.mongoClose()
+    return nWf
@@ -0,0 +1,30 @@
+import sys
+
+from config import Names as N
+from control.db import Db
+from control.utils import serverprint, E, COMMA
+
+
+def provisionIndexes(regime, test, create):
+    if not regime:
+        serverprint("Don't know if this is development or production")
+        return 1
+
+    mode = f"""regime = {regime} {"test" if test else E}"""
+    serverprint(f"""INDEXES {"PROVISION" if create else "CHECK"} for {mode}""")
+    DB = Db(regime, test)
+    report = DB.provisionIndexes(create=create)
+    for (kind, tables) in report.items():
+        if kind == N.missing:
+            continue
+        for (table, names) in tables.items():
+            serverprint(f"""INDEXES {kind} {table}: {COMMA.join(names)}""")
+    if not any(report.values()):
+        serverprint("INDEXES all present and used")
+    return 0
+
+
+regime = sys.argv[1] if len(sys.argv) > 1 else None
+test = sys.argv[2] == "test" if len(sys.argv) > 2 else False
+create = "--check" not in sys.argv
+sys.exit(provisionIndexes(regime, test, create))
@@ -23,6 +23,7 @@ from pymongo import MongoClient
 
 from config import Config as C
 from control.utils import serverprint, now, E
+from control.generation import Generation
 
 CB = C.base
 ROOT = CB.root
@@ -56,9 +57,13 @@ def makeUserRoot(database, eppn, only=False):
     mongo.user.update_one(
         {"eppn": eppn}, {"$set": {"group": perms["root"]}},
     )
+    justNow = now()
     mongo.collect.update_one(
-        {"table": "user"}, {"$set": {"dateCollected": now()}}, upsert=True
+        {"table": "user"},
+        {"$set": {"dateCollected": justNow, "deltaFrom": justNow, "changes": []}},
+        upsert=True,
     )
+    Generation(database).bump({"user"})
 
 
 def main():
@@ -51,6 +51,9 @@ root | root | unique authenticated user that can assign office users and system
 `analysis`
 :   Interpret the request log after testing.
 
+`queryBudget`
+:   Check the number of MongoDb commands that a request fires.
+
 ## Test batches
 
 The following files can be run individually, or as part of an all-tests-run,
@@ -66,6 +69,9 @@ in alphabetical order of the file names.
 `test_10_factory10`
 :   How the app is set up.
 
+`test_10_factory20`
+:   How workers keep their value table caches in sync.
+
 `test_20_users10`
 :   Getting to know all users.
 
@@ -113,6 +119,8 @@ in alphabetical order of the file names.
 import pytest
 
 import magic  # noqa
+from config import Config as C, Names as N
+from control.utils import pick as G, serverprint
 from control.app import appFactory
 from clean import clean
 from client import makeClient
@@ -121,6 +129,8 @@ from client import makeClient
 DEBUG = False
 TEST = True
 
+QUERY_HEADERS = G(C.base.queryLog, N.headers)
+
 USER_LIST = """
     public
     auth
@@ -176,6 +186,34 @@ def db():
     clean()
 
 
+@pytest.fixture(scope="session")
+def queryBudget():
+    """A function that checks the MongoDb commands fired by a request.
+
+    The app reports the number of commands and the suspects of the N+1 pattern
+    in response headers, in development mode.
+    See `control.querylog.QueryLog`.
+
+    The function takes a client, a url and a maximum number of commands.
+    It fetches the url and asserts that the number of commands does not exceed
+    the maximum and that there are no N+1 suspects.
+    It returns the response.
+    """
+
+    def check(client, url, maximum):
+        response = client.get(url)
+        headers = response.headers
+        count = int(headers.get(G(QUERY_HEADERS, N.count), 0))
+        repeats = headers.get(G(QUERY_HEADERS, N.repeats))
+        if count > maximum or repeats:
+            serverprint(f"QUERIES {url} => {count} (max {maximum}) {repeats or ''}")
+        assert count <= maximum
+        assert not repeats
+        return response
+
+    return check
+
+
 @pytest.fixture(scope="session")
 def app():
     """Normal app for testing: development mode, test mode.
@@ -22,6 +22,7 @@ ASSESS = "assessment"
 CONTRIB = "contrib"
 CRITERIA = "criteria"
 CRITERIA_ENTRY = "criteriaEntry"
+CREATORS = "creators"
 COMMENTS = "comments"
 CONTACT_PERSON_NAME = "contactPersonName"
 CONTACT_PERSON_EMAIL = "contactPersonEmail"
@@ -33,11 +34,20 @@ DATE_DECIDED = "dateDecided"
 DATE_SUBMITTED = "dateSubmitted"
 DESCRIPTION = "description"
 DISCIPLINE = "discipline"
+DONE = "done"
 EDITORS = "editors"
 EMAIL = "email"
 EVIDENCE = "evidence"
+FROZEN = "frozen"
+IS_EDIT = "isEdit"
+IS_OUR = "isOur"
+IS_REVIEWER = "isReviewer"
 KEYWORD = "keyword"
 LEVEL = "level"
+LOCKED = "locked"
+MODIFIED = "modified"
+NAME = "name"
+OVERVIEW_TABLE = "overview"
 PACKAGE = "package"
 REMARKS = "remarks"
 REP = "rep"
@@ -46,6 +56,7 @@ REVIEW_ENTRY = "reviewEntry"
 REVIEWER_E = "reviewerE"
 REVIEWER_F = "reviewerF"
 SCORE = "score"
+STAGE = "stage"
 TADIRAH_ACTIVITY = "tadirahActivity"
 TADIRAH_OBJECT = "tadirahObject"
 TADIRAH_TECHNIQUE = "tadirahTechnique"
@@ -79,6 +90,10 @@ COMPLETE_REVISED = "completeRevised"
 COMPLETE_WITHDRAWN = "completeWithdrawn"
 SUBMITTED = "submitted"
 
+MISSING = "missing"
+ORPHANED = "orphaned"
+STALE = "stale"
+
 ACCEPT = "Accept"
 REJECT = "Reject"
 REVISE = "Revise"
@@ -0,0 +1,344 @@
+"""The workflow rules as they were before they were compiled.
+
+The app looks up the readability and fixity of records and the permissions
+of tasks in decision tables that have been compiled from rules,
+see `control.workflow.apply`.
+
+Here are the rules as the app evaluated them before that,
+straight from the workflow item,
+so that `test_60_workflow20` can check that the compilation did not change
+their outcomes.
+Each function takes the workflow item as its first argument,
+instead of being a method of it.
+"""
+
+from datetime import timedelta
+
+from config import Names as N
+from control.utils import pick as G, now
+from control.workflow.apply import SENSITIVE_TABLES, TASKS, USER_TABLES
+
+
+def checkReadable(wfitem, recordObj):
+    """Whether a record is readable because of workflow.
+
+    As `control.workflow.apply.WorkflowItem.checkReadable` was.
+    """
+
+    isSuperuser = wfitem.isSuperuser
+    if isSuperuser:
+        return None
+
+    table = recordObj.table
+    if table not in SENSITIVE_TABLES:
+        return None
+
+    kind = recordObj.kind
+    perm = recordObj.perm
+    uid = wfitem.uid
+
+    (stage,) = wfitem.info(table, N.stage, kind=kind)
+
+    if table in {N.assessment, N.criteriaEntry}:
+        (r2Stage,) = wfitem.info(N.review, N.stage, kind=N.final)
+        return (
+            True
+            if r2Stage == N.reviewAccept
+            else perm[N.isOur]
+            if stage
+            in {
+                N.submitted,
+                N.incompleteRevised,
+                N.completeRevised,
+                N.submittedRevised,
+            }
+            else perm[N.isEdit]
+        )
+
+    if table in {N.review, N.reviewEntry}:
+        (creators,) = wfitem.info(N.assessment, N.creators)
+        (r2Stage,) = wfitem.info(N.review, N.stage, kind=N.final)
+        result = (
+            True
+            if r2Stage == N.reviewAccept
+            else uid in creators or perm[N.isOur]
+            if stage
+            in {
+                N.reviewAdviseRevise,
+                N.reviewAdviseAccept,
+                N.reviewAdviseReject,
+                N.reviewRevise,
+                N.reviewReject,
+            }
+            or r2Stage in {N.reviewRevise, N.reviewReject}
+            else perm[N.isReviewer] or perm[N.isEdit]
+        )
+        return result
+    return None
+
+
+def checkFixed(wfitem, recordObj, field=None):
+    """Whether a record or field is fixed because of workflow.
+
+    As `control.workflow.apply.WorkflowItem.checkFixed` was.
+    """
+
+    auth = wfitem.auth
+    table = recordObj.table
+    kind = recordObj.kind
+
+    (frozen, done, locked) = wfitem.info(table, N.frozen, N.done, N.locked, kind=kind)
+
+    if field is None:
+        return frozen or done or locked
+
+    if frozen or done:
+        return True
+
+    if not locked:
+        return False
+
+    isOffice = auth.officeuser()
+    if isOffice and table == N.assessment:
+        return field not in {N.reviewerE, N.reviewerF}
+
+    return True
+
+
+def permission(wfitem, task, kind=None):
+    """Checks whether a workflow task is permitted.
+
+    As `control.workflow.apply.WorkflowItem.permission` was.
+    """
+
+    db = wfitem.db
+    auth = wfitem.auth
+    uid = wfitem.uid
+
+    if task not in TASKS:
+        return False
+
+    taskInfo = TASKS[task]
+    table = G(taskInfo, N.table)
+
+    if uid is None or table not in USER_TABLES:
+        return False
+
+    taskField = (
+        N.selected
+        if table == N.contrib
+        else N.submitted
+        if table == N.assessment
+        else N.decision
+        if table == N.review
+        else None
+    )
+    myKind = wfitem.myKind
+
+    (
+        locked,
+        done,
+        frozen,
+        mayAdd,
+        stage,
+        stageDate,
+        creators,
+        countryId,
+        taskValue,
+    ) = wfitem.info(
+        table,
+        N.locked,
+        N.done,
+        N.frozen,
+        N.mayAdd,
+        N.stage,
+        N.stageDate,
+        N.creators,
+        N.country,
+        taskField,
+        kind=kind,
+    )
+
+    operator = G(taskInfo, N.operator)
+    value = G(taskInfo, N.value)
+    if operator == N.set:
+        if taskField == N.decision:
+            value = G(db.decisionInv, value)
+
+    isOwn = creators and uid in creators
+    isCoord = countryId and auth.coordinator(countryId=countryId)
+    isSuper = auth.superuser()
+    isOffice = auth.officeuser()
+    isSysadmin = auth.sysadmin()
+
+    decisionDelay = G(taskInfo, N.delay, False)
+    if decisionDelay:
+        if type(decisionDelay) is int:
+            decisionDelay = timedelta(hours=decisionDelay)
+        elif type(decisionDelay) is dict:
+            defaultDecisionDelay = G(decisionDelay, N.all, False)
+            decisionDelay = (
+                G(decisionDelay, N.coord, defaultDecisionDelay)
+                if isCoord
+                else G(decisionDelay, N.sysadmin, defaultDecisionDelay)
+                if isSysadmin
+                else G(decisionDelay, N.office, defaultDecisionDelay)
+                if isOffice
+                else defaultDecisionDelay
+            )
+            if type(decisionDelay) is int:
+                decisionDelay = timedelta(hours=decisionDelay)
+        elif type(decisionDelay) is not bool:
+            decisionDelay = False
+
+    justNow = now()
+    remaining = False
+    if decisionDelay and stageDate:
+        if type(decisionDelay) is bool:
+            remaining = True
+        else:
+            remaining = stageDate + decisionDelay - justNow
+            if remaining <= timedelta(hours=0):
+                remaining = False
+
+    forbidden = frozen or done
+
+    if forbidden:
+        if task == N.unselectContrib and table == N.contrib:
+            if remaining is True:
+                return "as intervention"
+            if remaining:
+                return remaining
+        if not remaining:
+            return False
+
+    if table == N.contrib:
+        if not isOwn and not isCoord and not isSuper:
+            return False
+
+        if task == N.startAssessment:
+            return not forbidden and isOwn and mayAdd
+
+        if value == taskValue:
+            return False
+
+        if not isCoord:
+            return False
+
+        answer = not frozen or remaining
+
+        if task == N.selectContrib:
+            return stage != N.selectYes and answer
+
+        if task == N.deselectContrib:
+            return stage != N.selectNo and answer
+
+        if task == N.unselectContrib:
+            return stage != N.selectNone and answer
+
+        return False
+
+    if table == N.assessment:
+        forbidden = frozen or done
+        if forbidden:
+            return False
+
+        if task == N.startReview:
+            return not forbidden and G(mayAdd, myKind)
+
+        if value == taskValue:
+            return False
+
+        if uid not in creators:
+            return False
+
+        answer = not locked or remaining
+        if not answer:
+            return False
+
+        if task == N.submitAssessment:
+            return stage == N.complete and answer
+
+        if task == N.resubmitAssessment:
+            return stage == N.completeWithdrawn and answer
+
+        if task == N.submitRevised:
+            return stage == N.completeRevised and answer
+
+        if task == N.withdrawAssessment:
+            return (
+                stage in {N.submitted, N.submittedRevised}
+                and stage not in {N.incompleteWithdrawn, N.completeWithdrawn}
+                and answer
+            )
+
+        return False
+
+    if table == N.review:
+        if frozen:
+            return False
+
+        if done and not remaining:
+            return False
+
+        taskKind = G(taskInfo, N.kind)
+        if not kind or kind != taskKind or kind != myKind:
+            return False
+
+        answer = remaining or not done or remaining
+        if not answer:
+            return False
+
+        (aStage, aStageDate) = wfitem.info(N.assessment, N.stage, N.stageDate)
+        (finalStage,) = wfitem.info(table, N.stage, kind=N.final)
+        (expertStage, expertStageDate) = wfitem.info(
+            table, N.stage, N.stageDate, kind=N.expert
+        )
+        xExpertStage = N.expertReviewRevoke if expertStage is None else expertStage
+        xFinalStage = N.finalReviewRevoke if finalStage is None else finalStage
+        revision = finalStage == N.reviewRevise
+        zFinalStage = finalStage and not revision
+        submitted = aStage == N.submitted
+        submittedRevised = aStage == N.submittedRevised
+        mayDecideExpert = submitted and not finalStage or submittedRevised and revision
+
+        if value == taskValue:
+            if not revision:
+                return False
+
+        if (
+            task
+            in {
+                N.expertReviewRevise,
+                N.expertReviewAccept,
+                N.expertReviewReject,
+                N.expertReviewRevoke,
+            }
+            - {xExpertStage}
+        ):
+            return kind == N.expert and not zFinalStage and mayDecideExpert and answer
+
+        if (
+            task
+            in {
+                N.finalReviewRevise,
+                N.finalReviewAccept,
+                N.finalReviewReject,
+                N.finalReviewRevoke,
+            }
+            - {xFinalStage}
+        ):
+            return (
+                kind == N.final
+                and not not expertStage
+                and (not aStageDate or expertStageDate > aStageDate)
+                and (
+                    ((not finalStage and submitted) or (revision and submittedRevised))
+                    or remaining
+                )
+                and answer
+            )
+
+        return False
+
+    return False
@@ -9,15 +9,50 @@ There are also some functions that are even higher level, and have been
 factored out from concrete test functions.
 """
 
+from datetime import timedelta
+
+from bson.objectid import ObjectId
+
+from control.auth import Auth
+from control.context import Context
+from control.cust.factory_table import make as mkTable
+from control.db import Db
+from control.typ.types import Types
 from control.utils import pick as G, serverprint, E
+from control.workflow.apply import (
+    ASSIGN_FIELDS,
+    REMAINING,
+    SENSITIVE_TABLES,
+    TASKS,
+    WorkflowItem,
+    fixedRule,
+    permissionRule,
+    readableRule,
+)
+from control.workflow.compute import Workflow
 from conftest import USERS
 from example import (
+    _ID,
     ASSESS,
     CAPTIONS,
+    CONTRIB,
+    CREATORS,
+    CRITERIA_ENTRY,
+    DONE,
     EDITOR,
     EDITORS,
+    EXPERT,
+    FINAL,
+    FROZEN,
+    IS_EDIT,
+    IS_OUR,
+    IS_REVIEWER,
+    LOCKED,
+    PUBLIC,
     REVIEW,
     REVIEW_DECISION,
+    REVIEW_ENTRY,
+    STAGE,
     START_ASSESSMENT,
     START_REVIEW,
     TITLE,
@@ -103,6 +138,126 @@ def assertCaptions(client, expect):
             assert item == expItem
 
 
+def assertCompiledRules(recordId):
+    """Check the compiled workflow rules against the rules themselves.
+
+    For every user, and every record of a contribution, we compute
+    the readability, the fixity of the record and its fields,
+    and the permissions of all tasks, as the app does it:
+    by looking them up in the tables of `control.workflow.apply`.
+
+    We also compute them by evaluating the rules directly,
+    on a fresh workflow item, without memoized lookups.
+    Both ways must give the same outcomes.
+
+    Parameters
+    ----------
+    recordId: dict
+        The ids of the contribution, its assessment, criteria entries and reviews,
+        as made by `starters.start`.
+    """
+
+    def readable(wfitem, recordObj):
+        table = recordObj.table
+        kind = recordObj.kind
+        perm = recordObj.perm
+
+        if wfitem.isSuperuser or table not in SENSITIVE_TABLES:
+            return None
+
+        stage = G(wfitem.getWf(table, kind=kind), STAGE)
+        r2Stage = G(wfitem.getWf(REVIEW, kind=FINAL), STAGE)
+        isCreator = table in {REVIEW, REVIEW_ENTRY} and wfitem.uid in (
+            G(wfitem.getWf(ASSESS), CREATORS) or ()
+        )
+        return readableRule(
+            table,
+            stage,
+            r2Stage,
+            perm[IS_OUR],
+            perm[IS_EDIT],
+            perm[IS_REVIEWER],
+            isCreator,
+        )
+
+    def fixed(wfitem, recordObj, field):
+        table = recordObj.table
+        data = wfitem.getWf(table, kind=recordObj.kind)
+        mayAssign = (
+            field in ASSIGN_FIELDS and table == ASSESS and wfitem.auth.officeuser()
+        )
+        return fixedRule(
+            bool(G(data, FROZEN)),
+            bool(G(data, DONE)),
+            bool(G(data, LOCKED)),
+            field is None,
+            bool(mayAssign),
+        )
+
+    def permitted(wfitem, task, kind):
+        found = wfitem.permissionKey(task, kind=kind)
+        if found is None:
+            return False
+        (key, remaining) = found
+        result = permissionRule(*key)
+        return remaining if result is REMAINING else result
+
+    def truth(outcome):
+        # the compiled tables hold booleans where the rules may yield flags
+        return None if outcome is None else bool(outcome)
+
+    def timeless(outcome):
+        # the time left differs by the time between the two computations
+        return REMAINING if type(outcome) is timedelta else outcome
+
+    db = Db("development", test=True)
+    wf = Workflow(db)
+    types = Types()
+    auth = Auth(db, "development")
+
+    contribId = ObjectId(G(recordId, CONTRIB))
+    reviewIds = [ObjectId(eid) for eid in G(recordId, REVIEW).values()]
+    records = (
+        [(CONTRIB, contribId), (ASSESS, ObjectId(G(recordId, ASSESS)))]
+        + [(CRITERIA_ENTRY, ObjectId(eid)) for eid in G(recordId, CRITERIA_ENTRY)]
+        + [(REVIEW, eid) for eid in reviewIds]
+        + [
+            (REVIEW_ENTRY, G(record, _ID))
+            for record in db.getDetails(REVIEW_ENTRY, REVIEW, reviewIds)
+        ]
+    )
+    data = db.getWorkflowItem(contribId)
+
+    for user in USERS:
+        if user == PUBLIC:
+            auth.clearUser()
+        else:
+            auth.getUser(user)
+        context = Context(db, wf, auth, types)
+
+        for (table, eid) in records:
+            recordObj = mkTable(context, table).record(eid=eid)
+            wfitem = recordObj.wfitem
+            if wfitem is None:
+                continue
+            fresh = WorkflowItem(context, data)
+            assert truth(wfitem.checkReadable(recordObj)) == truth(
+                readable(fresh, recordObj)
+            )
+            for field in (None, *recordObj.fields):
+                assert truth(wfitem.checkFixed(recordObj, field=field)) == truth(
+                    fixed(fresh, recordObj, field)
+                )
+
+        wfitem = context.getWorkflowItem(contribId)
+        fresh = WorkflowItem(context, data)
+        for task in TASKS:
+            for kind in (None, EXPERT, FINAL):
+                assert timeless(wfitem.permission(task, kind=kind)) == timeless(
+                    permitted(fresh, task, kind)
+                )
+
+
 def assertDelItem(client, table, eid, expect):
     """Deletes an item from a table.
 
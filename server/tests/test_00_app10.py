@@ -45,6 +45,7 @@ test | url pattern
 `test_home` | /, /index, /index.html
 `test_info` | /info '
 `test_workflow` | /workflow
+`test_metrics` | /metrics
 `test_task` | /api/task/{task}/{eid}
 `test_insert` | /api/{table}/insert
 `test_insertDetail` | /api/{table}/{eid}/{dtable}/insert
@@ -169,6 +170,13 @@ def test_workflow(clients):
     illegalize(clients, url)
 
 
+def test_metrics(clients):
+    url = "/metrics"
+    expect = {user: 200 if user in {SYSTEM, ROOT} else 404 for user in USERS}
+    forall(clients, expect, assertStatus, url)
+    illegalize(clients, url)
+
+
 def test_task(clients):
     illegalize(clients, "/api/task/{task}/{eid}", task=SUBMIT_ASSESSMENT, eid=DUMMY_ID)
 
@@ -0,0 +1,252 @@
+"""Test the synchronization of the value table caches between workers.
+
+## Domain
+
+*   Clean slate, see `starters`.
+*   Two `control.db.Db` objects, acting as two workers with their own cache.
+
+## Acts
+
+`test_fresh`
+:   The second worker has collected all value tables after the first one,
+    so the first one reloads them all.
+    After that, both workers find all value tables fresh.
+
+`test_change`
+:   The first worker changes the country table.
+    The second worker reloads the country table and only that one.
+    After that, both workers find all value tables fresh again.
+
+`test_generation`
+:   When nothing has changed, the workers see that from the shared generation
+    counters, without consulting the database.
+    When the first worker changes the user table, the second worker
+    consults the database and reloads the user table.
+
+`test_delta`
+:   The first worker inserts a keyword.
+    The second worker fetches only that keyword and patches its cache.
+    Then the first worker deletes the keyword,
+    and the second worker removes it from its cache.
+
+`test_catchUp`
+:   The first worker inserts a keyword, and the second worker inserts another
+    keyword before it has looked at the database.
+    While storing its own keyword, the second worker also picks up the keyword
+    of the first worker.
+    After that, both workers have both keywords.
+
+`test_recordCache`
+:   The first worker fetches a contribution, and keeps it in its record cache.
+    The second worker changes the title of the contribution twice
+    within the same second.
+    Each time, the first worker sees that its cached copy is stale,
+    and fetches the contribution again.
+
+`test_widgetCache`
+:   The first worker makes edit widgets for keywords and users twice,
+    and the second time they come from its widget cache.
+    Then the second worker inserts a keyword,
+    and the first worker makes a new keyword widget, with the new keyword in it.
+    Then the second worker changes the name of a country,
+    and the first worker makes a new user widget,
+    because the titles of users may show their countries.
+
+`test_bindTypes`
+:   The first worker handles two requests, for different users.
+    Both requests get the same type singletons,
+    and those see the context of the request at hand.
+"""
+
+import pytest
+
+import magic  # noqa
+from control.auth import Auth
+from control.context import Context
+from control.db import Db, VALUE_TABLES
+from control.typ.types import Types
+from control.workflow.compute import Workflow
+from starters import start
+from example import (
+    CONTRIB,
+    COUNTRY,
+    KEYWORD,
+    MODIFIED,
+    NAME,
+    OWNER,
+    PUBLIC,
+    REP,
+    STALE,
+    TITLE,
+    USER,
+)
+
+
+DB1 = None
+DB2 = None
+
+
+@pytest.mark.usefixtures("db")
+def test_start():
+    global DB1
+    global DB2
+
+    start()
+    DB1 = Db("development", test=True)
+    DB2 = Db("development", test=True)
+
+
+def test_fresh():
+    DB1.recollect()
+    assert DB1.fresh == {table: False for table in VALUE_TABLES}
+
+    for db in (DB1, DB2):
+        db.recollect()
+        assert db.fresh == {table: True for table in VALUE_TABLES}
+
+
+def test_change():
+    DB1.recollect(COUNTRY)
+    assert DB1.fresh[COUNTRY] is False
+
+    DB2.recollect()
+    assert DB2.fresh == {table: table != COUNTRY for table in VALUE_TABLES}
+
+    for db in (DB1, DB2):
+        db.recollect()
+        assert db.fresh == {table: True for table in VALUE_TABLES}
+
+
+def test_generation():
+    for db in (DB1, DB2):
+        polled = db.polled
+        db.recollect()
+        assert db.polled == polled
+        assert db.generations == db.generation.read()
+
+    DB1.recollect(USER)
+    polled = DB2.polled
+    DB2.recollect()
+    assert DB2.polled != polled
+    assert DB2.fresh == {table: table != USER for table in VALUE_TABLES}
+
+
+def test_delta():
+    keyword = "delta keyword"
+    eid = DB1.insertItem(KEYWORD, DB1.creatorId, "test", False, **{REP: keyword})
+    assert DB1.delta[KEYWORD] is True
+    assert DB1.keywordInv[keyword] == eid
+
+    DB2.recollect()
+    assert DB2.fresh == {table: table != KEYWORD for table in VALUE_TABLES}
+    assert DB2.delta[KEYWORD] is True
+    assert DB2.keywordInv[keyword] == eid
+    assert DB2.keyword[eid][REP] == keyword
+
+    DB1.deleteItem(KEYWORD, eid)
+    assert eid not in DB1.keyword
+
+    DB2.recollect()
+    assert DB2.delta[KEYWORD] is True
+    assert eid not in DB2.keyword
+    assert keyword not in DB2.keywordInv
+
+
+def test_catchUp():
+    keyword1 = "first keyword"
+    keyword2 = "second keyword"
+    eid1 = DB1.insertItem(KEYWORD, DB1.creatorId, "test", False, **{REP: keyword1})
+    eid2 = DB2.insertItem(KEYWORD, DB2.creatorId, "test", False, **{REP: keyword2})
+    assert DB2.delta[KEYWORD] is True
+    assert DB2.keywordInv[keyword1] == eid1
+    assert DB2.keywordInv[keyword2] == eid2
+
+    for db in (DB1, DB2):
+        db.recollect()
+        assert db.keywordInv[keyword1] == eid1
+        assert db.keywordInv[keyword2] == eid2
+
+    DB1.deleteItem(KEYWORD, eid1)
+    DB1.deleteItem(KEYWORD, eid2)
+    DB2.recollect()
+    assert eid1 not in DB2.keyword
+    assert eid2 not in DB2.keyword
+
+
+def test_recordCache():
+    eid = DB1.insertItem(CONTRIB, DB1.creatorId, "test", False, **{TITLE: "cached"})
+    record = DB1.getItemCached(CONTRIB, eid)
+    assert record[TITLE] == "cached"
+    assert DB1.getItemCached(CONTRIB, eid) is record
+
+    for title in ("changed", "changed again"):
+        stale = DB1.recordCache.counts[STALE]
+        modified = DB2.getItem(CONTRIB, eid)[MODIFIED]
+        assert DB2.updateField(CONTRIB, eid, TITLE, title, "test", modified)
+        assert DB1.getItemCached(CONTRIB, eid)[TITLE] == title
+        assert DB1.recordCache.counts[STALE] == stale + 1
+
+    DB1.deleteItem(CONTRIB, eid)
+    assert DB1.getItemCached(CONTRIB, eid) == {}
+
+
+def test_widgetCache():
+    types = Types()
+    auth = Auth(DB1, "development")
+    auth.clearUser()
+    wf = Workflow(DB1)
+
+    def widgets():
+        Context(DB1, wf, auth, types)
+        return (
+            types.keyword.widget(None, True, True, None),
+            types.user.widget(None, True, False, None),
+        )
+
+    def items(typeObj):
+        (widget,) = typeObj.widgets.values()
+        return widget[2]
+
+    widgets()
+    (keywordItems, userItems) = (items(types.keyword), items(types.user))
+    widgets()
+    assert items(types.keyword) is keywordItems
+    assert items(types.user) is userItems
+
+    keyword = "widget keyword"
+    eid = DB2.insertItem(KEYWORD, DB2.creatorId, "test", False, **{REP: keyword})
+    (keywordWidget, userWidget) = widgets()
+    assert items(types.keyword) is not keywordItems
+    assert keyword in keywordWidget
+    assert items(types.user) is userItems
+
+    countryId = next(iter(DB2.country))
+    name = DB2.country[countryId][NAME]
+    for newName in ("widget country", name):
+        modified = DB2.country[countryId].get(MODIFIED)
+        assert DB2.updateField(COUNTRY, countryId, NAME, newName, "test", modified)
+        widgets()
+        assert items(types.user) is not userItems
+        userItems = items(types.user)
+
+    DB2.deleteItem(KEYWORD, eid)
+
+
+def test_bindTypes():
+    types = Types()
+    wf = Workflow(DB1)
+    typeObjs = {tp: getattr(types, tp) for tp in VALUE_TABLES}
+
+    for user in (OWNER, PUBLIC):
+        auth = Auth(DB1, "development")
+        if user == PUBLIC:
+            auth.clearUser()
+        else:
+            auth.getUser(user)
+        context = Context(DB1, wf, auth, types)
+        assert context.types is types
+        assert types.context is context
+        for (tp, typeObj) in typeObjs.items():
+            assert getattr(types, tp) is typeObj
+            assert typeObj.context is context
+            assert typeObj.context.auth is auth
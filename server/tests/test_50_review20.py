@@ -45,6 +45,11 @@ Filling out reviews.
     After that **expert** tries to take all review decisions, but fails,
     because the final decision has been taken.
 
+`test_compiledRules`
+:   For all users and all records of the contribution,
+    the readability, fixity and task permissions that the app looks up
+    in its compiled tables are the same as the outcomes of the rules themselves.
+
 `test_modify`
 :   All users try to modify a field in the contribution, in the assessment, and in
     a review comment, but all fail, because everything is in a finished state.
@@ -112,14 +117,55 @@ Filling out reviews.
     * **final** tries to decide anything, but fails.
     * **expert** acceepts and succeeds.
     * **final** acceepts and succeeds.
+
+`test_compiledRules2`
+:   As `test_compiledRules`, now that there is a new round of reviews.
+
+`test_memoizedItem`
+:   For all users, the workflow item of the contribution is the same object
+    throughout a request, unless a fresh one is required.
+    Its memoized attribute lookups and status presentations are the same as
+    those of a fresh workflow item, apart from the time left to revoke decisions.
+
+`test_permRecordMany`
+:   For all users, the permissions of all contributions, assessments and reviews,
+    as computed in bulk for the list pages,
+    are the same as the permissions computed record by record.
+
+`test_queryBudget`
+:   All users visit the list pages and the overview page.
+    None of these pages may fire more than a fixed number of MongoDb commands,
+    and none of them may fetch records one by one (N+1).
+
+`test_overviewCache`
+:   **system** visits the overview page twice, and the second visit is served
+    from the overview cache, as the metrics show.
+    After a change in the workflow the page is composed again.
+
+`test_listSelect`
+:   **owner** adds a contribution without assessment.
+    The list of contributions is filtered on having an assessment and/or
+    a review, or not having them.
+    Only the right contributions are returned.
 """
 
+import re
 import pytest
 
+from bson.objectid import ObjectId
+
 import magic  # noqa
+from control.auth import Auth
+from control.context import Context
+from control.db import Db
+from control.perm import permRecord, permRecordMany
+from control.typ.types import Types
+from control.workflow.apply import WorkflowItem
+from control.workflow.compute import Workflow
 from control.utils import pick as G, E
 from conftest import USERS, POWER_USERS
 from example import (
+    _ID,
     ACCEPT,
     ASSESS,
     COMMENTS,
@@ -130,12 +176,16 @@ from example import (
     CRITERIA_ENTRY,
     DATE_DECIDED,
     DATE_SUBMITTED,
+    DONE,
     EVIDENCE,
     EVIDENCE1,
     EXPERT,
     FINAL,
+    FROZEN,
     INCOMPLETE_REVISED,
+    LOCKED,
     OFFICE,
+    PUBLIC,
     REJECT,
     REMARKS,
     REMARKS_E,
@@ -147,6 +197,7 @@ from example import (
     REVIEWER_E,
     REVISE,
     REVOKE,
+    STAGE,
     SUBMIT_ASSESSMENT,
     SUBMIT_REVISED,
     TITLE,
@@ -160,8 +211,9 @@ from helpers import (
     getItem,
     getReviewEntryId,
 )
-from starters import start
+from starters import makeItem, start
 from subtest import (
+    assertCompiledRules,
     assertFieldValue,
     assertModifyField,
     assertReviewDecisions,
@@ -172,6 +224,12 @@ from subtest import (
 
 startInfo = {}
 
+QUERY_MAX = 30
+"""The maximum number of MongoDb commands that a list or overview page may fire."""
+
+DATEX = re.compile(r"""<span class='datex'>[^<]*</span>""")
+"""The time left to revoke a decision, which moves while we look."""
+
 
 @pytest.mark.usefixtures("db")
 def test_start(clientOffice, clientOwner, clientExpert, clientFinal):
@@ -298,6 +356,10 @@ def test_finalAccepts(clientsReviewer):
     )
 
 
+def test_compiledRules():
+    assertCompiledRules(startInfo["recordId"])
+
+
 def test_modify(clients):
     valueTables = startInfo["valueTables"]
     recordId = startInfo["recordId"]
@@ -520,3 +582,144 @@ def test_newRound(clientsReviewer):
     )
     assertReviewDecisions(clientsReviewer, reviewId, [EXPERT], [ACCEPT], True)
     assertReviewDecisions(clientsReviewer, reviewId, [FINAL], [ACCEPT], True)
+
+
+def test_compiledRules2():
+    assertCompiledRules(startInfo["recordId"])
+
+
+def test_memoizedItem():
+    recordId = startInfo["recordId"]
+    contribId = G(recordId, CONTRIB)
+
+    db = Db("development", test=True)
+    wf = Workflow(db)
+    types = Types()
+    auth = Auth(db, "development")
+    data = db.getWorkflowItem(contribId)
+
+    sources = (
+        (CONTRIB, None),
+        (ASSESS, None),
+        (CRITERIA_ENTRY, None),
+        (REVIEW, EXPERT),
+        (REVIEW, FINAL),
+    )
+    atts = (_ID, STAGE, FROZEN, DONE, LOCKED)
+
+    for user in USERS:
+        if user == PUBLIC:
+            auth.clearUser()
+        else:
+            auth.getUser(user)
+        context = Context(db, wf, auth, types)
+
+        wfitem = context.getWorkflowItem(contribId)
+        assert context.getWorkflowItem(contribId) is wfitem
+        assert context.getWorkflowItem(ObjectId(contribId)) is wfitem
+
+        for (table, kind) in sources:
+            for _ in range(2):
+                fresh = WorkflowItem(context, data)
+                assert wfitem.getWf(table, kind=kind) == fresh.getWf(table, kind=kind)
+                assert wfitem.info(table, *atts, kind=kind) == fresh.info(
+                    table, *atts, kind=kind
+                )
+                assert DATEX.sub(E, wfitem.status(table, kind=kind)) == DATEX.sub(
+                    E, fresh.status(table, kind=kind)
+                )
+
+        freshItem = context.getWorkflowItem(contribId, requireFresh=True)
+        assert freshItem is not wfitem
+        assert context.getWorkflowItem(contribId) is freshItem
+
+
+def test_permRecordMany():
+    db = Db("development", test=True)
+    wf = Workflow(db)
+    types = Types()
+    auth = Auth(db, "development")
+
+    for user in USERS:
+        if user == PUBLIC:
+            auth.clearUser()
+        else:
+            auth.getUser(user)
+
+        for table in (CONTRIB, ASSESS, REVIEW):
+            context = Context(db, wf, auth, types)
+            records = [context.getItem(table, eid) for eid in db.getIds(table)]
+            assert records
+            expected = [
+                permRecord(Context(db, wf, auth, types), table, record)
+                for record in records
+            ]
+            assert permRecordMany(context, table, records) == expected
+
+
+def test_queryBudget(clients, queryBudget):
+    urls = [
+        f"/{table}/list{action}"
+        for table in (CONTRIB, ASSESS, REVIEW)
+        for action in (E, "?action=my")
+    ] + ["/info"]
+
+    for user in USERS:
+        for url in urls:
+            queryBudget(clients[user], url, QUERY_MAX)
+
+
+def test_overviewCache(clientSystem):
+    recordId = startInfo["recordId"]
+    contribId = G(recordId, CONTRIB)
+
+    def counts():
+        text = clientSystem.get("/metrics").get_data(as_text=True)
+        return {
+            counter: sum(
+                int(line.rsplit(" ", 1)[1])
+                for line in text.split("\n")
+                if line.startswith(f"dariah_overview_{counter}_total{{")
+            )
+            for counter in ("hits", "misses")
+        }
+
+    clientSystem.get("/info")
+    before = counts()
+    clientSystem.get("/info")
+    after = counts()
+    assert after["hits"] == before["hits"] + 1
+    assert after["misses"] == before["misses"]
+
+    db = Db("development", test=True)
+    wf = Workflow(db)
+    wf.recompute(contribId)
+
+    clientSystem.get("/info")
+    final = counts()
+    assert final["hits"] == after["hits"]
+    assert final["misses"] == after["misses"] + 1
+
+
+def test_listSelect(clientOwner):
+    recordId = startInfo["recordId"]
+    contribId = ObjectId(G(recordId, CONTRIB))
+    bareId = ObjectId(makeItem(clientOwner, CONTRIB))
+    contribIds = {contribId, bareId}
+
+    db = Db("development", test=True)
+
+    expected = (
+        ("1", "0", {contribId}),
+        ("-1", "0", {bareId}),
+        ("0", "1", {contribId}),
+        ("0", "-1", {bareId}),
+        ("1", "1", {contribId}),
+        ("-1", "-1", {bareId}),
+        ("1", "-1", set()),
+        ("-1", "1", set()),
+        ("0", "0", contribIds),
+    )
+    for (assessed, reviewed, result) in expected:
+        records = db.getList(CONTRIB, select=True, assessed=assessed, reviewed=reviewed)
+        assert {G(record, _ID) for record in records} & contribIds == result
@@ -0,0 +1,281 @@
+"""Test the workflow machinery.
+
+## Domain
+
+*   Users as in `conftest`, under *players*
+*   Clean slate, see `starters`.
+*   The user table
+*   The country table
+*   One contribution record
+*   One assessment record
+*   The assessment submitted and reviewers assigned.
+*   Two reviews, with review comments filled out.
+
+## Acts
+
+The workflow table is computed, stored, repaired and kept in sync with the data,
+outside of any request.
+We change the data under water, and check the workflow information against
+a full computation.
+
+`test_syncWorkflow`
+:   The fingerprint of the data is stored, and a sync finds nothing to do.
+    Then the title of the assessment is changed under water, twice,
+    and each time a sync recomputes the workflow record of the contribution,
+    which then has the new title.
+
+`test_initParallel`
+:   The workflow table is cleared and filled again by parallel processes,
+    one per contribution.
+    The result is the same workflow table as before.
+
+`test_initWorkflow`
+:   The workflow table is rebuilt from scratch, in a walk through
+    the contributions in batches.
+    The result is the same workflow table as before.
+
+`test_fullEntries`
+:   The contribution and its details are fetched in one aggregation,
+    together with a contribution that does not exist.
+    The result is the same as fetching them table by table,
+    by their foreign keys.
+
+`test_recomputeField`
+:   Fields on which the workflow depends are changed under water,
+    in the contribution, the assessment, a criteria entry, and a review,
+    and then changed back.
+    Each time, the targeted recomputation for that field gives the same
+    workflow record as a full recomputation.
+
+`test_recomputeMany`
+:   The workflow record of the contribution is deleted under water,
+    and then recomputed in bulk, together with a contribution that does not exist.
+    The result is the same workflow record as before,
+    and no record for the non-existing contribution.
+
+`test_audit`
+:   The audit finds nothing wrong.
+    Then the title in the workflow record is changed under water,
+    and the audit reports the record as stale, and repairs it.
+    Then the overview record is deleted under water,
+    and the audit reports it, and repairs it.
+    After that, the audit finds nothing wrong again.
+
+`test_overview`
+:   The overview record of the contribution is deleted under water,
+    and then refreshed, together with a contribution that does not exist.
+    The result is the same overview record as before,
+    and no record for the non-existing contribution.
+"""
+
+import pytest
+
+from bson.objectid import ObjectId
+
+import magic  # noqa
+from control.db import Db
+from control.workflow.compute import Workflow
+from control.utils import pick as G
+from example import (
+    _ID,
+    ASSESS,
+    CONTRIB,
+    CRITERIA_ENTRY,
+    EDITORS,
+    EVIDENCE,
+    EXPERT,
+    MISSING,
+    MODIFIED,
+    ORPHANED,
+    OVERVIEW_TABLE,
+    REVIEW,
+    REVIEW_ENTRY,
+    STALE,
+    TITLE,
+)
+from starters import start
+
+startInfo = {}
+
+
+@pytest.fixture(scope="module")
+def wf():
+    """A workflow object outside of any request.
+
+    Its `control.db.Db` object, `wf.db`, is shared by all tests of this module.
+    """
+
+    return Workflow(Db("development", test=True))
+
+
+def stored(db):
+    """The workflow records of all contributions, keyed by contribution id."""
+
+    contribIds = db.getIds(CONTRIB)
+    return {G(info, _ID): info for info in db.getWorkflowItems(contribIds)}
+
+
+@pytest.mark.usefixtures("db")
+def test_start(clientOffice, clientOwner, clientExpert, clientFinal):
+    startInfo.update(
+        start(
+            clientOffice=clientOffice,
+            clientOwner=clientOwner,
+            clientExpert=clientExpert,
+            clientFinal=clientFinal,
+            users=True,
+            assessment=True,
+            countries=True,
+            review=True,
+        )
+    )
+
+
+def test_syncWorkflow(wf):
+    db = wf.db
+    recordId = startInfo["recordId"]
+    contribId = G(recordId, CONTRIB)
+    assessmentId = G(recordId, ASSESS)
+
+    def getTitle():
+        return G(G(db.getWorkflowItem(contribId), ASSESS), TITLE)
+
+    db.setWorkflowFingerprint(wf.fingerprint())
+    assert wf.syncWorkflow() == 0
+
+    title = G(db.getItem(ASSESS, assessmentId), TITLE)
+    for newTitle in ("synced title", title):
+        modified = G(db.getItem(ASSESS, assessmentId), MODIFIED)
+        assert db.updateField(ASSESS, assessmentId, TITLE, newTitle, "test", modified)
+        assert getTitle() != newTitle
+        assert wf.syncWorkflow() >= 1
+        assert getTitle() == newTitle
+
+
+def test_initParallel(wf):
+    db = wf.db
+    contribIds = db.getIds(CONTRIB)
+    infos = stored(db)
+    assert infos
+
+    db.clearWorkflow()
+    assert stored(db) == {}
+    assert wf.initParallel([(eid, eid) for eid in contribIds]) == len(infos)
+    assert stored(db) == infos
+
+
+def test_initWorkflow(wf):
+    db = wf.db
+    infos = stored(db)
+    assert infos
+
+    assert wf.initWorkflow(drop=True) == len(infos)
+    assert stored(db) == infos
+
+
+def test_fullEntries(wf):
+    db = wf.db
+    recordId = startInfo["recordId"]
+    contribId = ObjectId(G(recordId, CONTRIB))
+    ghostId = ObjectId()
+
+    contribIds = {"$in": [contribId, ghostId]}
+    entries = {
+        CONTRIB: db.entries(CONTRIB, {_ID: contribIds}),
+        ASSESS: db.entries(ASSESS, {CONTRIB: contribIds}),
+        REVIEW: db.entries(REVIEW, {CONTRIB: contribIds}),
+    }
+    assessIds = {"$in": list(entries[ASSESS])}
+    for table in (CRITERIA_ENTRY, REVIEW_ENTRY):
+        entries[table] = db.entries(table, {ASSESS: assessIds})
+
+    assert entries[ASSESS] and entries[REVIEW]
+    assert entries[CRITERIA_ENTRY] and entries[REVIEW_ENTRY]
+    assert db.getFullEntries([contribId, ghostId]) == entries
+
+
+def test_recomputeField(wf):
+    db = wf.db
+    recordId = startInfo["recordId"]
+    contribId = ObjectId(G(recordId, CONTRIB))
+    assessmentId = ObjectId(G(recordId, ASSESS))
+    entryId = ObjectId(G(recordId, CRITERIA_ENTRY)[0])
+    reviewId = ObjectId(G(G(recordId, REVIEW), EXPERT))
+
+    changes = (
+        (CONTRIB, contribId, TITLE, "recomputed contribution"),
+        (CONTRIB, contribId, EDITORS, [db.creatorId]),
+        (ASSESS, assessmentId, TITLE, "recomputed assessment"),
+        (ASSESS, assessmentId, EDITORS, [db.creatorId]),
+        (CRITERIA_ENTRY, entryId, EVIDENCE, ["recomputed evidence"]),
+        (REVIEW, reviewId, TITLE, "recomputed review"),
+        (REVIEW, reviewId, EDITORS, [db.creatorId]),
+    )
+    for (table, eid, field, value) in changes:
+        original = G(db.getItem(table, eid), field)
+        for newValue in (value, original):
+            modified = G(db.getItem(table, eid), MODIFIED)
+            assert db.updateField(table, eid, field, newValue, "test", modified)
+            wf.recomputeField(contribId, table, db.getItem(table, eid), field)
+            targeted = db.getWorkflowItem(contribId)
+            wf.recompute(contribId)
+            assert db.getWorkflowItem(contribId) == targeted
+
+
+def test_recomputeMany(wf):
+    db = wf.db
+    recordId = startInfo["recordId"]
+    contribId = G(recordId, CONTRIB)
+    ghostId = ObjectId()
+
+    info = db.getWorkflowItem(contribId)
+    assert info
+    db.deleteWorkflow(contribId)
+    assert db.getWorkflowItem(contribId) == {}
+
+    assert wf.recomputeMany([contribId, ghostId]) == 1
+    assert db.getWorkflowItem(contribId) == info
+    assert db.getWorkflowItem(ghostId) == {}
+
+
+def test_audit(wf):
+    db = wf.db
+    recordId = startInfo["recordId"]
+    contribId = G(recordId, CONTRIB)
+    clean = {MISSING: [], ORPHANED: [], STALE: [], OVERVIEW_TABLE: []}
+
+    assert wf.audit() == clean
+
+    info = db.getWorkflowItem(contribId)
+    db.updateWorkflowParts(contribId, {TITLE: "drifted"})
+    assert wf.audit(repair=True) == {**clean, STALE: [contribId]}
+    assert db.getWorkflowItem(contribId) == info
+
+    records = db.getOverviewItems([contribId])
+    assert records
+    db.deleteOverviewMany([contribId])
+    assert wf.audit(repair=True) == {**clean, OVERVIEW_TABLE: [contribId]}
+    assert db.getOverviewItems([contribId]) == records
+
+    assert wf.audit() == clean
+
+
+def test_overview(wf):
+    db = wf.db
+    recordId = startInfo["recordId"]
+    contribId = G(recordId, CONTRIB)
+    ghostId = ObjectId()
+
+    def getOverview():
+        return {G(record, _ID): record for record in db.getOverview(None, False)}
+
+    record = G(getOverview(), contribId)
+    assert record
+    assert G(record, TITLE) == G(db.getItem(CONTRIB, contribId), TITLE)
+    db.deleteOverviewMany([contribId])
+    assert contribId not in getOverview()
+
+    assert wf.refreshOverview(contribIds=[contribId, ghostId]) == 1
+    overview = getOverview()
+    assert G(overview, contribId) == record
+    assert ghostId not in overview
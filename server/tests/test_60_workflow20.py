@@ -0,0 +1,200 @@
+"""Test the compiled workflow rules against the rules as they were before.
+
+## Domain
+
+*   No database.
+*   Random workflow items: random stages, fixity attributes, decisions, dates,
+    creators and reviewers, seen by a random user in a random role.
+*   Random records of the workflow tables, with random permission flags.
+
+The rules as they were, straight from the workflow item, are in `previous`.
+
+## Acts
+
+`test_readable`
+:   For every random workflow item and record, the readability of the record
+    is the same as before.
+
+`test_fixed`
+:   For every random workflow item and record, the fixity of the record
+    and of its fields is the same as before.
+    Where the rules had no attributes to go on, they gave `None` instead of `False`,
+    so we compare truth values.
+
+`test_permission`
+:   For every random workflow item, the permission of every task,
+    for every kind of review, is the same as before,
+    in the same way: only the truth values are compared.
+    Times left to revoke a decision are compared as such,
+    because the two computations do not look at the clock at the same moment.
+"""
+
+from datetime import timedelta
+from random import Random
+from types import SimpleNamespace
+
+from bson.objectid import ObjectId
+
+import magic  # noqa
+from config import Names as N
+from control.utils import pick as G, now
+from control.workflow.apply import ASSIGN_FIELDS, STAGES, TASKS, WorkflowItem
+import previous
+
+SAMPLES = 2000
+"""The number of random workflow items."""
+
+KINDS = (None, N.expert, N.final)
+
+TABLES = (N.contrib, N.assessment, N.criteriaEntry, N.review, N.reviewEntry)
+
+FIELDS = (None, N.title, *sorted(ASSIGN_FIELDS))
+
+DECISIONS = sorted({G(taskInfo, N.value) for taskInfo in TASKS.values()} - {None})
+"""The values that tasks set, which are also the random values of task fields."""
+
+REMAINING = "time left"
+"""Stands for a limited amount of time left to revoke a decision."""
+
+
+def makeWfitem(rnd):
+    """A random workflow item seen by a random user.
+
+    Parameters
+    ----------
+    rnd: object
+        A random generator.
+
+    Returns
+    -------
+    object
+        A `control.workflow.apply.WorkflowItem`.
+    """
+
+    justNow = now()
+    users = [ObjectId() for i in range(4)]
+    uid = rnd.choice(users + [None])
+    countries = [ObjectId() for i in range(2)]
+
+    def date():
+        # never close to the end of a delay, which is a whole number of hours
+        hours = rnd.randrange(0, 120)
+        return justNow - timedelta(hours=hours, minutes=30)
+
+    def flag():
+        return rnd.random() < 0.3
+
+    def attributes(**extra):
+        record = {
+            N._id: ObjectId(),
+            N.creators: rnd.sample(users, rnd.randrange(0, 3)),
+            N.stage: rnd.choice(STAGES),
+            N.stageDate: date() if rnd.random() < 0.8 else None,
+            N.frozen: flag(),
+            N.done: flag(),
+            N.locked: flag(),
+        }
+        record.update(extra)
+        return record
+
+    def review(kind):
+        # the rules compare the dates of both reviews with that of the assessment
+        return attributes(
+            kind=kind, stageDate=date(), decision=rnd.choice(DECISIONS + [None])
+        )
+
+    assessment = attributes(
+        submitted=rnd.choice(DECISIONS + [True, False, None]),
+        mayAdd={N.expert: flag(), N.final: flag()},
+        reviewer={N.expert: rnd.choice(users), N.final: rnd.choice(users)},
+        reviews={N.expert: review(N.expert), N.final: review(N.final)},
+    )
+    assessment[N.creators] = rnd.sample(users, rnd.randrange(1, 3))
+
+    data = attributes(
+        country=rnd.choice(countries),
+        selected=rnd.choice(DECISIONS + [None]),
+        mayAdd=flag(),
+        assessment=assessment,
+    )
+
+    coordCountry = rnd.choice(countries + [None])
+    (superuser, officeuser, sysadmin) = (flag(), flag(), flag())
+    auth = SimpleNamespace(
+        user={N._id: uid, N.eppn: "random"},
+        superuser=lambda: superuser,
+        officeuser=lambda: officeuser,
+        sysadmin=lambda: sysadmin,
+        coordinator=lambda countryId=None: countryId == coordCountry,
+    )
+    db = SimpleNamespace(decisionInv={decision: decision for decision in DECISIONS})
+    return WorkflowItem(SimpleNamespace(db=db, auth=auth), data)
+
+
+def makeRecord(rnd):
+    """A random record of a workflow table with random permission flags."""
+
+    table = rnd.choice(TABLES)
+    kind = rnd.choice(KINDS) if table in {N.review, N.reviewEntry} else None
+    perm = {att: rnd.random() < 0.5 for att in (N.isOur, N.isEdit, N.isReviewer)}
+    return SimpleNamespace(table=table, kind=kind, perm=perm)
+
+
+def truth(outcome):
+    """The readability of a record, as far as it matters to the app.
+
+    `None` means that the workflow has no say, which is not the same as `False`.
+    """
+
+    return None if outcome is None else bool(outcome)
+
+
+def permitted(outcome):
+    """The permission of a task, as far as it matters to the app.
+
+    A permission may be a remark or a time left, otherwise only its truth counts.
+    """
+
+    return (
+        REMAINING
+        if type(outcome) is timedelta
+        else outcome
+        if type(outcome) is str
+        else bool(outcome)
+    )
+
+
+def samples(seed):
+    """Random workflow items, with the random generator that made them."""
+
+    rnd = Random(seed)
+    for i in range(SAMPLES):
+        yield (rnd, makeWfitem(rnd))
+
+
+def test_readable():
+    for (rnd, wfitem) in samples(1):
+        for i in range(5):
+            recordObj = makeRecord(rnd)
+            assert truth(wfitem.checkReadable(recordObj)) == truth(
+                previous.checkReadable(wfitem, recordObj)
+            )
+
+
+def test_fixed():
+    for (rnd, wfitem) in samples(2):
+        for i in range(5):
+            recordObj = makeRecord(rnd)
+            for field in FIELDS:
+                assert bool(wfitem.checkFixed(recordObj, field=field)) == bool(
+                    previous.checkFixed(wfitem, recordObj, field=field)
+                )
+
+
+def test_permission():
+    for (rnd, wfitem) in samples(3):
+        for task in TASKS:
+            for kind in KINDS:
+                assert permitted(wfitem.permission(task, kind=kind)) == permitted(
+                    previous.permission(wfitem, task, kind=kind)
+                )
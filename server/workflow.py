@@ -1,5 +1,8 @@
 import sys
 
+from bson.objectid import ObjectId
+
+from config import Names as N
 from control.db import Db
 from control.workflow.compute import Workflow
 from control.utils import serverprint, E
@@ -14,10 +17,64 @@ def computeWorkflow(regime, test):
     serverprint(f"WORKFLOW RESET for {mode}")
     DB = Db(regime, test)
     WF = Workflow(DB)
-    WF.initWorkflow(drop=True)
+    WF.initWorkflow(drop=True, parallel=True)
+    return 0
+
+
+def recomputeWorkflow(regime, test, idsFile):
+    """Recompute the workflow of the contributions listed in a file.
+
+    The file is written by bulk operations such as `import/bulk.py`,
+    with the id of an affected contribution on each line.
+    """
+
+    if not regime:
+        serverprint("Don't know if this is development or production")
+        return 1
+
+    with open(idsFile) as fh:
+        contribIds = [ObjectId(line.strip()) for line in fh if line.strip()]
+
+    mode = f"""regime = {regime} {"test" if test else E}"""
+    serverprint(f"WORKFLOW RECOMPUTE of {len(contribIds)} contributions for {mode}")
+    DB = Db(regime, test)
+    WF = Workflow(DB)
+    nWf = WF.recomputeMany(contribIds)
+    DB.setWorkflowFingerprint(WF.fingerprint())
+    serverprint(f"WORKFLOW RECOMPUTE stored {nWf} workflow records")
+    return 0
+
+
+def auditWorkflow(regime, test, repair):
+    """Check the workflow and overview tables against a fresh computation.
+
+    If asked, the faulty records are repaired.
+
+    This can run while the webserver runs: the audit pauses after each batch.
+    """
+
+    if not regime:
+        serverprint("Don't know if this is development or production")
+        return 1
+
+    mode = f"""regime = {regime} {"test" if test else E}"""
+    serverprint(f"""WORKFLOW {"REPAIR" if repair else "AUDIT"} for {mode}""")
+    DB = Db(regime, test)
+    WF = Workflow(DB)
+    faults = WF.audit(repair=repair)
+    for (kind, contribIds) in faults.items():
+        what = "faulty overview" if kind == N.overview else f"{kind} workflow"
+        serverprint(f"WORKFLOW AUDIT: {len(contribIds)} {what} records")
     return 0
 
 
 regime = sys.argv[1] if len(sys.argv) > 1 else None
 test = sys.argv[2] == "test" if len(sys.argv) > 2 else False
-sys.exit(computeWorkflow(regime, test))
+task = sys.argv[3] if len(sys.argv) > 3 else None
+sys.exit(
+    computeWorkflow(regime, test)
+    if task is None
+    else auditWorkflow(regime, test, task == "repair")
+    if task in {"audit", "repair"}
+    else recomputeWorkflow(regime, test, task)
+)